@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the MCP server
+
+Measures, each in a fresh interpreter:
+- cold start: importing the server module and running create_n8n_server()
+- list_tools latency
+- first-call latency of a few tools (importing their handler on demand)
+- second-call latency of the same tools (handler already loaded)
+- the cost of loading every handler and component eagerly, for comparison
+
+No n8n instance is needed: the benchmarked tools never reach the network.
+
+Usage:
+    python3 scripts/debug/startup_benchmark.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Runs inside a fresh interpreter and prints one JSON line of timings (ms)
+PROBE = r'''
+import asyncio, json, os, sys, time
+
+t0 = time.perf_counter()
+from n8n_workflow_builder import server as server_module
+t1 = time.perf_counter()
+server = server_module.create_n8n_server(os.environ["N8N_API_URL"], os.environ["N8N_API_KEY"])
+t2 = time.perf_counter()
+
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+CALLS = [
+    ("get_session_state", {}),
+    ("validate_workflow_json", {"workflow": {"name": "bench", "nodes": [], "connections": {}}}),
+    ("explain_node", {"node_type": "webhook"}),
+]
+
+async def run():
+    timings = {}
+    start = time.perf_counter()
+    await server.request_handlers[ListToolsRequest](ListToolsRequest(method="tools/list"))
+    timings["list_tools"] = time.perf_counter() - start
+
+    call = server.request_handlers[CallToolRequest]
+    for name, arguments in CALLS:
+        for label in ("first", "second"):
+            start = time.perf_counter()
+            await call(CallToolRequest(
+                method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+            ))
+            timings[f"{label}_call:{name}"] = time.perf_counter() - start
+
+    if "--eager" in sys.argv:
+        start = time.perf_counter()
+        registry = server.registry
+        for tool_name in registry.tool_names():
+            registry.handler_for(tool_name)
+        for field_name in server.deps.__dataclass_fields__:
+            getattr(server.deps, field_name)
+        timings["load_everything"] = time.perf_counter() - start
+
+    await server.deps.close()
+    return timings
+
+timings = {"import": t1 - t0, "create_server": t2 - t1, "cold_start": t2 - t0}
+timings.update(asyncio.run(run()))
+print(json.dumps({k: v * 1000 for k, v in timings.items()}))
+'''
+
+
+def run_probe(eager: bool) -> dict:
+    env = {
+        **os.environ,
+        "PYTHONPATH": f"{SRC}{os.pathsep}{os.environ.get('PYTHONPATH', '')}",
+        "N8N_API_URL": os.environ.get("N8N_API_URL", "http://localhost:5678"),
+        "N8N_API_KEY": os.environ.get("N8N_API_KEY", "benchmark"),
+    }
+    args = [sys.executable, "-c", PROBE] + (["--eager"] if eager else [])
+    output = subprocess.run(args, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (default: 5)")
+    args = parser.parse_args()
+
+    samples = [run_probe(eager=False) for _ in range(args.runs)]
+    eager = [run_probe(eager=True) for _ in range(args.runs)]
+
+    print("=" * 80)
+    print(f"⏱️  Startup Benchmark (median of {args.runs} fresh processes, ms)")
+    print("=" * 80)
+    for key in samples[0]:
+        print(f"{key:<50} {statistics.median(s[key] for s in samples):>10.1f}")
+    print("-" * 80)
+    print(f"{'load_everything (all handlers + components)':<50} "
+          f"{statistics.median(s['load_everything'] for s in eager):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
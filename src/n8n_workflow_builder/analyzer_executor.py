@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Analyzer Executor Module
+Runs synchronous, CPU-bound analyzers off the asyncio event loop in a thread or process pool
+"""
+import asyncio
+import functools
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from .deadlines import current_deadline, run_with_deadline
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Name of the tool whose handler is running, set by the tool registry
+current_tool: ContextVar[Optional[str]] = ContextVar("current_tool", default=None)
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+
+class AnalyzerTimeoutError(Exception):
+    """Raised when an analyzer does not finish within its deadline"""
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        super().__init__(f"Analysis '{name}' did not finish within {timeout:g}s")
+
+
+@dataclass
+class AnalyzerExecutorConfig:
+    """Pool type, size, concurrency cap and deadlines for analyzer work"""
+    mode: str = "thread"                 # thread | process | inline
+    max_workers: int = 4
+    max_concurrent: int = 4              # analyses running at once; others wait
+    default_timeout: float = 60.0        # seconds; 0 disables the deadline
+    # Per-tool deadlines, e.g. {"audit_workflow_security": 30}
+    tool_timeouts: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls) -> 'AnalyzerExecutorConfig':
+        """Build config from N8N_ANALYZER_* environment variables
+
+        N8N_ANALYZER_TIMEOUTS takes comma-separated ``tool=seconds`` pairs.
+        """
+        def env(name, cast, default):
+            value = os.getenv(name)
+            try:
+                return cast(value) if value else default
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+                return default
+
+        mode = os.getenv("N8N_ANALYZER_EXECUTOR", cls.mode).lower()
+        if mode not in EXECUTOR_MODES:
+            logger.warning(f"Unknown N8N_ANALYZER_EXECUTOR={mode!r}, using {cls.mode}")
+            mode = cls.mode
+
+        tool_timeouts = {}
+        for entry in os.getenv("N8N_ANALYZER_TIMEOUTS", "").split(","):
+            tool, _, seconds = entry.strip().partition("=")
+            try:
+                if tool and seconds:
+                    tool_timeouts[tool] = float(seconds)
+            except ValueError:
+                logger.warning(f"Ignoring invalid N8N_ANALYZER_TIMEOUTS entry {entry!r}")
+
+        max_workers = env("N8N_ANALYZER_WORKERS", int, min(cls.max_workers, os.cpu_count() or 1))
+        return cls(
+            mode=mode,
+            max_workers=max_workers,
+            max_concurrent=env("N8N_ANALYZER_MAX_CONCURRENT", int, max_workers),
+            default_timeout=env("N8N_ANALYZER_TIMEOUT", float, cls.default_timeout),
+            tool_timeouts=tool_timeouts,
+        )
+
+
+class AnalyzerExecutor:
+    """Runs analyzer callables in a worker pool with a concurrency cap and deadlines
+
+    In process mode the callable and its arguments are pickled, so pass
+    module-level functions, static methods or bound methods of picklable
+    analyzers together with plain data (workflow and execution dicts).
+    Callables that cannot be pickled fall back to the thread pool.
+
+    A deadline stops the caller from waiting; a worker thread that is
+    already running finishes in the background (threads cannot be killed).
+    The tool call's deadline (see deadlines.py) is carried into the worker so
+    analyzer loops that check it stop early and return partial results.
+    """
+
+    def __init__(self, config: Optional[AnalyzerExecutorConfig] = None):
+        self.config = config or AnalyzerExecutorConfig.from_env()
+        self._pools: Dict[str, Executor] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._picklable: Dict[Any, bool] = {}
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "timed_out": 0, "queued": 0}
+        self.max_wait_seconds = 0.0
+
+    def _pool(self, mode: str) -> Executor:
+        pool = self._pools.get(mode)
+        if pool is None:
+            if mode == "process":
+                pool = ProcessPoolExecutor(max_workers=self.config.max_workers)
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers, thread_name_prefix="n8n-analyzer"
+                )
+            self._pools[mode] = pool
+        return pool
+
+    def _mode_for(self, func: Callable) -> str:
+        mode = self.config.mode
+        if mode != "process":
+            return mode
+        key = getattr(func, "__qualname__", None) or id(func)
+        picklable = self._picklable.get(key)
+        if picklable is None:
+            try:
+                pickle.dumps(func)
+                picklable = True
+            except Exception:
+                logger.warning(f"{key} cannot be pickled - running it in the thread pool")
+                picklable = False
+            self._picklable[key] = picklable
+        return "process" if picklable else "thread"
+
+    def timeout_for(self, tool: Optional[str]) -> Optional[float]:
+        """Deadline in seconds for analyzer work done on behalf of a tool"""
+        timeout = self.config.tool_timeouts.get(tool, self.config.default_timeout)
+        return timeout if timeout and timeout > 0 else None
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` off the event loop
+
+        Args:
+            func: Synchronous analyzer callable
+            timeout: Deadline in seconds (defaults to the current tool's deadline)
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            AnalyzerTimeoutError: If the deadline passes first
+        """
+        name = getattr(func, "__qualname__", repr(func))
+        mode = self._mode_for(func)
+        if mode == "inline":
+            return func(*args, **kwargs)
+
+        if timeout is None:
+            timeout = self.timeout_for(current_tool.get())
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent))
+
+        self.stats["submitted"] += 1
+        queued_at = time.monotonic()
+        if self._semaphore.locked():
+            self.stats["queued"] += 1
+
+        try:
+            async with asyncio.timeout(timeout):
+                async with self._semaphore:
+                    self.max_wait_seconds = max(self.max_wait_seconds, time.monotonic() - queued_at)
+                    loop = asyncio.get_running_loop()
+                    call = functools.partial(func, *args, **kwargs)
+                    if mode == "thread":
+                        # Carry context (current tool, tracing span, deadline) into the worker
+                        call = functools.partial(copy_context().run, call)
+                    else:
+                        call = functools.partial(run_with_deadline, current_deadline(), call)
+                    result = await loop.run_in_executor(self._pool(mode), call)
+        except TimeoutError:
+            self.stats["timed_out"] += 1
+            logger.warning(f"Analyzer {name} exceeded its {timeout:g}s deadline")
+            raise AnalyzerTimeoutError(name, timeout)
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+        self.stats["completed"] += 1
+        return result
+
+    def get_stats(self) -> Dict:
+        """Submitted/completed/failed/timed-out counters and pool settings"""
+        return {
+            **self.stats,
+            "mode": self.config.mode,
+            "max_workers": self.config.max_workers,
+            "max_concurrent": self.config.max_concurrent,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pools without waiting for running analyses"""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
@@ -4,14 +4,30 @@ Approval Workflow - Manage change approvals
 Features:
 - Create change requests
 - Approve/reject changes
-- Track change history
+- Track change history (persisted in SQLite, survives restarts)
 - Auto-rollback on failure
 """
 
 from typing import Dict, List, Optional
 from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import os
+import sqlite3
+import threading
 import uuid
 
+from ..storage import connect_sqlite
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Columns of the change_requests table, in ChangeRequest.to_dict() order
+COLUMNS = (
+    "id", "workflow_id", "workflow_name", "changes", "reason", "requester", "status",
+    "reviewer", "review_comments", "created_at", "reviewed_at", "applied_at",
+)
+
 
 class ChangeRequest:
     """Represents a workflow change request"""
@@ -48,11 +64,94 @@ class ChangeRequest:
 
 
 class ApprovalWorkflow:
-    """Manages workflow change approvals"""
-
-    def __init__(self):
-        self.requests = {}  # change_request_id -> ChangeRequest
-        self.history = []  # List of all change requests
+    """Manages workflow change approvals
+
+    Change requests are stored in SQLite (WAL mode) with indexes on workflow
+    ID, status and creation time, so history and pending queries read one
+    index range and can be paged with ``limit``/``offset``.
+
+    Args:
+        db_path: SQLite database (defaults to N8N_CHANGE_REQUESTS_DB or
+            ~/.n8n_workflow_builder/change_requests.db; ":memory:" keeps
+            requests for the lifetime of the object only)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.getenv("N8N_CHANGE_REQUESTS_DB")
+        if db_path is None:
+            cache_dir = Path.home() / ".n8n_workflow_builder"
+            cache_dir.mkdir(exist_ok=True)
+            db_path = cache_dir / "change_requests.db"
+
+        self.db_path = str(Path(db_path).expanduser())
+        self._lock = threading.Lock()
+        self.conn = connect_sqlite(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        """Initialize database schema"""
+        with self._lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS change_requests (
+                    id TEXT PRIMARY KEY,
+                    workflow_id TEXT NOT NULL,
+                    workflow_name TEXT,
+                    changes TEXT,
+                    reason TEXT,
+                    requester TEXT,
+                    status TEXT NOT NULL,
+                    reviewer TEXT,
+                    review_comments TEXT,
+                    created_at TEXT NOT NULL,
+                    reviewed_at TEXT,
+                    applied_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_change_requests_workflow
+                    ON change_requests(workflow_id, created_at);
+                CREATE INDEX IF NOT EXISTS idx_change_requests_status
+                    ON change_requests(status, created_at);
+                CREATE INDEX IF NOT EXISTS idx_change_requests_created
+                    ON change_requests(created_at);
+            """)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict:
+        data = dict(row)
+        data["changes"] = json.loads(data["changes"]) if data["changes"] else data["changes"]
+        return data
+
+    def _select(self, where: str, params: tuple, order: str = "created_at, rowid",
+                limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        query = f"SELECT {', '.join(COLUMNS)} FROM change_requests WHERE {where} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = (*params, limit, offset)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def _update(self, request_id: str, changes: Dict, pending_only: bool = False) -> Dict:
+        """Update one request; with ``pending_only`` the update only wins while it is pending"""
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        query = f"UPDATE change_requests SET {assignments} WHERE id = ?"
+        if pending_only:
+            query += " AND status = 'pending'"
+        with self._lock, self.conn:
+            updated = self.conn.execute(query, (*changes.values(), request_id)).rowcount
+
+        request = self.get_request(request_id)
+        if request is None:
+            return {"success": False, "error": "Request not found"}
+        if not updated:
+            return {"success": False, "error": f"Request is already {request['status']}"}
+        return {"success": True, "request": request}
 
     def create_request(
         self,
@@ -64,75 +163,74 @@ class ApprovalWorkflow:
     ) -> ChangeRequest:
         """Create a new change request"""
         request = ChangeRequest(workflow_id, workflow_name, changes, reason, requester)
-        self.requests[request.id] = request
-        self.history.append(request)
+        row = request.to_dict()
+        row["changes"] = json.dumps(changes, default=str)
+        with self._lock, self.conn:
+            self.conn.execute(
+                f"INSERT INTO change_requests ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})",
+                tuple(row[column] for column in COLUMNS),
+            )
         return request
 
     def approve_request(self, request_id: str, reviewer: str, comments: Optional[str] = None) -> Dict:
         """Approve a change request"""
-        if request_id not in self.requests:
-            return {"success": False, "error": "Request not found"}
-
-        request = self.requests[request_id]
-
-        if request.status != "pending":
-            return {"success": False, "error": f"Request is already {request.status}"}
-
-        request.status = "approved"
-        request.reviewer = reviewer
-        request.review_comments = comments
-        request.reviewed_at = datetime.now().isoformat()
-
-        return {"success": True, "request": request.to_dict()}
+        return self._update(request_id, {
+            "status": "approved",
+            "reviewer": reviewer,
+            "review_comments": comments,
+            "reviewed_at": datetime.now().isoformat(),
+        }, pending_only=True)
 
     def reject_request(self, request_id: str, reviewer: str, reason: str) -> Dict:
         """Reject a change request"""
-        if request_id not in self.requests:
-            return {"success": False, "error": "Request not found"}
-
-        request = self.requests[request_id]
-
-        if request.status != "pending":
-            return {"success": False, "error": f"Request is already {request.status}"}
-
-        request.status = "rejected"
-        request.reviewer = reviewer
-        request.review_comments = reason
-        request.reviewed_at = datetime.now().isoformat()
-
-        return {"success": True, "request": request.to_dict()}
+        return self._update(request_id, {
+            "status": "rejected",
+            "reviewer": reviewer,
+            "review_comments": reason,
+            "reviewed_at": datetime.now().isoformat(),
+        }, pending_only=True)
 
     def mark_applied(self, request_id: str) -> Dict:
         """Mark request as successfully applied"""
-        if request_id not in self.requests:
-            return {"success": False, "error": "Request not found"}
-
-        request = self.requests[request_id]
-        request.status = "applied"
-        request.applied_at = datetime.now().isoformat()
-
-        return {"success": True, "request": request.to_dict()}
+        return self._update(request_id, {"status": "applied", "applied_at": datetime.now().isoformat()})
 
     def mark_failed(self, request_id: str, error: str) -> Dict:
         """Mark request as failed during application"""
-        if request_id not in self.requests:
+        request = self.get_request(request_id)
+        if request is None:
             return {"success": False, "error": "Request not found"}
 
-        request = self.requests[request_id]
-        request.status = "failed"
-        request.review_comments = f"{request.review_comments or ''}\nApplication error: {error}"
-
-        return {"success": True, "request": request.to_dict()}
+        return self._update(request_id, {
+            "status": "failed",
+            "review_comments": f"{request['review_comments'] or ''}\nApplication error: {error}",
+        })
 
-    def get_pending_requests(self) -> List[Dict]:
-        """Get all pending change requests"""
-        return [r.to_dict() for r in self.requests.values() if r.status == "pending"]
+    def get_pending_requests(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Get pending change requests, oldest first"""
+        return self._select("status = 'pending'", (), limit=limit, offset=offset)
 
     def get_request(self, request_id: str) -> Optional[Dict]:
         """Get a specific change request"""
-        request = self.requests.get(request_id)
-        return request.to_dict() if request else None
+        requests = self._select("id = ?", (request_id,))
+        return requests[0] if requests else None
 
-    def get_workflow_history(self, workflow_id: str) -> List[Dict]:
-        """Get change history for a workflow"""
-        return [r.to_dict() for r in self.history if r.workflow_id == workflow_id]
+    def get_workflow_history(
+        self,
+        workflow_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        newest_first: bool = False,
+    ) -> List[Dict]:
+        """Get change history for a workflow (oldest first unless ``newest_first``)"""
+        order = "created_at DESC, rowid DESC" if newest_first else "created_at, rowid"
+        return self._select("workflow_id = ?", (workflow_id,), order=order, limit=limit, offset=offset)
+
+    def get_status_counts(self, workflow_id: str) -> Dict[str, int]:
+        """Number of change requests per status for a workflow"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) FROM change_requests WHERE workflow_id = ? "
+                "GROUP BY status ORDER BY MIN(created_at)",
+                (workflow_id,),
+            ).fetchall()
+        return {status: count for status, count in rows}
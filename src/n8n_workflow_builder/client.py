@@ -3,12 +3,23 @@
 N8n Client Module
 HTTP client for n8n API interactions
 """
+import asyncio
+import copy
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
 import httpx
 
+from .execution.payload_stream import RunDataPruner
+from .http_pool import SharedHTTPPool, get_http_pool
+from .metrics import MetricsTransport, RequestMetrics
+from .resilience import ResilienceConfig, ResilientTransport
+from .tracing import get_tracer
+from .workflow_cache import WorkflowCache
+
 logger = logging.getLogger("n8n-workflow-builder")
 
 # n8n API only accepts these settings keys on PUT /workflows/:id
@@ -19,49 +30,255 @@ ALLOWED_SETTINGS_KEYS = {
     "saveManualExecutions", "saveExecutionProgress"
 }
 
+# n8n caps the `limit` query parameter of paginated list endpoints at 250
+MAX_PAGE_SIZE = 250
+DEFAULT_PAGE_SIZE = 100
+
+# Parallel GET /workflows/:id requests issued by get_workflows_bulk
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+def _parse_timestamp(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Parse an n8n ISO timestamp (or datetime) into an aware datetime"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
 
 class N8nClient:
     """Client for n8n API"""
     
-    def __init__(self, api_url: str, api_key: str):
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        http_pool: Optional[SharedHTTPPool] = None,
+        workflow_cache: Optional[WorkflowCache] = None,
+        resilience: Optional[ResilienceConfig] = None,
+    ):
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
         self.headers = {"X-N8N-API-KEY": api_key, "Content-Type": "application/json"}
+        # Auth headers are client defaults; sockets come from the shared pool,
+        # with rate limiting, retries and circuit breaking layered on top.
+        # Metrics sit below the retry layer so every attempt is accounted for.
+        pool = http_pool or get_http_pool()
+        self.metrics = RequestMetrics()
+        self.resilience = ResilientTransport(MetricsTransport(pool.borrow(), self.metrics, get_tracer()), resilience)
+        self.client = pool.client(headers=self.headers, transport=self.resilience)
+        # Full workflow objects, invalidated by every write through this client
+        self.workflow_cache = workflow_cache or WorkflowCache.from_env()
+        # Execution endpoint -> supported by this n8n instance (probed on first use)
+        self.execution_capabilities: Dict[str, bool] = {}
+        # Identical GETs in flight share one request (single-flight)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.coalesced_requests = 0
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """GET an API path, coalescing identical concurrent requests
+
+        While a GET for the same URL and params is in flight, later callers
+        await the same response instead of issuing their own request. Each
+        caller decodes the body itself, so nobody shares mutable JSON.
+        """
+        url = f"{self.api_url}{path}"
+        key = (url, tuple(sorted((params or {}).items())))
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.client.get(url, params=params))
+            self._inflight[key] = future
+
+            def _release(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                # Mark the exception retrieved even if every waiter was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            future.add_done_callback(_release)
+        else:
+            self.coalesced_requests += 1
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
     
-    async def get_workflows(self, active_only: bool = False) -> List[Dict]:
-        """Get all workflows"""
-        params = {}
+    async def _iter_pages(
+        self, path: str, params: Dict[str, Any], cursor: Optional[str] = None
+    ) -> AsyncIterator[Tuple[List[Dict], Optional[str]]]:
+        """Follow n8n's cursor pagination for a list endpoint
+
+        Yields one ``(items, next_cursor)`` tuple per page so only a single page
+        is held in memory at a time. ``next_cursor`` is None on the last page.
+        """
+        while True:
+            page_params = dict(params)
+            if cursor:
+                page_params["cursor"] = cursor
+
+            response = await self._get(path, params=page_params)
+            response.raise_for_status()
+            body = response.json()
+
+            cursor = body.get("nextCursor")
+            yield body.get("data", []), cursor
+
+            if not cursor:
+                return
+
+    async def iter_workflows(
+        self,
+        active_only: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        updated_since: Union[str, datetime, None] = None,
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """Stream workflows page by page, following n8n's nextCursor
+
+        Args:
+            active_only: Only yield active workflows
+            page_size: Workflows requested per page (capped at 250 by n8n)
+            updated_since: Skip workflows last updated before this timestamp
+            tags: Only yield workflows carrying all of these tags
+            limit: Stop after yielding this many workflows
+            cursor: Resume from a cursor returned by a previous listing
+
+        Yields:
+            Workflow summaries in the order n8n returns them
+        """
+        since = _parse_timestamp(updated_since)
+
+        yielded = 0
+        async for page, _ in self.iter_workflow_pages(active_only, page_size, tags, cursor):
+            for workflow in page:
+                if since is not None:
+                    updated_at = _parse_timestamp(workflow.get("updatedAt"))
+                    if updated_at is not None and updated_at < since:
+                        continue
+                yield workflow
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+    async def iter_workflow_pages(
+        self,
+        active_only: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        tags: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[Dict], Optional[str]]]:
+        """Stream raw workflow listing pages with n8n's cursor for the next page
+
+        Lets callers that paginate their own output resume exactly where they
+        stopped instead of re-listing from the start.
+
+        Yields:
+            ``(workflows, next_cursor)`` per page; ``next_cursor`` is None on the last page
+        """
+        params: Dict[str, Any] = {"limit": max(1, min(page_size, MAX_PAGE_SIZE))}
         if active_only:
             params["active"] = "true"
-        
-        response = await self.client.get(
-            f"{self.api_url}/api/v1/workflows",
-            headers=self.headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()["data"]
+        if tags:
+            params["tags"] = ",".join(tags)
+
+        async for page, next_cursor in self._iter_pages("/api/v1/workflows", params, cursor):
+            for workflow in page:
+                # Listings reveal newer versions of cached workflows
+                self.workflow_cache.observe(workflow.get("id"), workflow.get("updatedAt"))
+            yield page, next_cursor
+
+    async def get_workflows(self, active_only: bool = False) -> List[Dict]:
+        """Get all workflows (follows pagination across every page)"""
+        return [workflow async for workflow in self.iter_workflows(active_only=active_only)]
 
     async def list_workflows(self, active_only: bool = False) -> List[Dict]:
         """Alias for get_workflows - used by change simulation"""
         return await self.get_workflows(active_only)
 
-    async def get_workflow(self, workflow_id: str) -> Dict:
-        """Get a specific workflow"""
-        response = await self.client.get(
-            f"{self.api_url}/api/v1/workflows/{workflow_id}",
-            headers=self.headers
-        )
+    async def get_workflow(self, workflow_id: str, use_cache: bool = True) -> Dict:
+        """Get a specific workflow
+
+        Args:
+            workflow_id: ID of the workflow
+            use_cache: Serve from the session workflow cache when fresh
+
+        Returns:
+            Full workflow data
+        """
+        if use_cache:
+            cached = self.workflow_cache.get(workflow_id)
+            if cached is not None:
+                return cached
+
+        response = await self._get(f"/api/v1/workflows/{workflow_id}")
         response.raise_for_status()
-        return response.json()
+        workflow = response.json()
+        self.workflow_cache.put(workflow)
+        return workflow
     
+    async def get_workflows_bulk(
+        self, workflow_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncIterator[Tuple[str, Optional[Dict], Optional[Exception]]]:
+        """Fetch many workflows concurrently, yielding each as soon as it arrives
+
+        A fixed pool of ``concurrency`` workers pulls IDs and hands results over
+        a bounded queue, so at most ``concurrency`` requests are in flight and
+        only a few finished workflows wait for the consumer, however many IDs
+        are passed. Results come in completion order; callers that need stable
+        output sort them. A failing fetch does not abort the batch; its
+        exception is returned in place of the workflow instead.
+
+        Args:
+            workflow_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Maximum number of parallel requests
+
+        Yields:
+            ``(workflow_id, workflow, error)`` tuples in completion order, where
+            exactly one of ``workflow`` and ``error`` is set
+        """
+        workers = max(1, concurrency)
+        pending_ids = iter(dict.fromkeys(workflow_ids))
+        results: asyncio.Queue = asyncio.Queue(maxsize=workers)
+
+        async def worker() -> None:
+            for workflow_id in pending_ids:
+                try:
+                    result = (workflow_id, await self.get_workflow(workflow_id), None)
+                except Exception as e:
+                    result = (workflow_id, None, e)
+                await results.put(result)
+            await results.put(None)  # this worker is done
+
+        tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        try:
+            running = len(tasks)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                else:
+                    yield result
+        finally:
+            # Consumer stopped early - don't leave fetches running in the background
+            for task in tasks:
+                task.cancel()
+
     async def create_workflow(self, workflow: Dict) -> Dict:
         """Create a new workflow"""
         try:
             response = await self.client.post(
                 f"{self.api_url}/api/v1/workflows",
-                headers=self.headers,
                 json=workflow
             )
             response.raise_for_status()
@@ -85,43 +302,30 @@ class N8nClient:
         2. Activate the workflow if it's inactive
         3. Try to trigger via production endpoint (webhook/manual trigger)
         4. Fall back to helpful error message if execution is not possible via API
+
+        Which execution endpoints the connected n8n version supports is probed
+        on first use and remembered, so later runs skip endpoints that 405 or
+        404 for a workflow that still exists.
         """
         try:
-            # First, verify the workflow exists
+            # First, verify the workflow exists (served from cache when already fetched)
             workflow = await self.get_workflow(workflow_id)
 
             # Check if workflow is active, activate if needed
             if not workflow.get("active", False):
                 logger.info(f"Workflow {workflow_id} is inactive. Activating...")
-                await self.update_workflow(workflow_id, {"active": True})
-
-            # Strategy 1: Try POST to /execute endpoint (current n8n API)
-            try:
-                response = await self.client.post(
-                    f"{self.api_url}/api/v1/workflows/{workflow_id}/execute",
-                    headers=self.headers,
-                    json=data or {}
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                # 404 = endpoint doesn't exist, 405 = method not allowed (try next strategy)
-                if e.response.status_code not in [404, 405]:
-                    raise
-
-            # Strategy 2: Try POST to /test endpoint (older versions)
-            try:
-                response = await self.client.post(
-                    f"{self.api_url}/api/v1/workflows/{workflow_id}/test",
-                    headers=self.headers,
-                    json=data or {}
+                try:
+                    workflow = await self.activate_workflow(workflow_id)
+                except Exception as e:
+                    logger.warning(f"Could not activate workflow {workflow_id}: {e}")
+
+            # Strategy 1: POST /execute (current n8n API), Strategy 2: POST /test (older versions)
+            for strategy in ("execute", "test"):
+                result = await self._try_execution_endpoint(
+                    strategy, f"/api/v1/workflows/{workflow_id}/{strategy}", data or {}, workflow_id
                 )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                # 404 = endpoint doesn't exist, 405 = method not allowed (try next strategy)
-                if e.response.status_code not in [404, 405]:
-                    raise
+                if result is not None:
+                    return result
 
             # Strategy 3: Check if workflow has a webhook trigger and provide URL
             webhook_url = self._find_webhook_url(workflow)
@@ -139,16 +343,12 @@ class N8nClient:
             if has_manual_trigger:
                 # For manual trigger workflows, we need to use the executions endpoint
                 try:
-                    response = await self.client.post(
-                        f"{self.api_url}/api/v1/executions",
-                        headers=self.headers,
-                        json={
-                            "workflowId": workflow_id,
-                            "data": data or {}
-                        }
+                    result = await self._try_execution_endpoint(
+                        "executions", "/api/v1/executions",
+                        {"workflowId": workflow_id, "data": data or {}}, workflow_id
                     )
-                    response.raise_for_status()
-                    return response.json()
+                    if result is not None:
+                        return result
                 except httpx.HTTPStatusError:
                     pass
 
@@ -171,6 +371,39 @@ class N8nClient:
             logger.error(f"Error executing workflow {workflow_id}: {e}")
             raise Exception(f"Failed to execute workflow: {str(e)}")
 
+    async def _try_execution_endpoint(
+        self, strategy: str, path: str, payload: Dict, workflow_id: str
+    ) -> Optional[Dict]:
+        """POST to an execution endpoint unless it is known to be unsupported
+
+        A 404 means either the route or the workflow is missing, so it is only
+        remembered as unsupported once a fresh GET shows the workflow exists.
+
+        Returns:
+            Response JSON, or None if this n8n version lacks the endpoint (404/405)
+
+        Raises:
+            httpx.HTTPStatusError: 404 from the GET if the workflow was deleted
+        """
+        if self.execution_capabilities.get(strategy) is False:
+            return None
+
+        try:
+            response = await self.client.post(f"{self.api_url}{path}", json=payload)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # 404 = endpoint or workflow doesn't exist, 405 = method not allowed
+            if e.response.status_code == 404:
+                self.workflow_cache.invalidate(workflow_id)
+                await self.get_workflow(workflow_id, use_cache=False)
+            if e.response.status_code in [404, 405]:
+                self.execution_capabilities[strategy] = False
+                return None
+            raise
+
+        self.execution_capabilities[strategy] = True
+        return response.json()
+
     def _find_webhook_url(self, workflow: Dict) -> Optional[str]:
         """Find webhook URL if workflow has webhook trigger"""
         nodes = workflow.get("nodes", [])
@@ -210,19 +443,86 @@ class N8nClient:
             return ", ".join(triggers)
         return "Unknown"
     
-    async def get_executions(self, workflow_id: Optional[str] = None, limit: int = 10) -> List[Dict]:
-        """Get workflow executions (summary only, without full node data)"""
-        params = {"limit": limit}
+    async def iter_executions(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        started_after: Union[str, datetime, None] = None,
+        started_before: Union[str, datetime, None] = None,
+        limit: Optional[int] = None,
+        include_data: bool = False,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """Stream executions page by page, newest first, following n8n's nextCursor
+
+        n8n has no server-side date filter, so the time window is applied here.
+        Because executions come back newest first, iteration stops as soon as an
+        execution older than ``started_after`` is seen.
+
+        Args:
+            workflow_id: Only yield executions of this workflow
+            status: n8n status filter ("success", "error", "waiting", ...)
+            page_size: Executions requested per page (capped at 250 by n8n)
+            started_after: Stop once executions started before this timestamp
+            started_before: Skip executions started after this timestamp
+            limit: Stop after yielding this many executions
+            include_data: Include full node data for every execution
+            cursor: Resume from a cursor returned by a previous listing
+
+        Yields:
+            Execution records
+        """
+        after = _parse_timestamp(started_after)
+        before = _parse_timestamp(started_before)
+
+        yielded = 0
+        async for page, _ in self.iter_execution_pages(workflow_id, status, page_size, include_data, cursor):
+            for execution in page:
+                started_at = _parse_timestamp(execution.get("startedAt"))
+                if started_at is not None:
+                    if after is not None and started_at < after:
+                        return
+                    if before is not None and started_at > before:
+                        continue
+                yield execution
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+    async def iter_execution_pages(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        include_data: bool = False,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[Dict], Optional[str]]]:
+        """Stream raw execution listing pages (newest first) with n8n's cursor for the next page
+
+        Yields:
+            ``(executions, next_cursor)`` per page; ``next_cursor`` is None on the last page
+        """
+        params: Dict[str, Any] = {"limit": max(1, min(page_size, MAX_PAGE_SIZE))}
         if workflow_id:
             params["workflowId"] = workflow_id
+        if status:
+            params["status"] = status
+        if include_data:
+            params["includeData"] = "true"
 
-        response = await self.client.get(
-            f"{self.api_url}/api/v1/executions",
-            headers=self.headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()["data"]
+        async for page, next_cursor in self._iter_pages("/api/v1/executions", params, cursor):
+            yield page, next_cursor
+
+    async def get_executions(self, workflow_id: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """Get workflow executions (summary only, without full node data)"""
+        return [
+            execution async for execution in self.iter_executions(
+                workflow_id=workflow_id,
+                page_size=limit,
+                limit=limit
+            )
+        ]
 
     async def get_execution(self, execution_id: str, include_data: bool = True) -> Dict:
         """Get detailed execution data including all node inputs/outputs
@@ -239,11 +539,7 @@ class N8nClient:
         if include_data:
             params['includeData'] = 'true'
 
-        response = await self.client.get(
-            f"{self.api_url}/api/v1/executions/{execution_id}",
-            headers=self.headers,
-            params=params
-        )
+        response = await self._get(f"/api/v1/executions/{execution_id}", params=params)
         response.raise_for_status()
 
         result = response.json()
@@ -254,20 +550,131 @@ class N8nClient:
 
         return result
 
-    async def update_workflow(self, workflow_id: str, updates: Dict, replace_nodes: bool = False) -> Dict:
+    async def stream_execution(
+        self,
+        execution_id: str,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        nodes: Optional[List[str]] = None,
+    ) -> Dict:
+        """Get execution data, decoding the body incrementally within a budget
+
+        Unlike get_execution, the response is never held in memory as a whole:
+        runData item arrays are truncated while streaming, so peak memory is
+        bounded by the budget rather than by the execution size.
+
+        Args:
+            execution_id: The execution ID
+            max_items: Items kept per node output (None = unlimited)
+            max_bytes: Approximate total size of kept data
+            nodes: Only keep runData for these node names
+
+        Returns:
+            Execution data; truncated outputs are listed under ``truncatedRunData``
+            as ``{node, run, connection, output, kept, dropped}`` entries
+        """
+        pruner = RunDataPruner(max_items=max_items, max_bytes=max_bytes, nodes=nodes)
+        async for _ in self._stream_execution_body(execution_id, pruner):
+            pass
+        return pruner.finish() or {}
+
+    async def iter_execution_node_outputs(
+        self,
+        execution_id: str,
+        nodes: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, List[Dict]]]:
+        """Stream an execution's runData one node at a time
+
+        Each node's runs are yielded as soon as they have been decoded and
+        are not retained afterwards, so analyzers can walk huge executions
+        with only one node's (optionally truncated) output in memory.
+
+        Yields:
+            ``(node_name, runs)`` tuples in payload order
+        """
+        pruner = RunDataPruner(max_items=max_items, max_bytes=max_bytes, nodes=nodes, emit_nodes=True)
+        async for _ in self._stream_execution_body(execution_id, pruner):
+            while pruner.ready_nodes:
+                yield pruner.ready_nodes.pop(0)
+        pruner.finish()
+        for node_output in pruner.ready_nodes:
+            yield node_output
+
+    async def _stream_execution_body(self, execution_id: str, pruner: RunDataPruner) -> AsyncIterator[None]:
+        """Feed a streamed execution body (with node data) into a pruner chunk by chunk"""
+        async with self.client.stream(
+            "GET",
+            f"{self.api_url}/api/v1/executions/{execution_id}",
+            params={"includeData": "true"}
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                pruner.feed_bytes(chunk)
+                yield
+
+    async def update_workflow(
+        self,
+        workflow_id: str,
+        updates: Dict,
+        replace_nodes: bool = False,
+        base_workflow: Optional[Dict] = None,
+    ) -> Dict:
         """Update an existing workflow
 
+        The updates are merged into a base version of the workflow and sent in a
+        single PUT. The base is the caller-supplied ``base_workflow``, else a fresh
+        GET - never the session cache, whose copy may predate edits made in the
+        n8n UI that the PUT would silently revert.
+
         Args:
             workflow_id: ID of the workflow to update
             updates: Dictionary with fields to update (name, active, nodes, connections, settings, etc.)
             replace_nodes: If True, completely replace nodes instead of merging (removes old nodes)
+            base_workflow: Current workflow as just fetched by the caller (not modified)
 
         Returns:
             Updated workflow data
         """
-        # First get the current workflow to merge with updates
-        current_workflow = await self.get_workflow(workflow_id)
+        if base_workflow is not None:
+            current_workflow = copy.deepcopy(base_workflow)
+        else:
+            current_workflow = await self.get_workflow(workflow_id, use_cache=False)
+
+        payload = self._build_update_payload(current_workflow, updates, replace_nodes)
 
+        # n8n API uses PUT for updates, not PATCH
+        try:
+            updated = await self._put_workflow(workflow_id, payload)
+        except httpx.HTTPStatusError as e:
+            # Log the detailed error response for debugging
+            error_detail = ""
+            try:
+                error_detail = e.response.text
+            except:
+                error_detail = str(e)
+            logger.error(f"Failed to update workflow {workflow_id}: {error_detail}")
+            logger.error(f"Payload sent: {json.dumps(payload, indent=2)}")
+            raise Exception(f"Failed to update workflow: {error_detail}")
+
+        self.workflow_cache.invalidate(workflow_id)
+        self.workflow_cache.put(updated)
+        return updated
+
+    async def _put_workflow(self, workflow_id: str, payload: Dict) -> Dict:
+        """PUT a complete workflow payload, raising HTTPStatusError on failure"""
+        response = await self.client.put(
+            f"{self.api_url}/api/v1/workflows/{workflow_id}",
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _build_update_payload(self, current_workflow: Dict, updates: Dict, replace_nodes: bool) -> Dict:
+        """Merge updates into the current workflow, keeping only fields n8n accepts on PUT"""
         # Whitelist of fields that are allowed by n8n API for updates
         # Note: 'active', 'tags', 'id', 'createdAt', 'updatedAt' etc. are read-only
         allowed_fields = ['name', 'nodes', 'connections', 'settings', 'staticData']
@@ -335,50 +742,89 @@ class N8nClient:
         if 'connections' not in payload or payload['connections'] is None:
             payload['connections'] = {}
 
-        # n8n API uses PUT for updates, not PATCH
+        return payload
+
+    async def delete_workflow(self, workflow_id: str) -> Dict:
+        """Delete (archive) a workflow
+
+        Args:
+            workflow_id: ID of the workflow to delete
+
+        Returns:
+            Success message
+        """
+        self.workflow_cache.invalidate(workflow_id)
         try:
-            response = await self.client.put(
-                f"{self.api_url}/api/v1/workflows/{workflow_id}",
-                headers=self.headers,
-                json=payload
+            response = await self.client.delete(
+                f"{self.api_url}/api/v1/workflows/{workflow_id}"
             )
             response.raise_for_status()
-            return response.json()
+            return {"success": True, "message": f"Workflow {workflow_id} deleted successfully"}
         except httpx.HTTPStatusError as e:
-            # Log the detailed error response for debugging
             error_detail = ""
             try:
                 error_detail = e.response.text
             except:
                 error_detail = str(e)
-            logger.error(f"Failed to update workflow {workflow_id}: {error_detail}")
-            logger.error(f"Payload sent: {json.dumps(payload, indent=2)}")
-            raise Exception(f"Failed to update workflow: {error_detail}")
+            logger.error(f"Failed to delete workflow {workflow_id}: {error_detail}")
+            raise Exception(f"Failed to delete workflow: {error_detail}")
 
-    async def delete_workflow(self, workflow_id: str) -> Dict:
-        """Delete (archive) a workflow
+    async def activate_workflow(self, workflow_id: str) -> Dict:
+        """Activate a workflow
 
         Args:
-            workflow_id: ID of the workflow to delete
+            workflow_id: ID of the workflow to activate
 
         Returns:
-            Success message
+            Updated workflow data
         """
+        return await self._set_active(workflow_id, "activate")
+
+    async def deactivate_workflow(self, workflow_id: str) -> Dict:
+        """Deactivate a workflow
+
+        Args:
+            workflow_id: ID of the workflow to deactivate
+
+        Returns:
+            Updated workflow data
+        """
+        return await self._set_active(workflow_id, "deactivate")
+
+    async def _set_active(self, workflow_id: str, action: str) -> Dict:
+        """POST /workflows/:id/activate|deactivate and refresh the cache entry"""
+        self.workflow_cache.invalidate(workflow_id)
         try:
-            response = await self.client.delete(
-                f"{self.api_url}/api/v1/workflows/{workflow_id}",
-                headers=self.headers
+            response = await self.client.post(
+                f"{self.api_url}/api/v1/workflows/{workflow_id}/{action}"
             )
             response.raise_for_status()
-            return {"success": True, "message": f"Workflow {workflow_id} deleted successfully"}
+            workflow = response.json()
+            self.workflow_cache.put(workflow)
+            return workflow
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
                 error_detail = e.response.text
             except:
                 error_detail = str(e)
-            logger.error(f"Failed to delete workflow {workflow_id}: {error_detail}")
-            raise Exception(f"Failed to delete workflow: {error_detail}")
+            logger.error(f"Failed to {action} workflow {workflow_id}: {error_detail}")
+            raise Exception(f"Failed to {action} workflow: {error_detail}")
+
+    def get_resilience_stats(self) -> Dict:
+        """Throttled/retried/short-circuited request counters and circuit states"""
+        return self.resilience.get_stats()
+
+    def get_request_metrics(self) -> Dict:
+        """Per-endpoint request counts, bytes, status codes and latency percentiles"""
+        return self.metrics.snapshot()
+
+    def get_cache_stats(self) -> Dict:
+        """Workflow cache hit/miss counters (each hit is a saved round trip)"""
+        return {
+            **self.workflow_cache.get_stats(),
+            "coalesced_requests": self.coalesced_requests,
+        }
 
     async def get_node_types(self) -> List[Dict]:
         """Get list of all available node types
@@ -387,10 +833,7 @@ class N8nClient:
             List of node type metadata including name, displayName, description, version
         """
         try:
-            response = await self.client.get(
-                f"{self.api_url}/api/v1/node-types",
-                headers=self.headers
-            )
+            response = await self._get("/api/v1/node-types")
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -417,10 +860,7 @@ class N8nClient:
             - outputs: output schema
         """
         try:
-            response = await self.client.get(
-                f"{self.api_url}/api/v1/node-types/{node_type}",
-                headers=self.headers
-            )
+            response = await self._get(f"/api/v1/node-types/{node_type}")
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -435,6 +875,15 @@ class N8nClient:
             raise Exception(f"Failed to get node type schema: {error_detail}")
 
     async def close(self):
-        """Close HTTP client"""
+        """Close HTTP client (the shared connection pool is closed by Dependencies.close)
+
+        If N8N_METRICS_LOG is set, a final request metrics snapshot is appended to it.
+        """
+        metrics_log = os.getenv("N8N_METRICS_LOG")
+        if metrics_log and self.metrics.endpoints:
+            try:
+                self.metrics.dump(metrics_log)
+            except OSError as e:
+                logger.warning(f"Could not write request metrics to {metrics_log}: {e}")
         await self.client.aclose()
 
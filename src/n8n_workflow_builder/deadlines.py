@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Deadlines Module
+Per-tool call deadlines propagated through context into n8n requests and analyzer loops, with partial result collection
+"""
+import contextlib
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Absolute deadline (time.monotonic()) of the tool call running in this task/thread
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+# Partial results of the tool call running in this task, returned if it times out
+_partial: ContextVar[Optional['PartialResult']] = ContextVar("partial_result", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised by cooperative checks once the current tool call's deadline has passed"""
+
+    def __init__(self, stage: Optional[str] = None):
+        self.stage = stage
+        super().__init__(f"Deadline exceeded{f' during {stage}' if stage else ''}")
+
+
+@dataclass
+class DeadlineConfig:
+    """Default and per-tool deadlines for whole tool calls"""
+    default_timeout: float = 120.0       # seconds; 0 disables the deadline
+    # Per-tool deadlines, e.g. {"detect_schema_drift": 30}
+    tool_timeouts: Dict[str, float] = field(default_factory=dict)
+    # Time analyzers get to stop cooperatively and return partial results
+    # before the call is cancelled outright
+    grace: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> 'DeadlineConfig':
+        """Build config from N8N_TOOL_TIMEOUT* environment variables
+
+        N8N_TOOL_TIMEOUTS takes comma-separated ``tool=seconds`` pairs.
+        """
+        def env(name, default):
+            value = os.getenv(name)
+            try:
+                return float(value) if value else default
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+                return default
+
+        tool_timeouts = {}
+        for entry in os.getenv("N8N_TOOL_TIMEOUTS", "").split(","):
+            tool, _, seconds = entry.strip().partition("=")
+            try:
+                if tool and seconds:
+                    tool_timeouts[tool] = float(seconds)
+            except ValueError:
+                logger.warning(f"Ignoring invalid N8N_TOOL_TIMEOUTS entry {entry!r}")
+
+        return cls(
+            default_timeout=env("N8N_TOOL_TIMEOUT", cls.default_timeout),
+            tool_timeouts=tool_timeouts,
+            grace=env("N8N_TOOL_TIMEOUT_GRACE", cls.grace),
+        )
+
+    def timeout_for(self, tool: str) -> Optional[float]:
+        """Deadline in seconds for one call of a tool (None: unbounded)"""
+        timeout = self.tool_timeouts.get(tool, self.default_timeout)
+        return timeout if timeout and timeout > 0 else None
+
+
+def current_deadline() -> Optional[float]:
+    """Absolute deadline (time.monotonic()) of the current tool call, if any"""
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline (None: no deadline)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def expired() -> bool:
+    """Whether the current deadline has passed; cheap enough for inner loops"""
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def check_deadline(stage: Optional[str] = None) -> None:
+    """Raise DeadlineExceeded if the current deadline has passed"""
+    if expired():
+        raise DeadlineExceeded(stage)
+
+
+@contextlib.contextmanager
+def deadline_scope(timeout: Optional[float]):
+    """Run a block under a deadline ``timeout`` seconds from now
+
+    Nested scopes can only shorten the deadline (e.g. a batch_call's
+    sub-calls never outlive the batch). ``None`` keeps the outer deadline.
+    """
+    deadline = _deadline.get()
+    if timeout is not None:
+        candidate = time.monotonic() + timeout
+        deadline = candidate if deadline is None else min(deadline, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def run_with_deadline(deadline: Optional[float], func: Callable, *args, **kwargs) -> Any:
+    """Call ``func`` with ``deadline`` as the current deadline
+
+    Used to carry the deadline into process-pool workers, which do not
+    inherit context variables. time.monotonic() is system-wide on the
+    platforms we support, so the absolute value is valid across processes.
+    """
+    token = _deadline.set(deadline)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _deadline.reset(token)
+
+
+class PartialResult:
+    """What a tool call has produced so far, returned if its deadline passes
+
+    Handlers record finished steps with ``record_partial``; when the call is
+    cancelled the server returns these sections flagged as incomplete
+    instead of an error.
+    """
+
+    def __init__(self):
+        self.sections: Dict[str, Any] = {}
+        self.skipped: List[str] = []
+
+    def add(self, name: str, value: Any) -> None:
+        self.sections[name] = value
+
+    def skip(self, name: str) -> None:
+        if name not in self.skipped:
+            self.skipped.append(name)
+
+    def __bool__(self) -> bool:
+        return bool(self.sections or self.skipped)
+
+
+@contextlib.contextmanager
+def collect_partial():
+    """Collect partial results recorded in the enclosed block"""
+    partial = PartialResult()
+    token = _partial.set(partial)
+    try:
+        yield partial
+    finally:
+        _partial.reset(token)
+
+
+def record_partial(name: str, value: Any) -> None:
+    """Record a finished step of the current tool call (no-op outside a call)"""
+    partial = _partial.get()
+    if partial is not None:
+        partial.add(name, value)
+
+
+def record_skipped(name: str) -> None:
+    """Record a step the current tool call skipped to meet its deadline"""
+    partial = _partial.get()
+    if partial is not None:
+        partial.skip(name)
@@ -3,8 +3,31 @@
 Dependency Injection Container for MCP Server
 Simplified version that wraps existing server dependencies
 """
+import asyncio
+import importlib
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+
+class LazyDependency:
+    """Placeholder for a component that is built the first time it is accessed
+
+    Args:
+        factory: Zero-argument callable returning the component
+    """
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+    @classmethod
+    def of(cls, module: str, class_name: str, *args, **kwargs) -> 'LazyDependency':
+        """Lazily import ``module`` (relative to this package) and instantiate ``class_name``"""
+        def factory():
+            component_cls = getattr(importlib.import_module(module, __package__), class_name)
+            return component_cls(*args, **kwargs)
+        return cls(factory)
 
 
 @dataclass
@@ -13,6 +36,8 @@ class Dependencies:
     
     This is a lightweight wrapper around existing server dependencies.
     Instead of creating dependencies, it accepts already-instantiated ones.
+    Any field may also be a LazyDependency, which is built on first access
+    and then stored in place of the placeholder.
     """
     
     # Core services
@@ -23,7 +48,11 @@ class Dependencies:
     workflow_builder: Any
     workflow_validator: Any
     
+    # Shared HTTP connection pool (see http_pool.py)
+    http_pool: Any = None
+    
     # Analyzers
+    analyzer_executor: Any = None  # runs CPU-bound analyzers off the event loop
     semantic_analyzer: Any = None
     ai_feedback_analyzer: Any = None
     security_auditor: Any = None
@@ -39,6 +68,7 @@ class Dependencies:
     # Migration & Drift
     workflow_updater: Any = None
     migration_reporter: Any = None
+    drift_cache: Any = None  # drift analyses kept warm by the scheduler
     
     # Discovery
     node_discovery: Any = None
@@ -53,6 +83,12 @@ class Dependencies:
     # RBAC
     rbac_manager: Any = None
     
+    # Server dispatch (name, arguments) -> list[TextContent], used by batch_call
+    tool_dispatcher: Any = None
+    
+    # Background cache refreshes (see scheduler.py)
+    scheduler: Any = None
+    
     @classmethod
     def from_server(cls, **kwargs) -> 'Dependencies':
         """Create Dependencies from already-instantiated server components
@@ -68,8 +104,37 @@ class Dependencies:
         """
         return cls(**kwargs)
     
+    def __getattribute__(self, name: str) -> Any:
+        value = object.__getattribute__(self, name)
+        if type(value) is LazyDependency:
+            value = value.factory()
+            object.__setattr__(self, name, value)
+        return value
+    
+    def is_loaded(self, name: str) -> bool:
+        """Whether a component has been built (without building it)"""
+        return type(object.__getattribute__(self, name)) is not LazyDependency
+    
     async def close(self):
         """Cleanup resources when server shuts down"""
-        if hasattr(self.client, 'close'):
+        # Components that were never built have nothing to release
+        if self.is_loaded("scheduler") and self.scheduler is not None:
+            await self.scheduler.stop()
+        if self.is_loaded("client") and hasattr(self.client, 'close'):
             await self.client.close()
+        if self.is_loaded("http_pool") and self.http_pool is not None:
+            await self.http_pool.aclose()
+        if self.is_loaded("analyzer_executor") and self.analyzer_executor is not None:
+            self.analyzer_executor.shutdown()
+        if self.is_loaded("state_manager") and hasattr(self.state_manager, "close"):
+            # Final journal flush and compaction (file I/O, kept off the loop)
+            await asyncio.to_thread(self.state_manager.close)
+        if self.is_loaded("rbac_manager") and hasattr(self.rbac_manager, "close"):
+            self.rbac_manager.close()
+        if self.is_loaded("approval_workflow") and hasattr(self.approval_workflow, "close"):
+            self.approval_workflow.close()
+        if self.is_loaded("node_discovery") and hasattr(self.node_discovery, "close"):
+            self.node_discovery.close()
+        if self.is_loaded("provenance_tracker") and hasattr(self.provenance_tracker, "close"):
+            self.provenance_tracker.close()
 
@@ -10,6 +10,8 @@ from collections import defaultdict
 from datetime import datetime
 import json
 
+from ...deadlines import expired
+
 
 class SchemaDriftAnalyzer:
     """Analyzes schema drift in workflow execution data"""
@@ -42,6 +44,9 @@ class SchemaDriftAnalyzer:
         # Extract schemas from each period
         baseline_schemas = SchemaDriftAnalyzer._extract_schemas(baseline_execs)
         current_schemas = SchemaDriftAnalyzer._extract_schemas(current_execs)
+        # Extraction stops early once the tool call's deadline passes
+        incomplete = (baseline_schemas["executions_analyzed"] < len(baseline_execs)
+                      or current_schemas["executions_analyzed"] < len(current_execs))
 
         # Detect drift patterns
         drift_patterns = []
@@ -146,12 +151,15 @@ class SchemaDriftAnalyzer:
             "drift_detected": len(drift_patterns) > 0,
             "severity": overall_severity,
             "patterns": drift_patterns,
+            "incomplete": incomplete,
             "baseline_period": {
                 "executions": len(baseline_execs),
+                "executions_analyzed": baseline_schemas["executions_analyzed"],
                 "nodes_analyzed": len(baseline_schemas["fields"])
             },
             "current_period": {
                 "executions": len(current_execs),
+                "executions_analyzed": current_schemas["executions_analyzed"],
                 "nodes_analyzed": len(current_schemas["fields"])
             },
             "summary": {
@@ -167,8 +175,11 @@ class SchemaDriftAnalyzer:
         """
         Extract schema information from executions
 
+        Stops at the first execution boundary after the current deadline.
+
         Returns:
-            Dict with fields, types, structures, and null rates per node
+            Dict with fields, types, structures, and null rates per node, and
+            how many executions were analyzed
         """
         # Track fields per node
         node_fields = defaultdict(set)
@@ -180,7 +191,12 @@ class SchemaDriftAnalyzer:
         node_field_counts = defaultdict(lambda: defaultdict(int))
         node_field_nulls = defaultdict(lambda: defaultdict(int))
 
+        analyzed = 0
         for execution in executions:
+            if expired():
+                break
+            analyzed += 1
+
             # Extract node output data
             data = execution.get("data", {})
             result_data = data.get("resultData", {})
@@ -242,7 +258,8 @@ class SchemaDriftAnalyzer:
             "fields": dict(node_fields),
             "types": simplified_types,
             "structures": dict(node_structures),
-            "null_rates": node_null_rates
+            "null_rates": node_null_rates,
+            "executions_analyzed": analyzed
         }
 
     @staticmethod
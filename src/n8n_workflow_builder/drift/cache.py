@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Drift Cache Module
+Most recent execution drift analysis per workflow, kept warm by the background scheduler
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+from ..env import env_float
+
+DEFAULT_MAX_AGE_SECONDS = 1800.0
+# History window of background analyses (detect_workflow_drift's default)
+DEFAULT_LOOKBACK_DAYS = 30
+
+
+class DriftCache:
+    """Drift analyses keyed by workflow ID and lookback, valid for ``max_age_seconds``
+
+    Analyses are treated as read-only by callers (handlers only render them),
+    so entries are handed out without copying.
+    """
+
+    def __init__(self, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        # (workflow_id, lookback_days) -> (stored_at, analysis)
+        self._entries: Dict[Tuple[str, float], Tuple[float, Dict]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> 'DriftCache':
+        """Build from N8N_DRIFT_CACHE_TTL (seconds, 0 disables)"""
+        return cls(max_age_seconds=env_float("N8N_DRIFT_CACHE_TTL", DEFAULT_MAX_AGE_SECONDS))
+
+    def get(self, workflow_id: str, lookback_days: float = DEFAULT_LOOKBACK_DAYS) -> Optional[Tuple[Dict, float]]:
+        """Cached analysis and its age in seconds, or None if missing or stale"""
+        key = (workflow_id, lookback_days)
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.max_age_seconds:
+                self.hits += 1
+                return entry[1], age
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, workflow_id: str, analysis: Dict, lookback_days: float = DEFAULT_LOOKBACK_DAYS) -> None:
+        if self.max_age_seconds > 0:
+            self._entries[(workflow_id, lookback_days)] = (time.monotonic(), analysis)
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Drop the workflow's analyses for every lookback"""
+        for key in [key for key in self._entries if key[0] == workflow_id]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Environment Settings Module
+Numeric N8N_* settings that fall back to their defaults when unset or invalid
+"""
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+
+def env_int(name: str, default: int, minimum: Optional[int] = None) -> int:
+    """Integer from the environment variable ``name``
+
+    Args:
+        name: Environment variable to read
+        default: Used when the variable is unset, empty or invalid
+        minimum: Values below it are treated as invalid
+
+    Returns:
+        The parsed value, or ``default`` (with a warning when invalid)
+    """
+    value = os.getenv(name)
+    try:
+        parsed = int(value) if value else default
+    except ValueError:
+        parsed = None
+    if parsed is None or (minimum is not None and parsed < minimum):
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+    return parsed
+
+
+def env_float(name: str, default: float) -> float:
+    """Float from the environment variable ``name``, or ``default``"""
+    value = os.getenv(name)
+    try:
+        return float(value) if value else default
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Incremental decoding of large n8n execution payloads
+
+An execution fetched with ``includeData=true`` carries every item every node
+produced under ``data.resultData.runData``. ``RunDataPruner`` consumes the
+response body chunk by chunk and only keeps the first items of each output
+array (and nothing past a global byte budget), so peak memory is bounded by
+the budget instead of the payload size. Completed ``runData`` entries can
+also be handed out node by node instead of being assembled into one object.
+"""
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Matches the next character that changes parser state outside of strings
+_STRUCTURAL = re.compile(r'[{}\[\],:"]')
+# Matches the next character that matters inside a string
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = " \t\r\n"
+_NON_WHITESPACE = re.compile(r'[^ \t\r\n]')
+_VALUE_DECODER = json.JSONDecoder()
+
+# Container roles along data.resultData.runData.<node>[run].data.<connection>[output][item]
+_KEYED_ROLES = {
+    ("root", "data"): "data",
+    ("data", "resultData"): "resultData",
+    ("resultData", "runData"): "runData",
+    ("run", "data"): "run_data",
+}
+# Roles whose children all share one role; their key/index becomes a path coordinate
+_ANY_CHILD_ROLES = {
+    "runData": "node_runs",
+    "node_runs": "run",
+    "run_data": "outputs",
+    "outputs": "items",
+}
+
+
+class _Frame:
+    __slots__ = ("kind", "role", "key", "index", "expect_key", "path")
+
+    def __init__(self, kind: str, role: Optional[str], path: Tuple):
+        self.kind = kind            # "{" or "["
+        self.role = role            # position inside the runData tree, if any
+        self.key = None             # current key (objects)
+        self.index = 0              # current element index (arrays)
+        self.expect_key = kind == "{"
+        self.path = path            # (node, run, connection, output) coordinates so far
+
+
+class RunDataPruner:
+    """Streaming filter that truncates runData item arrays while decoding
+
+    Feed decoded body text with ``feed()``; call ``finish()`` for the pruned
+    execution. With ``emit_nodes=True`` each completed ``runData`` entry is
+    parsed and queued in ``ready_nodes`` instead of being kept in the result.
+
+    Args:
+        max_items: Items kept per output array (None = unlimited)
+        max_bytes: Approximate budget for kept item data across the payload
+        nodes: Only keep runData for these node names (None = all)
+        emit_nodes: Hand out runData entries one by one as they complete
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        nodes: Optional[List[str]] = None,
+        emit_nodes: bool = False,
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.nodes = set(nodes) if nodes is not None else None
+        self.emit_nodes = emit_nodes
+
+        self.truncated: List[Dict[str, Any]] = []
+        self.ready_nodes: List[Tuple[str, List[Dict]]] = []
+        self.bytes_kept = 0
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._stack: List[_Frame] = []
+        self._sinks: List[list] = [[]]
+        self._pending = ""
+        self._in_string = False
+        self._string_is_key = False
+        self._key_parts: List[str] = []
+        # While > 0, characters are dropped until the stack is back to this depth
+        self._skip_depth = 0
+        self._skip_record: Optional[Dict[str, Any]] = None
+        self._skip_saw_value = False
+
+    # ------------------------------------------------------------------ input
+
+    def feed_bytes(self, chunk: bytes) -> None:
+        """Feed a raw chunk of the UTF-8 response body"""
+        self.feed(self._decoder.decode(chunk))
+
+    def feed(self, text: str) -> None:
+        """Feed a chunk of decoded JSON text"""
+        text = self._pending + text
+        self._pending = ""
+        pos = 0
+        length = len(text)
+
+        while pos < length:
+            if self._in_string:
+                pos = self._scan_string(text, pos)
+                continue
+
+            if self._skip_depth and len(self._stack) == self._skip_depth:
+                pos = self._skip_whole_values(text, pos)
+                if pos >= length:
+                    break
+
+            match = _STRUCTURAL.search(text, pos)
+            end = match.start() if match else length
+            if end > pos:
+                self._literal(text[pos:end])
+            if not match:
+                break
+            pos = end + 1
+            self._structural(match.group())
+
+    def finish(self) -> Optional[Dict]:
+        """Parse what was kept and attach truncation metadata"""
+        self.feed(self._decoder.decode(b"", final=True))
+        text = "".join(self._sinks[0])
+        if not text.strip():
+            return None
+        result = json.loads(text)
+        if isinstance(result, dict) and self.truncated:
+            result["truncatedRunData"] = self.truncated
+        return result
+
+    # --------------------------------------------------------------- scanning
+
+    def _emit(self, text: str) -> None:
+        if not self._skip_depth:
+            self._sinks[-1].append(text)
+            self.bytes_kept += len(text)
+
+    def _scan_string(self, text: str, pos: int) -> int:
+        """Consume string content up to (and including) the closing quote"""
+        match = _STRING_SPECIAL.search(text, pos)
+        if match is None:
+            self._string_part(text[pos:])
+            return len(text)
+
+        end = match.start()
+        if match.group() == "\\":
+            if end + 1 >= len(text):
+                # Escape split across chunks - retry once more data arrives
+                self._string_part(text[pos:end])
+                self._pending = text[end:]
+                return len(text)
+            self._string_part(text[pos:end + 2])
+            return end + 2
+
+        self._string_part(text[pos:end + 1])
+        self._in_string = False
+        if self._string_is_key:
+            self._stack[-1].key = json.loads('"' + "".join(self._key_parts))
+            self._key_parts = []
+        return end + 1
+
+    def _string_part(self, part: str) -> None:
+        if self._string_is_key:
+            self._key_parts.append(part)
+        self._emit(part)
+
+    def _literal(self, text: str) -> None:
+        if self._skip_depth and not self._skip_saw_value and text.strip(_WHITESPACE):
+            self._count_skipped()
+        self._emit(text)
+
+    def _count_skipped(self) -> None:
+        self._skip_saw_value = True
+        if self._skip_record is not None and len(self._stack) == self._skip_depth:
+            self._skip_record["dropped"] += 1
+
+    def _structural(self, char: str) -> None:
+        stack = self._stack
+        top = stack[-1] if stack else None
+
+        if self._skip_depth:
+            self._skip_structural(char, top)
+            return
+
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = top is not None and top.kind == "{" and top.expect_key
+            self._emit(char)
+        elif char in "{[":
+            self._open(char, top)
+        elif char in "}]":
+            self._close(char)
+        elif char == ":":
+            top.expect_key = False
+            self._emit(char)
+        elif char == ",":
+            if top.kind == "{":
+                top.expect_key = True
+                self._emit(char)
+            else:
+                top.index += 1
+                if top.role == "items" and self._over_budget(top):
+                    self._start_skip(top, after_comma=True)
+                else:
+                    self._emit(char)
+
+    def _open(self, char: str, parent: Optional[_Frame]) -> None:
+        if parent is None:
+            role, path = "root", ()
+        else:
+            role = _KEYED_ROLES.get((parent.role, parent.key)) if parent.kind == "{" else None
+            path = parent.path
+            if role is None and parent.role in _ANY_CHILD_ROLES:
+                role = _ANY_CHILD_ROLES[parent.role]
+                path = path + (parent.key if parent.kind == "{" else parent.index,)
+
+        frame = _Frame(char, role, path)
+        if role == "node_runs":
+            if self.nodes is not None and path[-1] not in self.nodes:
+                # Unwanted node: keep an empty run list
+                self._emit(char)
+                self._stack.append(frame)
+                self._start_skip(frame, after_comma=False, record=False)
+                return
+            if self.emit_nodes:
+                self._sinks.append([])
+
+        self._emit(char)
+        self._stack.append(frame)
+
+        if role == "items" and self._over_budget(frame):
+            self._start_skip(frame, after_comma=False)
+
+    def _close(self, char: str) -> None:
+        frame = self._stack.pop()
+        self._emit(char)
+        if frame.role == "node_runs" and len(self._sinks) > 1:
+            text = "".join(self._sinks.pop())
+            self.ready_nodes.append((frame.path[-1], json.loads(text)))
+            # Leave an empty run list in the assembled result
+            self._sinks[-1].append("[]")
+
+    def _over_budget(self, items: _Frame) -> bool:
+        if self.max_items is not None and items.index >= self.max_items:
+            return True
+        return self.max_bytes is not None and self.bytes_kept >= self.max_bytes
+
+    def _start_skip(self, frame: _Frame, after_comma: bool, record: bool = True) -> None:
+        self._skip_depth = len(self._stack)
+        self._skip_saw_value = after_comma
+        self._skip_record = None
+        if record:
+            node, run, connection, output = (frame.path + (None,) * 4)[:4]
+            self._skip_record = {
+                "node": node, "run": run, "connection": connection, "output": output,
+                "kept": frame.index, "dropped": 1 if after_comma else 0,
+            }
+            self.truncated.append(self._skip_record)
+
+    def _skip_whole_values(self, text: str, pos: int) -> int:
+        """Drop complete items at C speed while they fit in the current chunk"""
+        while True:
+            match = _NON_WHITESPACE.search(text, pos)
+            if match is None:
+                return len(text)
+            pos = match.start()
+            char = text[pos]
+            if char == ",":
+                self._skip_saw_value = False
+                pos += 1
+                continue
+            if char in "]}" or self._skip_saw_value:
+                return pos
+            try:
+                _, end = _VALUE_DECODER.raw_decode(text, pos)
+            except ValueError:
+                # Item continues in the next chunk - fall back to scanning
+                return pos
+            if end >= len(text):
+                # A number at the chunk edge may still be incomplete
+                return pos
+            self._count_skipped()
+            pos = end
+
+    def _skip_structural(self, char: str, top: _Frame) -> None:
+        """Track nesting while dropping everything inside a skipped array"""
+        depth = len(self._stack)
+        if char == '"':
+            if not self._skip_saw_value:
+                self._count_skipped()
+            self._in_string = True
+            self._string_is_key = False
+        elif char in "{[":
+            if not self._skip_saw_value:
+                self._count_skipped()
+            self._stack.append(_Frame(char, None, top.path))
+        elif char in "}]":
+            if depth == self._skip_depth:
+                # End of the skipped array itself
+                self._skip_depth = 0
+                if self._skip_record is not None and self._skip_record["dropped"] == 0:
+                    self.truncated.remove(self._skip_record)
+                self._skip_record = None
+                self._close(char)
+            else:
+                self._stack.pop()
+        elif char == "," and depth == self._skip_depth:
+            self._skip_saw_value = False
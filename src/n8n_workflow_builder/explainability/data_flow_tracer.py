@@ -12,6 +12,8 @@ Analyzes:
 from typing import Dict, List, Set, Tuple, Optional
 import re
 
+from ..tracing import traced
+
 
 class DataFlowTracer:
     """Traces data flow through workflow nodes"""
@@ -74,6 +76,7 @@ class DataFlowTracer:
     }
 
     @staticmethod
+    @traced("data_flow")
     def trace_data_flow(workflow: Dict) -> Dict:
         """
         Trace complete data flow through workflow
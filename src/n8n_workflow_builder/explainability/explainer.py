@@ -5,7 +5,8 @@ Orchestrates all explainability components to generate comprehensive
 workflow documentation and analysis.
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+from ..deadlines import expired
 from .purpose_analyzer import WorkflowPurposeAnalyzer
 from .data_flow_tracer import DataFlowTracer
 from .dependency_mapper import DependencyMapper
@@ -41,17 +42,31 @@ class WorkflowExplainer:
             - Dependency mapping
             - Risk assessment
         """
+        # Stages run in order; once the tool call's deadline has passed the
+        # remaining ones are skipped and the explanation is marked incomplete
+        skipped: List[str] = []
+
+        def run_stage(name: str, func: Callable, *args, **kwargs) -> Dict:
+            if expired():
+                skipped.append(name)
+                return {}
+            return func(*args, **kwargs)
+
         # Analyze purpose
-        purpose_analysis = WorkflowPurposeAnalyzer.analyze_purpose(workflow)
+        purpose_analysis = run_stage("purpose", WorkflowPurposeAnalyzer.analyze_purpose, workflow)
 
         # Trace data flow
-        data_flow_analysis = DataFlowTracer.trace_data_flow(workflow)
+        data_flow_analysis = run_stage("data_flow", DataFlowTracer.trace_data_flow, workflow)
 
         # Map dependencies
-        dependency_analysis = DependencyMapper.map_dependencies(workflow, all_workflows)
+        dependency_analysis = run_stage(
+            "dependencies", DependencyMapper.map_dependencies, workflow, all_workflows
+        )
 
         # Analyze risks
-        risk_analysis = RiskAnalyzer.analyze_risks(
+        risk_analysis = run_stage(
+            "risks",
+            RiskAnalyzer.analyze_risks,
             workflow,
             semantic_analysis=semantic_analysis,
             drift_analysis=drift_analysis,
@@ -82,6 +97,8 @@ class WorkflowExplainer:
                 "active": workflow.get("active", False),
                 "tags": workflow.get("tags", []),
             },
+            "incomplete": bool(skipped),
+            "skipped_sections": skipped,
         }
 
     @staticmethod
@@ -114,8 +131,11 @@ class WorkflowExplainer:
         parts.append(dependency_analysis.get("summary", "No dependencies identified"))
 
         # Risk summary
-        risk_level = risk_analysis.get("risk_level", "low")
-        parts.append(f"Risk Level: {risk_level.upper()}")
+        if risk_analysis:
+            risk_level = risk_analysis.get("risk_level", "low")
+            parts.append(f"Risk Level: {risk_level.upper()}")
+        else:
+            parts.append("Risk Level: NOT ANALYZED")
 
         return " | ".join(parts)
 
@@ -24,6 +24,11 @@ class ExplainabilityFormatter:
         md_parts.append(f"# Workflow Explanation: {workflow_name}")
         md_parts.append("")
 
+        if explanation.get("incomplete"):
+            skipped = ", ".join(explanation.get("skipped_sections", []))
+            md_parts.append(f"⏱️ **Incomplete:** deadline reached before these sections were analyzed: {skipped}")
+            md_parts.append("")
+
         # Executive Summary
         md_parts.append("## Executive Summary")
         md_parts.append("")
@@ -258,6 +263,11 @@ class ExplainabilityFormatter:
         text_parts.append("=" * 80)
         text_parts.append("")
 
+        if explanation.get("incomplete"):
+            skipped = ", ".join(explanation.get("skipped_sections", []))
+            text_parts.append(f"INCOMPLETE: deadline reached before these sections were analyzed: {skipped}")
+            text_parts.append("")
+
         # Executive Summary
         text_parts.append("EXECUTIVE SUMMARY")
         text_parts.append("-" * 80)
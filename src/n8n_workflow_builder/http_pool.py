@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Connection Pool
+Process-wide httpx transport shared by every outbound client (n8n API, GitHub, n8n.io)
+"""
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import httpx
+
+from .env import env_float, env_int
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool tuning shared by all outbound HTTP clients"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    http2: bool = False
+    # Per-host connection caps, e.g. {"api.github.com": 4}
+    per_host_limits: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls) -> 'HTTPPoolConfig':
+        """Build config from N8N_HTTP_* environment variables
+
+        N8N_HTTP_HOST_LIMITS takes comma-separated ``host=max_connections`` pairs.
+        """
+        per_host_limits = {}
+        for entry in os.getenv("N8N_HTTP_HOST_LIMITS", "").split(","):
+            host, _, limit = entry.strip().partition("=")
+            if host and limit.isdigit():
+                per_host_limits[host.lower()] = int(limit)
+
+        return cls(
+            max_connections=env_int("N8N_HTTP_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=env_int("N8N_HTTP_MAX_KEEPALIVE", cls.max_keepalive_connections),
+            keepalive_expiry=env_float("N8N_HTTP_KEEPALIVE_EXPIRY", cls.keepalive_expiry),
+            timeout=env_float("N8N_HTTP_TIMEOUT", cls.timeout),
+            http2=os.getenv("N8N_HTTP2", "").lower() in ("1", "true", "yes"),
+            per_host_limits=per_host_limits,
+        )
+
+
+class _RoutingTransport(httpx.AsyncBaseTransport):
+    """Dispatch requests to a per-host transport, falling back to the shared default"""
+
+    def __init__(self, default: httpx.AsyncBaseTransport, per_host: Dict[str, httpx.AsyncBaseTransport]):
+        self.default = default
+        self.per_host = per_host
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self.per_host.get(request.url.host, self.default)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        for transport in [self.default, *self.per_host.values()]:
+            await transport.aclose()
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """View of the shared transport handed to individual clients
+
+    Closing a client must not tear down sockets other clients still use,
+    so ``aclose`` is a no-op here; the pool owns the real transport.
+    """
+
+    def __init__(self, pool: 'SharedHTTPPool'):
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.pool.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SharedHTTPPool:
+    """Owns the process-wide connection pool and hands out clients bound to it"""
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self.config = config or HTTPPoolConfig.from_env()
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """Shared transport, created on first use"""
+        if self._transport is None:
+            self._transport = self._build_transport()
+        return self._transport
+
+    def _build_transport(self) -> httpx.AsyncBaseTransport:
+        config = self.config
+        http2 = config.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("N8N_HTTP2 requested but the 'h2' package is not installed - using HTTP/1.1")
+            http2 = False
+
+        def make(max_connections: int) -> httpx.AsyncHTTPTransport:
+            return httpx.AsyncHTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=min(config.max_keepalive_connections, max_connections),
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+            )
+
+        default = make(config.max_connections)
+        if not config.per_host_limits:
+            return default
+        per_host = {host: make(limit) for host, limit in config.per_host_limits.items()}
+        return _RoutingTransport(default, per_host)
+
+    def borrow(self) -> httpx.AsyncBaseTransport:
+        """Transport backed by the shared pool that is safe to wrap and close"""
+        return _BorrowedTransport(self)
+
+    def client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.AsyncClient:
+        """Create an AsyncClient that reuses the shared pool
+
+        Args:
+            headers: Default headers sent with every request of this client
+            timeout: Request timeout (defaults to the pool config)
+            transport: Middleware wrapping ``borrow()`` (defaults to the bare pool)
+
+        Returns:
+            AsyncClient whose ``aclose()`` leaves the shared pool open
+        """
+        return httpx.AsyncClient(
+            transport=transport or self.borrow(),
+            headers=headers,
+            timeout=timeout if timeout is not None else self.config.timeout,
+        )
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        if self._transport is not None:
+            await self._transport.aclose()
+            self._transport = None
+
+
+_shared_pool: Optional[SharedHTTPPool] = None
+
+
+def get_http_pool() -> SharedHTTPPool:
+    """Get the process-wide HTTP pool, creating it on first use"""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = SharedHTTPPool()
+    return _shared_pool
+
+
+async def close_http_pool() -> None:
+    """Close the process-wide HTTP pool (a new one is created on next use)"""
+    global _shared_pool
+    if _shared_pool is not None:
+        await _shared_pool.aclose()
+        _shared_pool = None
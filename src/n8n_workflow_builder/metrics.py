@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Request Metrics Module
+Per-endpoint request counts, sizes, status codes and latency histograms for N8nClient
+"""
+import bisect
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union, TYPE_CHECKING
+
+import httpx
+
+from .resilience import endpoint_key
+
+if TYPE_CHECKING:
+    from .tracing import Tracer
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram: O(log buckets) record, constant memory"""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, duration_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.min_ms = duration_ms if self.min_ms is None else min(self.min_ms, duration_ms)
+        self.max_ms = duration_ms if self.max_ms is None else max(self.max_ms, duration_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate a percentile by interpolating within its bucket"""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return round(min(max(estimate, self.min_ms), self.max_ms), 2)
+            seen += bucket_count
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "min_ms": round(self.min_ms, 2) if self.min_ms is not None else None,
+            "max_ms": round(self.max_ms, 2) if self.max_ms is not None else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class EndpointStats:
+    """Counters for one normalized endpoint (e.g. ``GET /api/v1/workflows/{id}``)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_codes: Counter = Counter()
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "status_codes": {str(code): n for code, n in sorted(self.status_codes.items(), key=str)},
+            "latency": self.latency.to_dict(),
+        }
+
+
+class RequestMetrics:
+    """Per-endpoint request accounting shared by a client's transport"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.started_at = datetime.now().isoformat()
+
+    def record(
+        self,
+        endpoint: str,
+        status: Union[int, str],
+        duration_ms: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record one completed (or failed) request
+
+        Args:
+            endpoint: Normalized endpoint name
+            status: HTTP status code, or an error class name for network failures
+            duration_ms: Time from sending the request to the end of the body
+        """
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.requests += 1
+        stats.status_codes[status] += 1
+        if not isinstance(status, int) or status >= 400:
+            stats.errors += 1
+        stats.bytes_sent += bytes_sent
+        stats.bytes_received += bytes_received
+        stats.latency.record(duration_ms)
+
+    def snapshot(self) -> Dict:
+        """All endpoint stats, busiest first"""
+        endpoints = sorted(self.endpoints.items(), key=lambda item: item[1].requests, reverse=True)
+        return {
+            "since": self.started_at,
+            "timestamp": datetime.now().isoformat(),
+            "total_requests": sum(stats.requests for _, stats in endpoints),
+            "endpoints": {name: stats.to_dict() for name, stats in endpoints},
+        }
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """Append the current snapshot as one JSON line"""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(json.dumps(self.snapshot(), separators=(",", ":")) + "\n")
+        return path
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+        self.started_at = datetime.now().isoformat()
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Response body wrapper that records the request once the body is consumed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self.stream = stream
+        self.on_close = on_close
+        self.bytes_received = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            self.bytes_received += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.on_close(self.bytes_received)
+        await self.stream.aclose()
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """httpx transport wrapper that feeds RequestMetrics
+
+    Latency covers the full exchange up to the end of the response body, so
+    slow downloads are attributed to the request rather than to the caller.
+    With a tracer, each request is also recorded as a ``client`` span.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        metrics: Optional[RequestMetrics] = None,
+        tracer: Optional['Tracer'] = None,
+    ):
+        self.transport = transport
+        self.metrics = metrics or RequestMetrics()
+        self.tracer = tracer
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_key(request.method, request.url.path)
+        bytes_sent = int(request.headers.get("content-length") or 0)
+        span = self.tracer.start_span(endpoint, "client") if self.tracer else None
+        started = time.perf_counter()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            self.metrics.record(
+                endpoint, type(e).__name__, (time.perf_counter() - started) * 1000, bytes_sent
+            )
+            if span:
+                span.end(e)
+            raise
+
+        def on_close(bytes_received: int) -> None:
+            self.metrics.record(
+                endpoint, response.status_code, (time.perf_counter() - started) * 1000,
+                bytes_sent, bytes_received
+            )
+            if span:
+                span.set(status_code=response.status_code, bytes_received=bytes_received)
+                span.end(f"HTTP {response.status_code}" if response.status_code >= 400 else None)
+
+        if response.is_closed:
+            # Body was already loaded by the transport (e.g. MockTransport)
+            on_close(len(response.content))
+        else:
+            response.stream = _MeteredStream(response.stream, on_close)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -14,9 +14,11 @@ This gives us:
 from typing import Dict, List, Set, Optional
 from collections import defaultdict
 import json
-import sqlite3
 from pathlib import Path
 import os
+import threading
+
+from .storage import connect_sqlite, data_version
 
 
 class NodeDiscovery:
@@ -47,24 +49,49 @@ class NodeDiscovery:
             db_path = str(db_dir / "node_discovery.db")
 
         self.db_path = db_path
+        # One connection for the object's lifetime: PRAGMA data_version on it
+        # tells whether another server process saved discoveries meanwhile
+        self._lock = threading.RLock()
+        self._conn = connect_sqlite(db_path)
+        self._data_version = None
         self._init_db()
         self._load_from_db()
 
-    def analyze_workflows(self, workflows: List[Dict]) -> Dict:
+    def analyze_workflows(self, workflows: List[Dict], recount: bool = False) -> Dict:
         """
         Analyze multiple workflows to discover node types and patterns
 
         Args:
             workflows: List of workflow objects from n8n API
+            recount: Replace the usage counts of node types found in
+                ``workflows`` instead of adding to them (for periodic
+                refreshes); counts of other node types are left untouched
 
         Returns:
             Summary of discovered nodes
         """
-        for workflow in workflows:
-            self._analyze_workflow(workflow)
-
-        # Save to database after analysis
-        self._save_to_db()
+        with self._lock:
+            # Hold the write lock from reload to save, so a concurrent analysis
+            # in another process cannot overwrite what we merge in
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.refresh()
+
+                if recount:
+                    for workflow in workflows:
+                        for node in workflow.get('nodes', []):
+                            if node.get('type'):
+                                self.node_usage_count[node['type']] = 0
+
+                for workflow in workflows:
+                    self._analyze_workflow(workflow)
+
+                # Save to database after analysis
+                self._save_to_db()
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
 
         return self.get_summary()
 
@@ -160,6 +187,7 @@ class NodeDiscovery:
 
     def get_summary(self) -> Dict:
         """Get summary of discovered nodes"""
+        self.refresh()
         return {
             'total_node_types': len(self.discovered_nodes),
             'total_usage': sum(self.node_usage_count.values()),
@@ -173,6 +201,7 @@ class NodeDiscovery:
 
     def get_node_schema(self, node_type: str) -> Optional[Dict]:
         """Get schema for a specific node type"""
+        self.refresh()
         schema = self.discovered_nodes.get(node_type)
         if not schema:
             return None
@@ -186,6 +215,7 @@ class NodeDiscovery:
 
     def search_nodes(self, query: str) -> List[Dict]:
         """Search for nodes by keyword"""
+        self.refresh()
         query_lower = query.lower()
         matches = []
 
@@ -229,6 +259,7 @@ class NodeDiscovery:
 
     def get_parameter_insights(self, node_type: str) -> Dict:
         """Get insights about parameters for a node type"""
+        self.refresh()
         schema = self.discovered_nodes.get(node_type)
         if not schema:
             return {}
@@ -242,6 +273,7 @@ class NodeDiscovery:
 
     def get_popular_nodes(self, limit: int = 20) -> List[Dict]:
         """Get most commonly used nodes"""
+        self.refresh()
         popular = []
 
         for node_type, count in sorted(
@@ -265,6 +297,7 @@ class NodeDiscovery:
         Returns:
             List of unique node type strings (e.g., ['n8n-nodes-base.webhook', ...])
         """
+        self.refresh()
         return list(self.discovered_nodes.keys())
 
     def get_node_info(self, node_type: str) -> Optional[Dict]:
@@ -276,6 +309,7 @@ class NodeDiscovery:
         Returns:
             Dict with node info or None if not found
         """
+        self.refresh()
         schema = self.discovered_nodes.get(node_type)
         if not schema:
             return None
@@ -293,6 +327,7 @@ class NodeDiscovery:
 
     def export_knowledge(self) -> Dict:
         """Export all discovered knowledge as JSON"""
+        self.refresh()
         export = {
             'summary': self.get_summary(),
             'nodes': {}
@@ -312,59 +347,64 @@ class NodeDiscovery:
 
     def _init_db(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Discovered nodes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS discovered_nodes (
-                node_type TEXT PRIMARY KEY,
-                name TEXT,
-                type_version INTEGER,
-                usage_count INTEGER DEFAULT 0,
-                parameters TEXT,
-                parameter_types TEXT,
-                credentials TEXT,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        with self._lock, self._conn:
+            # Discovered nodes table
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS discovered_nodes (
+                    node_type TEXT PRIMARY KEY,
+                    name TEXT,
+                    type_version INTEGER,
+                    usage_count INTEGER DEFAULT 0,
+                    parameters TEXT,
+                    parameter_types TEXT,
+                    credentials TEXT,
+                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+    def refresh(self) -> bool:
+        """Reload discoveries if another process saved to the database since we last read it
 
-        conn.commit()
-        conn.close()
+        Returns:
+            True if the knowledge was reloaded
+        """
+        with self._lock:
+            if data_version(self._conn) == self._data_version:
+                return False
+            self._load_from_db()
+            return True
 
     def _load_from_db(self):
         """Load discovered nodes from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM discovered_nodes')
-        rows = cursor.fetchall()
-
-        for row in rows:
-            node_type = row[0]
-            self.discovered_nodes[node_type] = {
-                'type': node_type,
-                'name': row[1],
-                'typeVersion': row[2],
-                'seen_parameters': set(json.loads(row[4])) if row[4] else set(),
-                'parameter_types': json.loads(row[5]) if row[5] else {},
-                'credentials': json.loads(row[6]) if row[6] else None,
-            }
-            self.node_usage_count[node_type] = row[3]
-
-        conn.close()
+        with self._lock:
+            # Read the version first: a commit landing during the SELECT is then picked up next time
+            self._data_version = data_version(self._conn)
+            rows = self._conn.execute('SELECT * FROM discovered_nodes').fetchall()
+
+            self.discovered_nodes.clear()
+            self.node_usage_count.clear()
+            for row in rows:
+                node_type = row[0]
+                self.discovered_nodes[node_type] = {
+                    'type': node_type,
+                    'name': row[1],
+                    'typeVersion': row[2],
+                    'seen_parameters': set(json.loads(row[4])) if row[4] else set(),
+                    'parameter_types': json.loads(row[5]) if row[5] else {},
+                    'credentials': json.loads(row[6]) if row[6] else None,
+                }
+                self.node_usage_count[node_type] = row[3]
+                if node_type not in self.node_categories:
+                    self.node_categories[node_type] = self._categorize_node(node_type)
 
     def _save_to_db(self):
-        """Save discovered nodes to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        for node_type, schema in self.discovered_nodes.items():
-            cursor.execute('''
-                INSERT OR REPLACE INTO discovered_nodes
-                (node_type, name, type_version, usage_count, parameters, parameter_types, credentials, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
+        """Write discovered nodes (inside the caller's transaction)"""
+        self._conn.executemany('''
+            INSERT OR REPLACE INTO discovered_nodes
+            (node_type, name, type_version, usage_count, parameters, parameter_types, credentials, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', [
+            (
                 node_type,
                 schema.get('name'),
                 schema.get('typeVersion', 1),
@@ -372,14 +412,19 @@ class NodeDiscovery:
                 json.dumps(list(schema.get('seen_parameters', []))),
                 json.dumps(schema.get('parameter_types', {})),
                 json.dumps(schema.get('credentials'))
-            ))
-
-        conn.commit()
-        conn.close()
+            )
+            for node_type, schema in self.discovered_nodes.items()
+        ])
 
     def save(self):
         """Manually save to database"""
-        self._save_to_db()
+        with self._lock, self._conn:
+            self._save_to_db()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
 
 class NodeRecommender:
@@ -488,6 +533,9 @@ class NodeRecommender:
         Returns:
             List of recommended nodes with scores
         """
+        # Pick up discoveries saved by other server processes
+        self.discovery.refresh()
+
         # Filter out stopwords and short words
         keywords = [
             word for word in task_description.lower().split()
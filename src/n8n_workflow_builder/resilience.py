@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Resilience Middleware
+Token-bucket rate limiting, retry with backoff and per-endpoint circuit breaking
+for requests to the n8n API, implemented as an httpx transport wrapper
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+from .deadlines import DeadlineExceeded, remaining
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Path segments that are followed by a resource ID in the n8n public API
+_ID_COLLECTIONS = {
+    "workflows", "executions", "node-types", "credentials", "tags",
+    "users", "projects", "variables",
+}
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Normalize a request into an endpoint name, e.g. ``GET /api/v1/workflows/{id}``"""
+    parts = path.strip("/").split("/")
+    for i in range(1, len(parts)):
+        if parts[i - 1] in _ID_COLLECTIONS and parts[i]:
+            parts[i] = "{id}"
+    return f"{method.upper()} /{'/'.join(parts)}"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while an endpoint's circuit is open"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for {endpoint} after repeated failures - retry in {retry_in:.1f}s"
+        )
+
+
+@dataclass
+class ResilienceConfig:
+    """Tuning for rate limiting, retries and circuit breaking"""
+    rate_limit_rps: float = 20.0       # 0 disables rate limiting
+    rate_limit_burst: int = 40
+    max_retries: int = 3
+    backoff_base: float = 0.5          # seconds; doubled per attempt
+    backoff_max: float = 30.0
+    retry_statuses: tuple = (429, 502, 503, 504)
+    circuit_failure_threshold: int = 5  # consecutive failures that open the circuit
+    circuit_reset_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> 'ResilienceConfig':
+        """Build config from N8N_RATE_LIMIT_* / N8N_RETRY_* / N8N_CIRCUIT_* variables"""
+        def env(name, cast, default):
+            value = os.getenv(name)
+            try:
+                return cast(value) if value else default
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+                return default
+
+        return cls(
+            rate_limit_rps=env("N8N_RATE_LIMIT_RPS", float, cls.rate_limit_rps),
+            rate_limit_burst=env("N8N_RATE_LIMIT_BURST", int, cls.rate_limit_burst),
+            max_retries=env("N8N_MAX_RETRIES", int, cls.max_retries),
+            backoff_base=env("N8N_RETRY_BACKOFF", float, cls.backoff_base),
+            backoff_max=env("N8N_RETRY_BACKOFF_MAX", float, cls.backoff_max),
+            circuit_failure_threshold=env("N8N_CIRCUIT_FAILURES", int, cls.circuit_failure_threshold),
+            circuit_reset_timeout=env("N8N_CIRCUIT_RESET", float, cls.circuit_reset_timeout),
+        )
+
+
+class TokenBucket:
+    """Async token bucket limiting the sustained request rate"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Take one token, waiting if necessary
+
+        Returns:
+            Seconds spent waiting (0 when a token was immediately available)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+
+            wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+            self.tokens = 0.0
+            self.updated_at = time.monotonic()
+            return wait
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker (closed -> open -> half-open -> closed)"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        # endpoint -> [consecutive_failures, opened_at or None]
+        self._circuits: Dict[str, list] = {}
+
+    def check(self, endpoint: str) -> None:
+        """Raise CircuitOpenError if the endpoint is open and not yet due for a probe"""
+        circuit = self._circuits.get(endpoint)
+        if not circuit or circuit[1] is None:
+            return
+        elapsed = time.monotonic() - circuit[1]
+        if elapsed < self.reset_timeout:
+            raise CircuitOpenError(endpoint, self.reset_timeout - elapsed)
+        # Half-open: let this request through as a probe; re-open immediately if it fails
+        circuit[0] = self.failure_threshold - 1
+        circuit[1] = None
+
+    def record_success(self, endpoint: str) -> None:
+        self._circuits.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        if self.failure_threshold <= 0:
+            return
+        circuit = self._circuits.setdefault(endpoint, [0, None])
+        circuit[0] += 1
+        if circuit[0] >= self.failure_threshold and circuit[1] is None:
+            circuit[1] = time.monotonic()
+            logger.warning(f"Circuit opened for {endpoint} after {circuit[0]} consecutive failures")
+
+    def get_state(self) -> Dict[str, str]:
+        """Current state of every endpoint that has seen failures"""
+        states = {}
+        for endpoint, (failures, opened_at) in self._circuits.items():
+            if opened_at is None:
+                states[endpoint] = f"closed ({failures} recent failures)"
+            elif time.monotonic() - opened_at < self.reset_timeout:
+                states[endpoint] = "open"
+            else:
+                states[endpoint] = "half-open"
+        return states
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _cap_timeouts(request: httpx.Request, endpoint: str) -> None:
+    """Shorten the request's httpx timeouts to the current deadline"""
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceeded(endpoint)
+    timeouts = request.extensions.get("timeout") or {}
+    request.extensions["timeout"] = {
+        key: left if value is None else min(value, left)
+        for key, value in {"connect": None, "read": None, "write": None, "pool": None, **timeouts}.items()
+    }
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """httpx transport wrapper adding rate limiting, retries and circuit breaking
+
+    - Every request takes a token from the bucket first (counted as throttled
+      when it had to wait).
+    - 429 responses are retried for any method; 502/503/504 and network errors
+      only for idempotent methods. Backoff is exponential with full jitter and
+      never shorter than the server's Retry-After; a Retry-After beyond
+      ``backoff_max`` returns the response instead of retrying early.
+    - Consecutive 5xx/network failures open the endpoint's circuit; requests to
+      an open circuit fail fast with CircuitOpenError until the reset timeout.
+    - Inside a tool call with a deadline, request timeouts are capped at the
+      time left and no retry is scheduled past it.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, config: Optional[ResilienceConfig] = None):
+        self.transport = transport
+        self.config = config or ResilienceConfig.from_env()
+        self.bucket = TokenBucket(self.config.rate_limit_rps, self.config.rate_limit_burst)
+        self.breaker = CircuitBreaker(self.config.circuit_failure_threshold, self.config.circuit_reset_timeout)
+        self.stats = {"requests": 0, "throttled": 0, "retried": 0, "short_circuited": 0}
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> Optional[float]:
+        """Delay before the next attempt, or None when Retry-After exceeds backoff_max"""
+        if retry_after is not None and retry_after > self.config.backoff_max:
+            return None
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _fits_deadline(self, delay: float) -> bool:
+        left = remaining()
+        return left is None or delay < left
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_key(request.method, request.url.path)
+        idempotent = request.method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+            try:
+                self.breaker.check(endpoint)
+            except CircuitOpenError:
+                self.stats["short_circuited"] += 1
+                raise
+
+            if await self.bucket.acquire() > 0:
+                self.stats["throttled"] += 1
+            _cap_timeouts(request, endpoint)
+            self.stats["requests"] += 1
+
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError:
+                self.breaker.record_failure(endpoint)
+                if not idempotent or attempt >= self.config.max_retries:
+                    raise
+                delay = self._backoff(attempt, None)
+                if not self._fits_deadline(delay):
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                self.stats["retried"] += 1
+                continue
+
+            status = response.status_code
+            if status >= 500:
+                self.breaker.record_failure(endpoint)
+            elif status != 429:
+                self.breaker.record_success(endpoint)
+
+            retryable = status in self.config.retry_statuses and (status == 429 or idempotent)
+            if not retryable or attempt >= self.config.max_retries:
+                return response
+
+            delay = self._backoff(attempt, _retry_after_seconds(response))
+            if delay is None or not self._fits_deadline(delay):
+                return response
+            logger.info(f"{endpoint} returned {status}, retrying in {delay:.2f}s (attempt {attempt + 1})")
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+            self.stats["retried"] += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def get_stats(self) -> Dict:
+        """Counters for throttled, retried and short-circuited requests"""
+        return {**self.stats, "circuits": self.breaker.get_state()}
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Background Scheduler Module
+In-process asyncio scheduler that keeps the template, node discovery and drift caches warm
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, TYPE_CHECKING
+
+from .deadlines import deadline_scope
+from .metrics import LatencyHistogram
+from .tracing import JOB, get_tracer
+
+if TYPE_CHECKING:
+    from .dependencies import Dependencies
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Default refresh interval per cache job, in seconds
+DEFAULT_INTERVALS = {
+    "template_sync": 6 * 3600.0,
+    "node_discovery": 3600.0,
+    "drift": 900.0,
+}
+
+
+@dataclass
+class SchedulerConfig:
+    """Intervals, jitter and limits for background cache refreshes
+
+    Off unless N8N_SCHEDULER opts in: a stdio server is spawned per client
+    session, so refreshing from every such process would multiply n8n load.
+    Enable it for long-lived sse/http servers.
+    """
+    enabled: bool = False
+    # Per-job intervals in seconds; 0 disables a job
+    intervals: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_INTERVALS))
+    jitter: float = 0.1                  # +/- fraction of the interval
+    max_concurrent: int = 1              # jobs running at once; others wait
+    startup_delay: float = 10.0          # seconds before the first runs
+    job_timeout: float = 600.0           # deadline for one job run; 0 disables
+    drift_workflow_limit: int = 25       # active workflows analyzed per drift run
+
+    @classmethod
+    def from_env(cls) -> 'SchedulerConfig':
+        """Build config from N8N_SCHEDULER* environment variables
+
+        N8N_SCHEDULER_INTERVALS takes comma-separated ``job=seconds`` pairs.
+        """
+        def env(name, cast, default):
+            value = os.getenv(name)
+            try:
+                return cast(value) if value else default
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+                return default
+
+        intervals = dict(DEFAULT_INTERVALS)
+        for entry in os.getenv("N8N_SCHEDULER_INTERVALS", "").split(","):
+            job, _, seconds = entry.strip().partition("=")
+            try:
+                if job and seconds:
+                    intervals[job] = float(seconds)
+            except ValueError:
+                logger.warning(f"Ignoring invalid N8N_SCHEDULER_INTERVALS entry {entry!r}")
+
+        return cls(
+            enabled=os.getenv("N8N_SCHEDULER", "off").lower() in ("1", "on", "true", "yes"),
+            intervals=intervals,
+            jitter=env("N8N_SCHEDULER_JITTER", float, cls.jitter),
+            max_concurrent=env("N8N_SCHEDULER_CONCURRENCY", int, cls.max_concurrent),
+            startup_delay=env("N8N_SCHEDULER_STARTUP_DELAY", float, cls.startup_delay),
+            job_timeout=env("N8N_SCHEDULER_JOB_TIMEOUT", float, cls.job_timeout),
+            drift_workflow_limit=env("N8N_DRIFT_REFRESH_LIMIT", int, cls.drift_workflow_limit),
+        )
+
+
+def _timestamp(epoch: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(epoch).isoformat(timespec="seconds") if epoch else None
+
+
+class Job:
+    """One periodic refresh and its run history"""
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]], interval: float, description: str = ""):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.description = description
+        self.runs = 0
+        self.failures = 0
+        self.running = False
+        self.last_started: Optional[float] = None
+        self.last_finished: Optional[float] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_result: Any = None
+        self.next_run: Optional[float] = None
+        self.latency = LatencyHistogram()
+        self._wake = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "description": self.description,
+            "enabled": self.enabled,
+            "interval_seconds": self.interval,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_started": _timestamp(self.last_started),
+            "last_finished": _timestamp(self.last_finished),
+            "last_duration_ms": round(self.last_duration_ms, 2) if self.last_duration_ms is not None else None,
+            "last_error": self.last_error,
+            "last_result": self.last_result,
+            "next_run": _timestamp(self.next_run),
+            "latency": self.latency.to_dict(),
+        }
+
+
+class BackgroundScheduler:
+    """Runs registered jobs periodically on the server's event loop
+
+    Each enabled job gets its own task that sleeps for the job's interval
+    (with jitter, so jobs and server replicas do not fire in lockstep) and
+    then runs it. A semaphore caps how many jobs run at once, every run is
+    bounded by ``job_timeout`` (propagated as a deadline to n8n requests
+    and analyzers) and traced as a ``job`` span. A failing run is logged
+    and retried at the next interval; it never stops the scheduler.
+
+    Example:
+        scheduler = BackgroundScheduler(SchedulerConfig.from_env())
+        scheduler.add_job("drift", refresh_drift)
+        scheduler.start()      # inside the running event loop
+        ...
+        await scheduler.stop()
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        self.config = config or SchedulerConfig.from_env()
+        self.jobs: Dict[str, Job] = {}
+        self.started = False
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: Optional[float] = None,
+        description: str = "",
+    ) -> Job:
+        """Register a job; ``interval`` defaults to the configured one for ``name``"""
+        if interval is None:
+            interval = self.config.intervals.get(name, 0.0)
+        job = Job(name, func, interval, description)
+        self.jobs[name] = job
+        if self.started and job.enabled:
+            self._spawn(self._loop(job), f"scheduler:{name}")
+        return job
+
+    def job_enabled(self, name: str) -> bool:
+        """Whether the job ``name`` runs periodically once the scheduler is started"""
+        return self.config.enabled and self.config.intervals.get(name, 0.0) > 0
+
+    def _spawn(self, coro: Awaitable, name: str) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        task.set_name(name)
+        # Keep a reference so running jobs are not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _jittered(self, seconds: float) -> float:
+        return max(0.0, seconds * (1 + random.uniform(-self.config.jitter, self.config.jitter)))
+
+    def start(self) -> None:
+        """Start the job loops (no-op when disabled or already started)"""
+        if self.started or not self.config.enabled:
+            return
+        self.started = True
+        for job in self.jobs.values():
+            if job.enabled:
+                self._spawn(self._loop(job), f"scheduler:{job.name}")
+        enabled = [job.name for job in self.jobs.values() if job.enabled]
+        logger.info(f"Background scheduler started: {', '.join(enabled) or 'no jobs enabled'}")
+
+    async def _loop(self, job: Job) -> None:
+        # Stagger the first runs so startup does not fire every job at once
+        delay = self.config.startup_delay * (1 + random.uniform(0, max(self.config.jitter, 0.5)))
+        while True:
+            job.next_run = time.time() + delay
+            try:
+                await asyncio.wait_for(job._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            job._wake.clear()
+            await self.run_job(job.name)
+            delay = self._jittered(job.interval)
+
+    async def run_job(self, name: str) -> bool:
+        """Run a job now and record its timings
+
+        Returns:
+            False if the job was already running (the run is skipped)
+
+        Raises:
+            KeyError: If no job has this name
+        """
+        job = self.jobs[name]
+        if job.running:
+            return False
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent))
+
+        job.running = True
+        try:
+            async with self._semaphore:
+                job.last_started = time.time()
+                started = time.perf_counter()
+                timeout = self.config.job_timeout if self.config.job_timeout > 0 else None
+                try:
+                    with get_tracer().span(name, JOB), deadline_scope(timeout):
+                        async with asyncio.timeout(timeout):
+                            job.last_result = await job.func()
+                    job.last_error = None
+                except Exception as e:
+                    job.failures += 1
+                    job.last_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+                    logger.warning(f"Background job {name} failed: {job.last_error}")
+                finally:
+                    job.runs += 1
+                    job.last_duration_ms = (time.perf_counter() - started) * 1000
+                    job.last_finished = time.time()
+                    job.latency.record(job.last_duration_ms)
+        finally:
+            job.running = False
+        return True
+
+    def trigger(self, name: str) -> None:
+        """Run a job as soon as possible without waiting for it
+
+        Raises:
+            KeyError: If no job has this name
+        """
+        job = self.jobs[name]
+        if self.started and job.enabled:
+            job._wake.set()
+        else:
+            self._spawn(self.run_job(name), f"scheduler:{name}:manual")
+
+    def status(self) -> Dict:
+        """Scheduler settings and per-job run history"""
+        return {
+            "enabled": self.config.enabled,
+            "started": self.started,
+            "max_concurrent": self.config.max_concurrent,
+            "jitter": self.config.jitter,
+            "jobs": {name: job.to_dict() for name, job in self.jobs.items()},
+        }
+
+    async def stop(self) -> None:
+        """Cancel job loops and running jobs"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.started = False
+
+
+# Cache refresh jobs
+
+async def refresh_templates(deps: 'Dependencies') -> Dict:
+    """Sync official templates into the template cache (a no-op while the last sync is fresh)"""
+    result = await deps.template_manager.sync_templates(source="n8n_official")
+    return {"templates": result["total_templates"], "errors": result["errors"]}
+
+
+async def refresh_node_discovery(deps: 'Dependencies') -> Dict:
+    """Re-learn node types and usage counts from every workflow"""
+    workflow_ids = [
+        workflow["id"] async for workflow in deps.client.iter_workflows()
+        if workflow.get("id")
+    ]
+    fetched, failed = {}, 0
+    async for workflow_id, workflow, error in deps.client.get_workflows_bulk(workflow_ids):
+        if error:
+            failed += 1
+            logger.debug(f"Node discovery could not load workflow {workflow_id}: {error}")
+        else:
+            fetched[workflow_id] = workflow
+    # Bulk results arrive in completion order; analyze in listing order
+    workflows = [fetched[workflow_id] for workflow_id in dict.fromkeys(workflow_ids) if workflow_id in fetched]
+
+    summary = deps.node_discovery.analyze_workflows(workflows, recount=True)
+    return {"workflows": len(workflows), "failed": failed, "node_types": summary["total_node_types"]}
+
+
+async def refresh_drift(deps: 'Dependencies', limit: int) -> Dict:
+    """Analyze execution drift of up to ``limit`` active workflows into the drift cache"""
+    from .drift.detector import DriftDetector
+
+    if deps.drift_cache is None:
+        raise RuntimeError("Drift cache is disabled: enable the scheduler (N8N_SCHEDULER=on) to keep it warm")
+    executor = deps.analyzer_executor
+    refreshed = skipped = 0
+    async for workflow in deps.client.iter_workflows(active_only=True):
+        if refreshed >= limit:
+            break
+        workflow_id = workflow.get("id")
+        if not workflow_id:
+            continue
+        executions = await deps.client.get_executions(workflow_id, limit=100)
+        if not executions or len(executions) < 2:
+            skipped += 1
+            continue
+        if executor is None:
+            analysis = DriftDetector.analyze_execution_history(executions)
+        else:
+            analysis = await executor.run(DriftDetector.analyze_execution_history, executions)
+        deps.drift_cache.put(workflow_id, analysis)
+        refreshed += 1
+    return {"workflows": refreshed, "insufficient_history": skipped}
+
+
+def register_cache_jobs(scheduler: BackgroundScheduler, deps: 'Dependencies') -> None:
+    """Register the template sync, node discovery and drift refresh jobs"""
+    scheduler.add_job(
+        "template_sync", lambda: refresh_templates(deps),
+        description="Sync n8n official templates into the template cache",
+    )
+    scheduler.add_job(
+        "node_discovery", lambda: refresh_node_discovery(deps),
+        description="Learn node types and usage from all workflows",
+    )
+    limit = scheduler.config.drift_workflow_limit
+    scheduler.add_job(
+        "drift", lambda: refresh_drift(deps, limit),
+        description=f"Analyze execution drift of up to {limit} active workflows",
+    )
@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 """
 RBAC Manager Module
-Role-Based Access Control for workflows
+Role-Based Access Control for workflows, stored in SQLite
 """
 import json
 import logging
+import os
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional
 from datetime import datetime
 
+from ..env import env_int
+from ..storage import connect_sqlite
+
 logger = logging.getLogger("n8n-workflow-builder")
 
+DEFAULT_AUDIT_RETENTION = 500
+
 
 class RBACManager:
     """Role-Based Access Control and Multi-Tenant Security Manager"""
@@ -77,19 +85,97 @@ class RBACManager:
         "state.clear"
     ]
 
-    def __init__(self, state_file: Path = None):
+    def __init__(
+        self,
+        state_file: Path = None,
+        db_path: Path = None,
+        audit_retention: Optional[int] = None,
+    ):
+        """
+        Args:
+            state_file: Legacy JSON state, imported once into a new database
+            db_path: SQLite database (defaults to N8N_RBAC_DB or ~/.n8n_rbac.db)
+            audit_retention: Audit entries kept (defaults to N8N_RBAC_AUDIT_RETENTION,
+                at least 1, or 500; pass 0 to keep everything)
+        """
         self.state_file = state_file or (Path.home() / ".n8n_rbac_state.json")
-        self.rbac_state = self._load_rbac_state()
-
-    def _load_rbac_state(self) -> Dict:
-        """Load RBAC state from file"""
+        if db_path is None:
+            db_path = os.getenv("N8N_RBAC_DB") or (
+                self.state_file.with_suffix(".db") if state_file else Path.home() / ".n8n_rbac.db"
+            )
+        self.db_path = Path(db_path).expanduser()
+        if audit_retention is None:
+            audit_retention = env_int("N8N_RBAC_AUDIT_RETENTION", DEFAULT_AUDIT_RETENTION, minimum=1)
+        self.audit_retention = audit_retention
+
+        # Handlers may run on worker threads; one connection serialized by a lock
+        self._lock = threading.RLock()
+        # WAL + busy timeout: several server processes may share the database
+        self.conn = connect_sqlite(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        """Create tables and indexes, seeding defaults into a new database"""
+        with self._lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS users (
+                    username TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    tenant_id TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS tenants (
+                    tenant_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS tenant_workflows (
+                    tenant_id TEXT NOT NULL,
+                    workflow_id TEXT NOT NULL,
+                    PRIMARY KEY (tenant_id, workflow_id)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS approvals (
+                    id TEXT PRIMARY KEY,
+                    username TEXT NOT NULL,
+                    operation TEXT NOT NULL,
+                    details TEXT,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    approved_by TEXT,
+                    approved_at TEXT,
+                    rejection_reason TEXT
+                );
+                CREATE TABLE IF NOT EXISTS audit_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    details TEXT
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_users_tenant ON users(tenant_id);
+                CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals(status, created_at);
+                CREATE INDEX IF NOT EXISTS idx_audit_username ON audit_log(username);
+                CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action);
+                CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp);
+            """)
+
+            # Take the write lock before checking, so only one process seeds
+            self.conn.execute("BEGIN IMMEDIATE")
+            if self.conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is None:
+                self._seed_state(self._load_legacy_state())
+
+    def _load_legacy_state(self) -> Dict:
+        """Load the JSON state used before the SQLite store, if there is one"""
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
-                    return json.load(f)
+                    state = json.load(f)
+                logger.info(f"Importing legacy RBAC state from {self.state_file}")
+                return state
             except Exception as e:
-                logger.warning(f"Could not load RBAC state: {e}")
-                return self._default_rbac_state()
+                logger.warning(f"Could not load legacy RBAC state: {e}")
         return self._default_rbac_state()
 
     def _default_rbac_state(self) -> Dict:
@@ -117,25 +203,53 @@ class RBACManager:
             "created_at": datetime.now().isoformat()
         }
 
-    def _save_rbac_state(self):
-        """Save RBAC state to file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.rbac_state, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save RBAC state: {e}")
+    def _seed_state(self, state: Dict):
+        """Write a state dict (default or legacy JSON) into the empty tables"""
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO users VALUES (:username, :role, :tenant_id, :created_at)",
+            state.get("users", {}).values(),
+        )
+        for tenant in state.get("tenants", {}).values():
+            self.conn.execute(
+                "INSERT OR IGNORE INTO tenants VALUES (?, ?, ?)",
+                (tenant["tenant_id"], tenant["name"], tenant["created_at"]),
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tenant_workflows VALUES (?, ?)",
+                [(tenant["tenant_id"], workflow_id) for workflow_id in tenant.get("workflows", [])],
+            )
+        for approval in state.get("pending_approvals", []):
+            self.conn.execute(
+                "INSERT OR IGNORE INTO approvals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (approval["id"], approval["username"], approval["operation"],
+                 json.dumps(approval.get("details")), approval["status"], approval["created_at"],
+                 approval.get("approved_by"), approval.get("approved_at"),
+                 approval.get("rejection_reason")),
+            )
+        self.conn.executemany(
+            "INSERT INTO audit_log (timestamp, username, action, details) VALUES (?, ?, ?, ?)",
+            [(entry["timestamp"], entry["username"], entry["action"], json.dumps(entry.get("details")))
+             for entry in state.get("audit_log", [])],
+        )
+        self._prune_audit_log()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def _get_user(self, username: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+        return dict(row) if row else None
 
     def check_permission(self, username: str, permission: str) -> bool:
         """Check if user has specific permission"""
-        user = self.rbac_state["users"].get(username)
-        if not user:
-            return False
-
-        role = user.get("role")
-        if role not in self.ROLES:
+        with self._lock:
+            row = self.conn.execute("SELECT role FROM users WHERE username = ?", (username,)).fetchone()
+        if not row:
             return False
 
-        return permission in self.ROLES[role]["permissions"]
+        return permission in ROLE_PERMISSIONS.get(row["role"], ())
 
     def require_approval(self, operation: str) -> bool:
         """Check if operation requires approval"""
@@ -144,19 +258,12 @@ class RBACManager:
     def create_approval_request(self, username: str, operation: str, details: Dict) -> str:
         """Create approval request for critical operation"""
         approval_id = f"approval-{datetime.now().timestamp()}"
-        approval = {
-            "id": approval_id,
-            "username": username,
-            "operation": operation,
-            "details": details,
-            "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "approved_by": None,
-            "approved_at": None
-        }
-
-        self.rbac_state["pending_approvals"].append(approval)
-        self._save_rbac_state()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO approvals (id, username, operation, details, status, created_at) "
+                "VALUES (?, ?, ?, ?, 'pending', ?)",
+                (approval_id, username, operation, json.dumps(details), datetime.now().isoformat()),
+            )
 
         self._audit_log(username, "approval_request_created", {
             "approval_id": approval_id,
@@ -165,8 +272,9 @@ class RBACManager:
 
         return approval_id
 
-    def approve_request(self, approval_id: str, approver: str) -> Dict:
-        """Approve a pending request"""
+    def _decide_approval(self, approval_id: str, decider: str, permission: str,
+                         status: str, reason: str = None) -> Dict:
+        """Move a pending approval to approved/rejected, checking who decides"""
         approval = self._find_approval(approval_id)
         if not approval:
             return {"success": False, "error": "Approval request not found"}
@@ -174,82 +282,85 @@ class RBACManager:
         if approval["status"] != "pending":
             return {"success": False, "error": f"Approval already {approval['status']}"}
 
-        # Check if approver has approval permission
-        if not self.check_permission(approver, "approval.approve"):
-            return {"success": False, "error": "Insufficient permissions to approve"}
+        verb = "approve" if status == "approved" else "reject"
+        if not self.check_permission(decider, permission):
+            return {"success": False, "error": f"Insufficient permissions to {verb}"}
 
         # Cannot approve own request
-        if approver == approval["username"]:
+        if status == "approved" and decider == approval["username"]:
             return {"success": False, "error": "Cannot approve your own request"}
 
-        approval["status"] = "approved"
-        approval["approved_by"] = approver
-        approval["approved_at"] = datetime.now().isoformat()
-
-        self._save_rbac_state()
-
-        self._audit_log(approver, "approval_approved", {
-            "approval_id": approval_id,
-            "requested_by": approval["username"],
-            "operation": approval["operation"]
-        })
-
+        decided_at = datetime.now().isoformat()
+        with self._lock, self.conn:
+            # Guarded on status so two concurrent decisions cannot both win
+            updated = self.conn.execute(
+                "UPDATE approvals SET status = ?, approved_by = ?, approved_at = ?, rejection_reason = ? "
+                "WHERE id = ? AND status = 'pending'",
+                (status, decider, decided_at, reason, approval_id),
+            ).rowcount
+        if not updated:
+            return {"success": False, "error": f"Approval already {self._find_approval(approval_id)['status']}"}
+
+        approval.update(status=status, approved_by=decider, approved_at=decided_at)
+        if status == "rejected":
+            approval["rejection_reason"] = reason
         return {"success": True, "approval": approval}
 
+    def approve_request(self, approval_id: str, approver: str) -> Dict:
+        """Approve a pending request"""
+        result = self._decide_approval(approval_id, approver, "approval.approve", "approved")
+        if result["success"]:
+            approval = result["approval"]
+            self._audit_log(approver, "approval_approved", {
+                "approval_id": approval_id,
+                "requested_by": approval["username"],
+                "operation": approval["operation"]
+            })
+        return result
+
     def reject_request(self, approval_id: str, rejector: str, reason: str = None) -> Dict:
         """Reject a pending request"""
-        approval = self._find_approval(approval_id)
-        if not approval:
-            return {"success": False, "error": "Approval request not found"}
-
-        if approval["status"] != "pending":
-            return {"success": False, "error": f"Approval already {approval['status']}"}
-
-        if not self.check_permission(rejector, "approval.reject"):
-            return {"success": False, "error": "Insufficient permissions to reject"}
-
-        approval["status"] = "rejected"
-        approval["approved_by"] = rejector
-        approval["approved_at"] = datetime.now().isoformat()
-        approval["rejection_reason"] = reason
-
-        self._save_rbac_state()
-
-        self._audit_log(rejector, "approval_rejected", {
-            "approval_id": approval_id,
-            "requested_by": approval["username"],
-            "operation": approval["operation"],
-            "reason": reason
-        })
-
-        return {"success": True, "approval": approval}
+        result = self._decide_approval(approval_id, rejector, "approval.reject", "rejected", reason)
+        if result["success"]:
+            approval = result["approval"]
+            self._audit_log(rejector, "approval_rejected", {
+                "approval_id": approval_id,
+                "requested_by": approval["username"],
+                "operation": approval["operation"],
+                "reason": reason
+            })
+        return result
+
+    @staticmethod
+    def _approval_from_row(row: sqlite3.Row) -> Dict:
+        approval = dict(row)
+        approval["details"] = json.loads(approval["details"]) if approval["details"] else approval["details"]
+        if approval["status"] != "rejected":
+            approval.pop("rejection_reason")
+        return approval
 
     def _find_approval(self, approval_id: str) -> Optional[Dict]:
         """Find approval request by ID"""
-        for approval in self.rbac_state["pending_approvals"]:
-            if approval["id"] == approval_id:
-                return approval
-        return None
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM approvals WHERE id = ?", (approval_id,)).fetchone()
+        return self._approval_from_row(row) if row else None
 
     def get_pending_approvals(self, username: str = None) -> List[Dict]:
         """Get pending approval requests"""
-        pending = [a for a in self.rbac_state["pending_approvals"] if a["status"] == "pending"]
+        query = "SELECT * FROM approvals WHERE status = 'pending'"
+        params: tuple = ()
 
-        if username:
-            # Return requests for this user or requests they can approve
-            can_approve = self.check_permission(username, "approval.approve")
-            if can_approve:
-                return pending
-            else:
-                return [a for a in pending if a["username"] == username]
+        if username and not self.check_permission(username, "approval.approve"):
+            # Users who cannot approve only see their own requests
+            query += " AND username = ?"
+            params = (username,)
 
-        return pending
+        with self._lock:
+            rows = self.conn.execute(query + " ORDER BY created_at", params).fetchall()
+        return [self._approval_from_row(row) for row in rows]
 
     def add_user(self, username: str, role: str, tenant_id: str = "default") -> Dict:
         """Add a new user"""
-        if username in self.rbac_state["users"]:
-            return {"success": False, "error": "User already exists"}
-
         if role not in self.ROLES:
             return {"success": False, "error": f"Invalid role: {role}"}
 
@@ -260,13 +371,11 @@ class RBACManager:
             "created_at": datetime.now().isoformat()
         }
 
-        self.rbac_state["users"][username] = user
-
-        # Add user to tenant
-        if tenant_id in self.rbac_state["tenants"]:
-            self.rbac_state["tenants"][tenant_id]["users"].append(username)
-
-        self._save_rbac_state()
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("INSERT INTO users VALUES (:username, :role, :tenant_id, :created_at)", user)
+        except sqlite3.IntegrityError:
+            return {"success": False, "error": "User already exists"}
 
         self._audit_log("system", "user_created", {
             "username": username,
@@ -278,9 +387,6 @@ class RBACManager:
 
     def create_tenant(self, tenant_id: str, name: str) -> Dict:
         """Create a new tenant"""
-        if tenant_id in self.rbac_state["tenants"]:
-            return {"success": False, "error": "Tenant already exists"}
-
         tenant = {
             "tenant_id": tenant_id,
             "name": name,
@@ -289,8 +395,13 @@ class RBACManager:
             "created_at": datetime.now().isoformat()
         }
 
-        self.rbac_state["tenants"][tenant_id] = tenant
-        self._save_rbac_state()
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT INTO tenants VALUES (?, ?, ?)", (tenant_id, name, tenant["created_at"])
+                )
+        except sqlite3.IntegrityError:
+            return {"success": False, "error": "Tenant already exists"}
 
         self._audit_log("system", "tenant_created", {
             "tenant_id": tenant_id,
@@ -301,63 +412,81 @@ class RBACManager:
 
     def check_tenant_access(self, username: str, workflow_id: str) -> bool:
         """Check if user has access to workflow based on tenant"""
-        user = self.rbac_state["users"].get(username)
-        if not user:
-            return False
-
-        tenant_id = user["tenant_id"]
-        tenant = self.rbac_state["tenants"].get(tenant_id)
-        if not tenant:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT u.role, EXISTS("
+                "  SELECT 1 FROM tenant_workflows w WHERE w.tenant_id = t.tenant_id AND w.workflow_id = ?"
+                ") AS registered "
+                "FROM users u JOIN tenants t ON t.tenant_id = u.tenant_id WHERE u.username = ?",
+                (workflow_id, username),
+            ).fetchone()
+        if not row:
             return False
 
         # Admin users can access all workflows
-        if user["role"] == "admin":
+        if row["role"] == "admin":
             return True
 
         # Check if workflow belongs to user's tenant
-        return workflow_id in tenant.get("workflows", [])
+        return bool(row["registered"])
 
     def register_workflow(self, workflow_id: str, tenant_id: str):
         """Register workflow to tenant"""
-        if tenant_id in self.rbac_state["tenants"]:
-            tenant = self.rbac_state["tenants"][tenant_id]
-            if workflow_id not in tenant["workflows"]:
-                tenant["workflows"].append(workflow_id)
-                self._save_rbac_state()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO tenant_workflows "
+                "SELECT tenant_id, ? FROM tenants WHERE tenant_id = ?",
+                (workflow_id, tenant_id),
+            )
+
+    def _prune_audit_log(self):
+        """Drop audit entries beyond the retention limit (a range delete on the primary key)"""
+        if self.audit_retention > 0:
+            self.conn.execute(
+                "DELETE FROM audit_log WHERE id <= (SELECT MAX(id) FROM audit_log) - ?",
+                (self.audit_retention,),
+            )
 
     def _audit_log(self, username: str, action: str, details: Dict):
         """Log security-relevant actions"""
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "username": username,
-            "action": action,
-            "details": details
-        }
-
-        self.rbac_state["audit_log"].append(log_entry)
-
-        # Keep last 500 entries
-        self.rbac_state["audit_log"] = self.rbac_state["audit_log"][-500:]
-
-        self._save_rbac_state()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO audit_log (timestamp, username, action, details) VALUES (?, ?, ?, ?)",
+                (datetime.now().isoformat(), username, action, json.dumps(details)),
+            )
+            self._prune_audit_log()
 
         logger.info(f"AUDIT: {username} - {action} - {details}")
 
     def get_audit_log(self, limit: int = 50, username: str = None, action: str = None) -> List[Dict]:
-        """Get audit log with filters"""
-        logs = self.rbac_state["audit_log"]
-
+        """Get audit log with filters (oldest first, like the log itself)"""
+        conditions, params = [], []
         if username:
-            logs = [l for l in logs if l["username"] == username]
-
+            conditions.append("username = ?")
+            params.append(username)
         if action:
-            logs = [l for l in logs if l["action"] == action]
-
-        return logs[-limit:]
+            conditions.append("action = ?")
+            params.append(action)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT timestamp, username, action, details FROM audit_log {where}"
+                "ORDER BY id DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+        logs = []
+        for row in reversed(rows):
+            entry = dict(row)
+            entry["details"] = json.loads(entry["details"]) if entry["details"] else entry["details"]
+            logs.append(entry)
+        return logs
 
     def get_user_info(self, username: str) -> Optional[Dict]:
         """Get user information"""
-        user = self.rbac_state["users"].get(username)
+        with self._lock:
+            user = self._get_user(username)
         if not user:
             return None
 
@@ -374,24 +503,28 @@ class RBACManager:
         report = "# 🔒 RBAC & Security Status\n\n"
 
         # Users summary
-        users = self.rbac_state["users"]
-        report += f"## 👥 Users: {len(users)}\n\n"
-        role_counts = {}
-        for user in users.values():
-            role = user["role"]
-            role_counts[role] = role_counts.get(role, 0) + 1
+        with self._lock:
+            role_counts = dict(self.conn.execute(
+                "SELECT role, COUNT(*) FROM users GROUP BY role ORDER BY MIN(rowid)"
+            ).fetchall())
+            tenants = self.conn.execute(
+                "SELECT t.tenant_id, t.name,"
+                " (SELECT COUNT(*) FROM users u WHERE u.tenant_id = t.tenant_id) AS users,"
+                " (SELECT COUNT(*) FROM tenant_workflows w WHERE w.tenant_id = t.tenant_id) AS workflows "
+                "FROM tenants t ORDER BY t.rowid"
+            ).fetchall()
+        report += f"## 👥 Users: {sum(role_counts.values())}\n\n"
 
         for role, count in role_counts.items():
             role_name = self.ROLES.get(role, {}).get("name", role)
             report += f"- **{role_name}**: {count} users\n"
 
         # Tenants summary
-        tenants = self.rbac_state["tenants"]
         report += f"\n## 🏢 Tenants: {len(tenants)}\n\n"
-        for tenant in tenants.values():
+        for tenant in tenants:
             report += f"- **{tenant['name']}** (`{tenant['tenant_id']}`)\n"
-            report += f"  - Users: {len(tenant['users'])}\n"
-            report += f"  - Workflows: {len(tenant['workflows'])}\n"
+            report += f"  - Users: {tenant['users']}\n"
+            report += f"  - Workflows: {tenant['workflows']}\n"
 
         # Pending approvals
         pending = self.get_pending_approvals()
@@ -408,3 +541,8 @@ class RBACManager:
 
         return report
 
+
+# Permission sets per role, so permission checks are hash lookups
+ROLE_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    role: frozenset(info["permissions"]) for role, info in RBACManager.ROLES.items()
+}
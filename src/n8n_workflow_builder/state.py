@@ -3,33 +3,160 @@
 State Management Module
 Manages persistent state for workflows and sessions
 """
+import atexit
 import json
 import logging
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from .storage import file_lock, file_stamp
+
 logger = logging.getLogger("n8n-workflow-builder")
 STATE_FILE = Path.home() / ".n8n_workflow_builder_state.json"
 
+# The journal lives next to the snapshot: <state file>.journal
+JOURNAL_SUFFIX = ".journal"
+FLUSH_INTERVAL_SECONDS = 1.0     # pending records are written at least this often
+FLUSH_BATCH_SIZE = 64            # ... or as soon as this many are pending
+COMPACT_AFTER_RECORDS = 500      # journal records before they are folded into the snapshot
+
+# Per-session fields: each process keeps its own when adopting another's writes
+SESSION_FIELDS = ("current_workflow_id", "current_workflow_name", "last_execution_id")
+
+# Persistent managers, flushed and compacted at interpreter exit
+_open_managers: "weakref.WeakSet[StateManager]" = weakref.WeakSet()
+
 
 class StateManager:
-    """Manages persistent state and context for workflow operations"""
+    """Manages persistent state and context for workflow operations
+
+    Pass ``state_file=None`` for an in-memory state that is never persisted.
+
+    State is kept in memory and persisted as a snapshot (``state_file``) plus
+    an append-only journal of compact JSON records. Mutations only update
+    memory and queue a journal record; a writer thread appends queued records
+    in batches (every ``flush_interval`` seconds or ``flush_batch`` records)
+    and periodically compacts the journal into a new snapshot, written to a
+    temp file and swapped in with ``os.replace``. Records carry a sequence
+    number and the snapshot remembers the last one it contains, so replaying
+    the journal after a crash never applies a record twice and a torn last
+    line is ignored.
+
+    Several server processes may share one state file. Writes happen under an
+    exclusive lock on ``<state file>.lock``; before writing, a process that
+    sees the files changed by another one reloads them and re-applies its own
+    unwritten mutations on top, so no process overwrites another's records.
+    The writer thread also picks up other processes' changes between writes.
+    Only the shared parts (recent workflows, session history) are adopted:
+    the current workflow and last execution (``SESSION_FIELDS``) stay those
+    of this process's own session.
+    """
+
+    def __init__(
+        self,
+        state_file: Optional[Path] = STATE_FILE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        flush_batch: int = FLUSH_BATCH_SIZE,
+        compact_after: int = COMPACT_AFTER_RECORDS,
+    ):
+        self.state_file = Path(state_file) if state_file is not None else None
+        self.journal_file = (
+            self.state_file.with_name(self.state_file.name + JOURNAL_SUFFIX)
+            if self.state_file is not None else None
+        )
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.compact_after = compact_after
+
+        self._seq = 0                  # sequence number of the last record on disk (or in a snapshot)
+        self._journal_records = 0      # records in the journal file
+        self._pending: List[Dict] = [] # records not yet written; numbered when written
+        self._disk_stamp: Any = None   # file_stamp of snapshot and journal as last seen
+        self._lock = threading.Lock()          # guards state, _seq and _pending
+        self._flush_lock = threading.Lock()    # serializes journal/snapshot writes
+        self._wake = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"records": 0, "flushes": 0, "compactions": 0, "reloads": 0}
 
-    def __init__(self, state_file: Path = STATE_FILE):
-        self.state_file = state_file
         self.state = self._load_state()
+        if self.state_file is not None:
+            _open_managers.add(self)
 
     def _load_state(self) -> Dict:
-        """Load state from file"""
+        """Load the snapshot, then replay journal records newer than it"""
+        if self.state_file is None:
+            return self._default_state()
+        if not self.state_file.exists() and not self.journal_file.exists():
+            self._disk_stamp = self._stamp()
+            return self._default_state()
+
+        # Shared lock: another process may be compacting
+        with file_lock(self.state_file, shared=True):
+            state, self._seq, self._journal_records = self._read_disk()
+            self._disk_stamp = self._stamp()
+        return state
+
+    def _read_disk(self) -> Tuple[Dict, int, int]:
+        """State, last sequence number and journal length as currently on disk"""
+        state = self._default_state()
+        seq = journal_records = 0
+
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
-                    return json.load(f)
+                    state = json.load(f)
+                seq = int(state.pop("journal_seq", 0))
             except Exception as e:
                 logger.warning(f"Could not load state file: {e}")
-                return self._default_state()
-        return self._default_state()
+                state = self._default_state()
+
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'r') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # Torn write from a crash: everything before it is intact
+                            logger.warning("Ignoring incomplete record at the end of the state journal")
+                            break
+                        journal_records += 1
+                        if record.get("seq", 0) <= seq:
+                            continue  # already part of the snapshot
+                        self._apply(state, record)
+                        seq = record["seq"]
+            except OSError as e:
+                logger.warning(f"Could not read state journal: {e}")
+        return state, seq, journal_records
+
+    def _stamp(self):
+        return file_stamp(self.state_file, self.journal_file)
+
+    def _reload_if_changed(self) -> bool:
+        """Adopt state written by other processes (call with the file lock held)
+
+        Mutations of this process that are not on disk yet are re-applied on
+        top, in the order they will be appended to the journal, and the
+        session-scoped fields keep this process's values.
+        """
+        if self._stamp() == self._disk_stamp:
+            return False
+        state, seq, journal_records = self._read_disk()
+        with self._lock:
+            for record in self._pending:
+                if "seq" not in record:
+                    self._apply(state, record)
+            for field in SESSION_FIELDS:
+                state[field] = self.state.get(field)
+            self.state, self._seq, self._journal_records = state, seq, journal_records
+        self._disk_stamp = self._stamp()
+        self.stats["reloads"] += 1
+        return True
 
     def _default_state(self) -> Dict:
         """Get default state structure"""
@@ -43,38 +170,195 @@ class StateManager:
             "last_updated": datetime.now().isoformat()
         }
 
-    def _save_state(self):
-        """Save state to file"""
+    def _apply(self, state: Dict, record: Dict) -> None:
+        """Apply one journal record to ``state`` (live and on replay)"""
+        op = record["op"]
+        if op == "workflow":
+            state["current_workflow_id"] = record["id"]
+            state["current_workflow_name"] = record["name"]
+
+            # Update recent workflows (keep last 10)
+            workflow_entry = {
+                "id": record["id"],
+                "name": record["name"],
+                "accessed_at": record["at"]
+            }
+            recent = [w for w in state["recent_workflows"] if w["id"] != record["id"]]
+            recent.insert(0, workflow_entry)
+            state["recent_workflows"] = recent[:10]
+        elif op == "execution":
+            state["last_execution_id"] = record["id"]
+        elif op == "action":
+            state["session_history"].append(record["entry"])
+            # Keep last 50 entries
+            if len(state["session_history"]) > 50:
+                del state["session_history"][:-50]
+        elif op == "clear":
+            state.clear()
+            state.update(self._default_state())
+            state["created_at"] = record["at"]
+        else:
+            logger.warning(f"Ignoring unknown state journal record {op!r}")
+            return
+        state["last_updated"] = record["at"]
+
+    def _record(self, op: str, **fields) -> None:
+        """Apply a mutation in memory and queue its journal record"""
+        record = {"op": op, "at": datetime.now().isoformat(), **fields}
+        with self._lock:
+            self._apply(self.state, record)
+            if self.state_file is None:
+                return
+            self._pending.append(record)
+            self.stats["records"] += 1
+            pending = len(self._pending)
+        if self._writer is None:
+            self._start_writer()
+        if pending >= self.flush_batch:
+            self._wake.set()
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None or self._closed:
+                return
+            self._writer = threading.Thread(target=self._run_writer, name="n8n-state-writer", daemon=True)
+        self._writer.start()
+
+    def _run_writer(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Could not save state: {e}")
+
+    def _number_pending(self) -> None:
+        """Give pending records their sequence numbers (call with _lock held)"""
+        for record in self._pending:
+            if "seq" not in record:
+                self._seq += 1
+                record["seq"] = self._seq
+
+    def flush(self) -> None:
+        """Append queued records to the journal, compacting it when it has grown
+
+        Also reloads the state if another process has changed the files.
+        """
+        if self.state_file is None:
+            return
+        with self._flush_lock:
+            with self._lock:
+                idle = not self._pending
+            if idle and self._stamp() == self._disk_stamp:
+                return
+            with file_lock(self.state_file):
+                self._reload_if_changed()
+                with self._lock:
+                    self._number_pending()
+                    records, self._pending = self._pending, []
+                if records:
+                    lines = [json.dumps(record, separators=(",", ":"), default=str) for record in records]
+                    self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._repair_journal_tail()
+                    with open(self.journal_file, 'a') as f:
+                        f.write("\n".join(lines) + "\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._journal_records += len(lines)
+                    self.stats["flushes"] += 1
+                if self._journal_records >= self.compact_after:
+                    self._compact_locked()
+                self._disk_stamp = self._stamp()
+
+    def _repair_journal_tail(self) -> None:
+        """Make the journal end with a complete line (call with the file lock held)
+
+        A crash mid-append leaves a partial last line without a newline;
+        appending to it would glue the next record onto it and replay would
+        stop there. The partial line is cut off. A last record that is
+        complete but lacks only its newline is kept and terminated.
+        """
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # Find the start of the unterminated last line
+            end = size
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    line_start = start + newline + 1
+                    break
+                end = start
+            else:
+                line_start = 0
+            f.seek(line_start)
+            try:
+                json.loads(f.read())
+            except ValueError:
+                logger.warning("Truncating incomplete record at the end of the state journal")
+                f.truncate(line_start)
+            else:
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and truncate it"""
+        if self.state_file is None:
+            return
+        with self._flush_lock, file_lock(self.state_file):
+            self._reload_if_changed()
+            self._compact_locked()
+            self._disk_stamp = self._stamp()
+
+    def _compact_locked(self) -> None:
+        with self._lock:
+            # Records still pending are covered by the snapshot: numbering them
+            # now keeps their seq <= journal_seq, so replay skips them once written
+            self._number_pending()
+            snapshot = json.dumps({**self.state, "journal_seq": self._seq}, separators=(",", ":"), default=str)
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        with open(temp_file, 'w') as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.state_file)
+        # Only now is it safe to drop the journal: a crash before this line
+        # replays it onto the new snapshot, skipping records it already holds
+        with open(self.journal_file, 'w'):
+            pass
+        self._journal_records = 0
+        self.stats["compactions"] += 1
+
+    def close(self) -> None:
+        """Stop the writer thread after writing everything and compacting"""
+        if self.state_file is None or self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
         try:
-            self.state["last_updated"] = datetime.now().isoformat()
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            self.flush()
+            if self._journal_records:
+                self.compact()
         except Exception as e:
-            logger.error(f"Could not save state file: {e}")
+            logger.error(f"Could not save state: {e}")
 
     def set_current_workflow(self, workflow_id: str, workflow_name: str):
         """Set the current active workflow"""
-        self.state["current_workflow_id"] = workflow_id
-        self.state["current_workflow_name"] = workflow_name
-
-        # Update recent workflows (keep last 10)
-        workflow_entry = {
-            "id": workflow_id,
-            "name": workflow_name,
-            "accessed_at": datetime.now().isoformat()
-        }
-
-        # Remove if already in list
-        self.state["recent_workflows"] = [
-            w for w in self.state["recent_workflows"]
-            if w["id"] != workflow_id
-        ]
-
-        # Add to front
-        self.state["recent_workflows"].insert(0, workflow_entry)
-        self.state["recent_workflows"] = self.state["recent_workflows"][:10]
-
-        self._save_state()
+        self._record("workflow", id=workflow_id, name=workflow_name)
         logger.info(f"Set current workflow: {workflow_name} ({workflow_id})")
 
     def get_current_workflow(self) -> Optional[Dict]:
@@ -88,8 +372,7 @@ class StateManager:
 
     def set_last_execution(self, execution_id: str):
         """Record last execution"""
-        self.state["last_execution_id"] = execution_id
-        self._save_state()
+        self._record("execution", id=execution_id)
 
     def get_last_execution(self) -> Optional[str]:
         """Get last execution ID"""
@@ -102,13 +385,7 @@ class StateManager:
             "action": action,
             "details": details or {}
         }
-
-        self.state["session_history"].append(entry)
-
-        # Keep last 50 entries
-        self.state["session_history"] = self.state["session_history"][-50:]
-
-        self._save_state()
+        self._record("action", entry=entry)
 
     def get_session_history(self, limit: int = 10) -> List[Dict]:
         """Get recent session history"""
@@ -120,8 +397,7 @@ class StateManager:
 
     def clear_state(self):
         """Clear all state"""
-        self.state = self._default_state()
-        self._save_state()
+        self._record("clear")
         logger.info("State cleared")
 
     def get_state_summary(self) -> str:
@@ -152,3 +428,58 @@ class StateManager:
 
         return summary
 
+
+
+class SessionStateManagers:
+    """StateManager stand-in that gives every MCP session its own state
+
+    Used when one server process serves many concurrent sessions over HTTP.
+    Attribute access is forwarded to the StateManager of the session making
+    the current request; managers are dropped when their session object is
+    garbage collected. Outside of a session (e.g. background jobs) the
+    shared ``default`` manager is used.
+
+    Args:
+        current_session: Returns the current session object, or None
+        default: Manager used when there is no current session
+        factory: Creates the manager for a new session (in-memory by default)
+    """
+
+    def __init__(
+        self,
+        current_session: Callable[[], Any],
+        default: StateManager,
+        factory: Callable[[], StateManager] = lambda: StateManager(state_file=None),
+    ):
+        self._current_session = current_session
+        self._default = default
+        self._factory = factory
+        self._managers: "weakref.WeakKeyDictionary[Any, StateManager]" = weakref.WeakKeyDictionary()
+
+    def current(self) -> StateManager:
+        """StateManager of the session handling the current request"""
+        session = self._current_session()
+        if session is None:
+            return self._default
+        manager = self._managers.get(session)
+        if manager is None:
+            manager = self._managers[session] = self._factory()
+        return manager
+
+    @property
+    def session_count(self) -> int:
+        return len(self._managers)
+
+    def close(self) -> None:
+        """Persist and close the default and every session's manager"""
+        for manager in [self._default, *list(self._managers.values())]:
+            manager.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.current(), name)
+
+
+@atexit.register
+def _close_open_managers() -> None:
+    for manager in list(_open_managers):
+        manager.close()
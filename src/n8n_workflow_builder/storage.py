@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Storage Coordination Module
+Cross-process file locks, SQLite connection settings and change detection for shared state
+"""
+import asyncio
+import os
+import sqlite3
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional, Tuple, Union
+
+from .env import env_int
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, locking degrades to a no-op
+    fcntl = None
+
+# How long a connection waits for another process's write lock before
+# raising "database is locked"
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+PathLike = Union[str, Path]
+
+
+def busy_timeout_ms() -> int:
+    """Busy timeout from N8N_SQLITE_BUSY_TIMEOUT (milliseconds)"""
+    return env_int("N8N_SQLITE_BUSY_TIMEOUT", DEFAULT_BUSY_TIMEOUT_MS)
+
+
+def connect_sqlite(path: PathLike, wal: bool = True) -> sqlite3.Connection:
+    """Open a SQLite database shared with other server processes
+
+    The connection may be used from worker threads (callers serialize access),
+    waits up to the busy timeout for other writers instead of failing with
+    "database is locked", and uses WAL so readers never block the writer.
+
+    Args:
+        path: Database file (":memory:" works, without WAL)
+        wal: Switch the database to WAL journaling with synchronous=NORMAL
+    """
+    timeout_ms = busy_timeout_ms()
+    conn = sqlite3.connect(str(path), timeout=timeout_ms / 1000, check_same_thread=False)
+    conn.execute(f"PRAGMA busy_timeout={timeout_ms}")
+    if wal:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def data_version(conn: sqlite3.Connection) -> int:
+    """Counter that changes whenever another connection commits to the database
+
+    Commits made through ``conn`` itself do not change it, so comparing it
+    with an earlier value tells whether another process wrote in between.
+    """
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def lock_path(path: PathLike) -> Path:
+    """Lock file guarding ``path``: ``<path>.lock`` next to it"""
+    path = Path(path)
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def file_lock(path: PathLike, shared: bool = False, blocking: bool = True) -> Iterator[None]:
+    """Hold an advisory lock on ``<path>.lock`` across processes
+
+    Exclusive by default; ``shared`` lets several readers hold it at once.
+    Every call opens its own descriptor, so the lock also excludes other
+    threads of the same process. From async code use ``async_file_lock``.
+
+    Raises:
+        BlockingIOError: If ``blocking`` is False and the lock is held elsewhere
+    """
+    if fcntl is None:
+        yield
+        return
+    target = lock_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(target, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        fcntl.flock(fd, flags if blocking else flags | fcntl.LOCK_NB)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+@asynccontextmanager
+async def async_file_lock(path: PathLike, poll_interval: float = 0.1) -> AsyncIterator[None]:
+    """``file_lock`` for the event loop: polls instead of blocking, so waiting stays cancellable"""
+    while True:
+        lock = file_lock(path, blocking=False)
+        try:
+            lock.__enter__()
+            break
+        except BlockingIOError:
+            await asyncio.sleep(poll_interval)
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
+
+
+FileStamp = Optional[Tuple[int, int, int]]
+
+
+def file_stamp(*paths: Optional[PathLike]) -> Tuple[FileStamp, ...]:
+    """Identity of files' current contents: (inode, mtime_ns, size) per path, None if missing
+
+    Atomic replacements change the inode and appends change the size, so an
+    unchanged stamp means no other process has rewritten or appended to them.
+    """
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path) if path is not None else None
+        except OSError:
+            stat = None
+        stamps.append((stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat else None)
+    return tuple(stamps)
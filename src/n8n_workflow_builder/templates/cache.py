@@ -12,6 +12,9 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import logging
 
+from ..storage import async_file_lock, connect_sqlite
+from ..tracing import traced
+
 logger = logging.getLogger("n8n-workflow-builder")
 
 
@@ -34,7 +37,8 @@ class TemplateCache:
             cache_path = cache_dir / "template_cache.db"
 
         self.cache_path = str(cache_path)
-        self.conn = sqlite3.connect(self.cache_path)
+        # Shared by every server process on the host: WAL + busy timeout
+        self.conn = connect_sqlite(self.cache_path)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
         self._init_schema()
 
@@ -273,6 +277,7 @@ class TemplateCache:
 
         return self._row_to_dict(row)
 
+    @traced("fts_search")
     def search(
         self,
         query: Optional[str] = None,
@@ -468,6 +473,14 @@ class TemplateCache:
         """Get templates using specific nodes"""
         return self.search(node_types=node_types, limit=limit)
 
+    def sync_lock(self):
+        """Async lock held while a source is synced into this cache
+
+        Serializes syncs across server processes; a process that waited finds
+        the sync status fresh and reuses the templates the other one fetched.
+        """
+        return async_file_lock(self.cache_path)
+
     def update_sync_status(self, source: str, template_count: int, success: bool = True, error: Optional[str] = None):
         """Update sync status for a source"""
         cursor = self.conn.cursor()
@@ -15,10 +15,43 @@ Enables:
 - "Show me templates from trusted sources"
 - "Which templates are most adapted?"
 """
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+import atexit
 import json
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+
+from ..storage import connect_sqlite, data_version
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+FLUSH_INTERVAL_SECONDS = 1.0     # dirty records are written at least this often
+FLUSH_BATCH_SIZE = 256           # ... or as soon as this many mutations are queued
+
+# get_top_templates sort keys -> indexed column
+SORT_COLUMNS = {
+    "trust": "overall_trust",
+    "usage": "usage_count",
+    "success_rate": "success_rate",
+    "rating": "rating_sort",
+}
+
+# Sort columns as computed for records held in memory
+SORT_KEYS = {
+    "overall_trust": lambda record: record.overall_trust_score,
+    "usage_count": lambda record: record.usage_count,
+    "success_rate": lambda record: record.success_rate,
+    "rating_sort": lambda record: record.rating or 0.0,
+}
+
+# Trackers with a store, flushed at interpreter exit
+_open_trackers: "weakref.WeakSet[ProvenanceTracker]" = weakref.WeakSet()
 
 
 @dataclass
@@ -99,110 +132,186 @@ class ProvenanceRecord:
 
 
 class ProvenanceTracker:
-    """Tracks template provenance and trust metrics"""
-
-    def __init__(self, storage_path: Optional[str] = None):
-        self.storage_path = storage_path
+    """Tracks template provenance and trust metrics
+
+    Records live in memory. With ``storage_path`` (or N8N_PROVENANCE_DB) they
+    are persisted row by row in SQLite: mutations are applied in memory and
+    queued, and a writer thread upserts the touched records in one transaction
+    every ``flush_interval`` seconds or once ``flush_batch`` mutations are
+    pending. Derived sort keys (overall trust, success rate) are stored as
+    indexed columns, so ``get_top_templates`` reads the top rows from an index.
+
+    Several server processes may share the store. Records another process
+    wrote are reloaded before reads and before every write (under the
+    database write lock), with still-queued mutations replayed on top, so
+    concurrent usage counts and adaptation logs add up instead of one
+    process's rows overwriting the other's.
+
+    A ``.json`` storage path from earlier versions is imported once into a
+    sibling ``.db`` file.
+    """
+
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        flush_batch: int = FLUSH_BATCH_SIZE,
+    ):
+        self.storage_path = storage_path or os.getenv("N8N_PROVENANCE_DB") or None
         self.records: Dict[str, ProvenanceRecord] = {}
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+
+        self.conn: Optional[sqlite3.Connection] = None
+        self._data_version = None
+        # Mutations applied in memory but not yet written: (apply, template_id, args)
+        self._pending: List[Tuple[Callable[..., bool], str, tuple]] = []
+        self._lock = threading.RLock()         # guards records and _pending
+        self._flush_lock = threading.Lock()    # serializes use of the connection
+        self._wake = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
 
         # Load existing records if storage exists
-        if storage_path:
+        if self.storage_path:
             self._load()
+            _open_trackers.add(self)
 
     def track_template(self, template_id: str, template_name: str, source: str, author: Optional[str] = None) -> ProvenanceRecord:
         """Start tracking a template"""
-        if template_id not in self.records:
-            record = ProvenanceRecord(
-                template_id=template_id,
-                template_name=template_name,
-                source=source,
-                author=author
-            )
-            self.records[template_id] = record
-            self._save()
-
+        self._mutate(self._apply_track, template_id, template_name, source, author, datetime.now())
         return self.records[template_id]
 
     def record_usage(self, template_id: str):
         """Record template usage"""
-        if template_id in self.records:
-            record = self.records[template_id]
-            record.usage_count += 1
-            record.last_used_at = datetime.now()
-            self._save()
+        self._mutate(self._apply_usage, template_id, datetime.now())
 
     def record_deployment(self, template_id: str):
         """Record template deployment"""
-        if template_id in self.records:
-            record = self.records[template_id]
-            record.deployment_count += 1
-            self._save()
+        self._mutate(self._apply_deployment, template_id)
 
     def record_adaptation(self, template_id: str, adaptation_description: str):
         """Record template adaptation"""
-        if template_id in self.records:
-            record = self.records[template_id]
-            record.adaptation_count += 1
-            record.adaptations.append({
-                "timestamp": datetime.now().isoformat(),
-                "description": adaptation_description
-            })
-            self._save()
+        self._mutate(self._apply_adaptation, template_id, adaptation_description, datetime.now())
 
     def record_execution(self, template_id: str, success: bool):
         """Record workflow execution result"""
-        if template_id in self.records:
-            record = self.records[template_id]
-            record.total_executions += 1
-
-            if success:
-                record.successful_executions += 1
-            else:
-                record.failed_executions += 1
-
-            # Update reliability score based on recent success rate
-            record.reliability_score = record.success_rate
-
-            self._save()
+        self._mutate(self._apply_execution, template_id, success)
 
     def update_trust_score(self, template_id: str, score: float):
         """Update trust score (manual adjustment)"""
-        if template_id in self.records:
-            record = self.records[template_id]
-            record.trust_score = max(0.0, min(1.0, score))
-            self._save()
+        self._mutate(self._apply_trust_score, template_id, score)
 
     def update_security_score(self, template_id: str, has_vulnerabilities: bool):
         """Update security score based on analysis"""
-        if template_id in self.records:
-            record = self.records[template_id]
-
-            if has_vulnerabilities:
-                record.security_score = max(0.0, record.security_score - 0.2)
-            else:
-                record.security_score = min(1.0, record.security_score + 0.1)
-
-            self._save()
+        self._mutate(self._apply_security_score, template_id, has_vulnerabilities)
 
     def add_rating(self, template_id: str, rating: float):
         """Add user rating (0.0-5.0)"""
-        if template_id in self.records:
-            record = self.records[template_id]
-
-            # Calculate new average rating
-            total_rating = (record.rating or 0.0) * record.rating_count
-            total_rating += rating
-            record.rating_count += 1
-            record.rating = total_rating / record.rating_count
-
-            # Influence trust score
-            normalized_rating = rating / 5.0  # Normalize to 0.0-1.0
-            record.trust_score = (record.trust_score + normalized_rating) / 2
-
-            self._save()
+        self._mutate(self._apply_rating, template_id, rating)
+
+    # Mutations: each applies to a records dict and returns whether it did, so
+    # queued ones can be replayed on records reloaded from the store
+
+    @staticmethod
+    def _apply_track(records: Dict[str, ProvenanceRecord], template_id: str, template_name: str, source: str,
+                     author: Optional[str], created_at: datetime) -> bool:
+        if template_id in records:
+            return False
+        records[template_id] = ProvenanceRecord(
+            template_id=template_id,
+            template_name=template_name,
+            source=source,
+            author=author,
+            created_at=created_at
+        )
+        return True
+
+    @staticmethod
+    def _apply_usage(records: Dict[str, ProvenanceRecord], template_id: str, used_at: datetime) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+        record.usage_count += 1
+        record.last_used_at = used_at
+        return True
+
+    @staticmethod
+    def _apply_deployment(records: Dict[str, ProvenanceRecord], template_id: str) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+        record.deployment_count += 1
+        return True
+
+    @staticmethod
+    def _apply_adaptation(records: Dict[str, ProvenanceRecord], template_id: str, adaptation_description: str, timestamp: datetime) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+        record.adaptation_count += 1
+        record.adaptations.append({
+            "timestamp": timestamp.isoformat(),
+            "description": adaptation_description
+        })
+        return True
+
+    @staticmethod
+    def _apply_execution(records: Dict[str, ProvenanceRecord], template_id: str, success: bool) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+        record.total_executions += 1
+
+        if success:
+            record.successful_executions += 1
+        else:
+            record.failed_executions += 1
+
+        # Update reliability score based on recent success rate
+        record.reliability_score = record.success_rate
+        return True
+
+    @staticmethod
+    def _apply_trust_score(records: Dict[str, ProvenanceRecord], template_id: str, score: float) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+        record.trust_score = max(0.0, min(1.0, score))
+        return True
+
+    @staticmethod
+    def _apply_security_score(records: Dict[str, ProvenanceRecord], template_id: str, has_vulnerabilities: bool) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+
+        if has_vulnerabilities:
+            record.security_score = max(0.0, record.security_score - 0.2)
+        else:
+            record.security_score = min(1.0, record.security_score + 0.1)
+        return True
+
+    @staticmethod
+    def _apply_rating(records: Dict[str, ProvenanceRecord], template_id: str, rating: float) -> bool:
+        record = records.get(template_id)
+        if record is None:
+            return False
+
+        # Calculate new average rating
+        total_rating = (record.rating or 0.0) * record.rating_count
+        total_rating += rating
+        record.rating_count += 1
+        record.rating = total_rating / record.rating_count
+
+        # Influence trust score
+        normalized_rating = rating / 5.0  # Normalize to 0.0-1.0
+        record.trust_score = (record.trust_score + normalized_rating) / 2
+        return True
 
     def get_record(self, template_id: str) -> Optional[ProvenanceRecord]:
         """Get provenance record"""
+        self.refresh()
         return self.records.get(template_id)
 
     def get_top_templates(self, limit: int = 10, sort_by: str = "trust") -> List[ProvenanceRecord]:
@@ -213,6 +322,10 @@ class ProvenanceTracker:
             limit: Number of templates to return
             sort_by: "trust", "usage", "success_rate", "rating"
         """
+        if self.conn is not None and sort_by in SORT_COLUMNS:
+            return self._query_top(limit, SORT_COLUMNS[sort_by])
+
+        self.refresh()
         records = list(self.records.values())
 
         if sort_by == "trust":
@@ -228,6 +341,7 @@ class ProvenanceTracker:
 
     def get_statistics(self) -> Dict:
         """Get overall statistics"""
+        self.refresh()
         records = list(self.records.values())
 
         if not records:
@@ -286,46 +400,229 @@ class ProvenanceTracker:
 
     def filter_trusted(self, min_trust_score: float = 0.7) -> List[ProvenanceRecord]:
         """Get templates above minimum trust threshold"""
+        self.refresh()
         return [
             record for record in self.records.values()
             if record.overall_trust_score >= min_trust_score
         ]
 
-    def _save(self):
-        """Save records to storage"""
-        if not self.storage_path:
+    def _mutate(self, apply: Callable[..., bool], template_id: str, *args):
+        """Apply a mutation in memory and queue it for the next batched write"""
+        with self._lock:
+            if not apply(self.records, template_id, *args) or self.conn is None:
+                return
+            self._pending.append((apply, template_id, args))
+            pending = len(self._pending)
+        if self._writer is None:
+            self._start_writer()
+        if pending >= self.flush_batch:
+            self._wake.set()
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is not None or self._closed:
+                return
+            self._writer = threading.Thread(target=self._run_writer, name="n8n-provenance-writer", daemon=True)
+        self._writer.start()
+
+    def _run_writer(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error saving provenance data: {e}")
+
+    def refresh(self) -> bool:
+        """Reload records if another process wrote to the store since we last read it
+
+        Returns:
+            True if the records were reloaded
+        """
+        if self.conn is None:
+            return False
+        with self._flush_lock:
+            return self._reload_if_changed()
+
+    def _reload_if_changed(self) -> bool:
+        """Reload from the store and replay queued mutations (caller holds _flush_lock)"""
+        if data_version(self.conn) == self._data_version:
+            return False
+        records = self._read_records()
+        with self._lock:
+            for apply, template_id, args in self._pending:
+                apply(records, template_id, *args)
+            self.records = records
+        return True
+
+    def flush(self):
+        """Upsert the records touched by queued mutations in one transaction"""
+        if self.conn is None:
             return
-
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+            # Hold the write lock from reload to commit, so no other process
+            # writes between reading its rows and upserting ours
+            self.conn.execute("BEGIN IMMEDIATE")
+            ops = []
+            try:
+                self._reload_if_changed()
+                with self._lock:
+                    ops, self._pending = self._pending, []
+                    # First-touched order, so new rows keep creation order
+                    touched = dict.fromkeys(template_id for _, template_id, _ in ops)
+                    rows = [self._record_row(self.records[template_id]) for template_id in touched]
+                self.conn.executemany(self._upsert_sql, rows)
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                # Keep them queued so the next flush retries
+                with self._lock:
+                    self._pending = ops + self._pending
+                raise
+
+    def close(self):
+        """Stop the writer thread after writing every dirty record"""
+        if self.conn is None or self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
         try:
-            data = {
-                template_id: self._serialize_record(record)
-                for template_id, record in self.records.items()
-            }
-
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-
+            self.flush()
         except Exception as e:
-            print(f"Error saving provenance data: {e}")
+            logger.error(f"Error saving provenance data: {e}")
+        self.conn.close()
+        self.conn = None
+
+    def _open_store(self, db_path: str):
+        """Open the SQLite store and create the table and sort indexes"""
+        self.conn = connect_sqlite(db_path)
+        self.conn.row_factory = sqlite3.Row
+
+        columns = [field.name for field in fields(ProvenanceRecord)] + ["overall_trust", "success_rate", "rating_sort"]
+        self._columns = columns
+        self._upsert_sql = (
+            f"INSERT INTO provenance ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(template_id) DO UPDATE SET "
+            + ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        )
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS provenance ("
+                "template_id TEXT PRIMARY KEY, "
+                + ", ".join(columns[1:])
+                + ")"
+            )
+            for column in SORT_COLUMNS.values():
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_provenance_{column} ON provenance({column} DESC)")
+
+    def _record_row(self, record: ProvenanceRecord) -> tuple:
+        """Column values for one record, including the derived sort keys"""
+        data = self._serialize_record(record)
+        data["adaptations"] = json.dumps(data["adaptations"], default=str)
+        data["overall_trust"] = record.overall_trust_score
+        data["success_rate"] = record.success_rate
+        data["rating_sort"] = record.rating or 0.0
+        return tuple(data[column] for column in self._columns)
+
+    def _query_top(self, limit: int, column: str) -> List[ProvenanceRecord]:
+        """Top records by an indexed sort column
+
+        Rows are read from the index and turned into records directly. Records
+        with queued mutations are taken from memory instead and merged in, so
+        a read never writes.
+        """
+        with self._flush_lock:
+            with self._lock:
+                dirty = list(dict.fromkeys(template_id for _, template_id, _ in self._pending))
+            if dirty:
+                # Replay the queued mutations on top of rows other processes wrote
+                self._reload_if_changed()
+            # Dirty rows are replaced below, so read enough to fill the page without them
+            rows = self.conn.execute(
+                f"SELECT rowid, {', '.join(self._columns[:-3])} FROM provenance "
+                f"ORDER BY {column} DESC, rowid LIMIT ?",
+                (limit + len(dirty),)
+            ).fetchall()
+            rowids = {}
+            if dirty:
+                rowids = {
+                    row["template_id"]: row["rowid"]
+                    for row in self.conn.execute(
+                        f"SELECT template_id, rowid FROM provenance "
+                        f"WHERE template_id IN ({', '.join('?' for _ in dirty)})",
+                        dirty
+                    )
+                }
+
+        dirty_ids = set(dirty)
+        ranked = [(row["rowid"], self._row_record(row)) for row in rows if row["template_id"] not in dirty_ids]
+        with self._lock:
+            # Records not yet stored sort after stored ones on ties, in creation order
+            ranked += [
+                (rowids.get(template_id, float("inf")), self.records[template_id])
+                for template_id in dirty if template_id in self.records
+            ]
+        sort_key = SORT_KEYS[column]
+        ranked.sort(key=lambda item: (-sort_key(item[1]), item[0]))
+        return [record for _, record in ranked[:limit]]
 
     def _load(self):
         """Load records from storage"""
         if not self.storage_path:
             return
 
+        path = Path(self.storage_path).expanduser()
+        legacy_path = path if path.suffix == ".json" else None
+        db_path = path.with_suffix(".db") if legacy_path else path
+
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+            self._open_store(str(db_path))
+            self.records = self._read_records()
+        except Exception as e:
+            logger.error(f"Error loading provenance data: {e}")
+            return
 
+        if not self.records and legacy_path is not None and legacy_path.exists():
+            self._import_legacy(legacy_path)
+
+    def _read_records(self) -> Dict[str, ProvenanceRecord]:
+        """Every stored record, in creation order"""
+        self._data_version = data_version(self.conn)
+        rows = self.conn.execute(f"SELECT {', '.join(self._columns[:-3])} FROM provenance ORDER BY rowid").fetchall()
+        records = {}
+        for row in rows:
+            record = self._row_record(row)
+            records[record.template_id] = record
+        return records
+
+    def _row_record(self, row: sqlite3.Row) -> ProvenanceRecord:
+        """Build a record from a stored row (extra columns such as rowid are ignored)"""
+        data = {column: row[column] for column in self._columns[:-3]}
+        data["adaptations"] = json.loads(data["adaptations"]) if data["adaptations"] else []
+        for flag in ("has_error_handling", "has_documentation", "has_tests", "uses_best_practices"):
+            data[flag] = bool(data[flag])
+        return self._deserialize_record(data)
+
+    def _import_legacy(self, legacy_path: Path):
+        """Import records from the JSON file written by earlier versions"""
+        try:
+            with open(legacy_path, 'r') as f:
+                data = json.load(f)
             self.records = {
                 template_id: self._deserialize_record(record_data)
                 for template_id, record_data in data.items()
             }
-
-        except FileNotFoundError:
-            pass  # No existing data
+            logger.info(f"Importing {len(self.records)} provenance records from {legacy_path}")
+            with self._flush_lock, self.conn:
+                self.conn.executemany(self._upsert_sql, [self._record_row(r) for r in self.records.values()])
         except Exception as e:
-            print(f"Error loading provenance data: {e}")
+            logger.error(f"Error loading provenance data: {e}")
 
     def _serialize_record(self, record: ProvenanceRecord) -> Dict:
         """Serialize record to dict"""
@@ -354,5 +651,9 @@ class ProvenanceTracker:
         return ProvenanceRecord(**data)
 
 
-# Global singleton provenance tracker instance
-provenance_tracker = ProvenanceTracker()
+def _close_open_trackers():
+    for tracker in list(_open_trackers):
+        tracker.close()
+
+
+atexit.register(_close_open_trackers)
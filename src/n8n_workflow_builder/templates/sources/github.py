@@ -1,11 +1,11 @@
 """GitHub Template Source"""
-import httpx
 import json
 import base64
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 from .base import TemplateSource, TemplateMetadata
+from ...http_pool import get_http_pool
 
 logger = logging.getLogger("n8n-workflow-builder")
 
@@ -26,7 +26,7 @@ class GitHubSource(TemplateSource):
         self.repos = repos or []
         self.github_token = github_token
         self.cache: Dict[str, TemplateMetadata] = {}
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_http_pool().client()
 
         self.headers = {"Accept": "application/vnd.github+json"}
         if github_token:
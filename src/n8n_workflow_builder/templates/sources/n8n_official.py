@@ -1,9 +1,9 @@
 """N8n Official Template Source"""
-import httpx
 from typing import List, Dict, Optional
 from datetime import datetime
 from .base import TemplateSource, TemplateMetadata
 from ..cache import TemplateCache
+from ...http_pool import get_http_pool
 
 
 class N8nOfficialSource(TemplateSource):
@@ -14,7 +14,7 @@ class N8nOfficialSource(TemplateSource):
         self.base_url = "https://api.n8n.io/api/templates"
         self.cache: Dict[str, TemplateMetadata] = {}  # In-memory cache for current session
         self.persistent_cache = TemplateCache(cache_path)  # SQLite persistent cache
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_http_pool().client()
 
     async def fetch_templates(self) -> List[TemplateMetadata]:
         """Fetch all official n8n templates (with smart caching)"""
@@ -50,15 +50,17 @@ class TemplateManager:
         # Handle n8n_official source
         if source in ["all", "n8n_official"]:
             try:
-                # Force sync by clearing sync status if needed
-                if force:
-                    # Delete sync status to force re-sync
-                    cursor = self.cache.conn.cursor()
-                    cursor.execute("DELETE FROM sync_status WHERE source = ?", ("n8n_official",))
-                    self.cache.conn.commit()
-
-                # Fetch templates (will sync if needed)
-                templates = await self.n8n_source.fetch_templates()
+                # One process syncs at a time; the others then read its result
+                async with self.cache.sync_lock():
+                    # Force sync by clearing sync status if needed
+                    if force:
+                        # Delete sync status to force re-sync
+                        cursor = self.cache.conn.cursor()
+                        cursor.execute("DELETE FROM sync_status WHERE source = ?", ("n8n_official",))
+                        self.cache.conn.commit()
+
+                    # Fetch templates (will sync if needed)
+                    templates = await self.n8n_source.fetch_templates()
 
                 results["synced_sources"].append("n8n_official")
                 results["total_templates"] += len(templates)
@@ -68,14 +70,15 @@ class TemplateManager:
         # Handle github source
         if source in ["all", "github"]:
             try:
-                # Force sync by clearing sync status if needed
-                if force:
-                    cursor = self.cache.conn.cursor()
-                    cursor.execute("DELETE FROM sync_status WHERE source = ?", ("github",))
-                    self.cache.conn.commit()
-
-                # Fetch templates from configured GitHub repos
-                templates = await self.github_source.fetch_templates()
+                async with self.cache.sync_lock():
+                    # Force sync by clearing sync status if needed
+                    if force:
+                        cursor = self.cache.conn.cursor()
+                        cursor.execute("DELETE FROM sync_status WHERE source = ?", ("github",))
+                        self.cache.conn.commit()
+
+                    # Fetch templates from configured GitHub repos
+                    templates = await self.github_source.fetch_templates()
 
                 results["synced_sources"].append("github")
                 results["total_templates"] += len(templates)
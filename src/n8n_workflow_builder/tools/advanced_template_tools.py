@@ -247,7 +247,6 @@ class AdvancedTemplateTools(BaseTool):
         from ..templates.sources.base import TemplateMetadata
         from ..templates.matcher import TemplateMatcher
         from ..templates.sources.registry import template_registry
-        from ..templates.provenance import provenance_tracker
         
         description = arguments["description"]
         top_k = arguments.get("top_k", 5)
@@ -290,7 +289,7 @@ class AdvancedTemplateTools(BaseTool):
             result += "\n"
             
             # Track usage
-            provenance_tracker.record_usage(template.id)
+            self.deps.provenance_tracker.record_usage(template.id)
         
         return [TextContent(type="text", text=result)]
     
@@ -306,7 +305,7 @@ class AdvancedTemplateTools(BaseTool):
         from ..templates.sources.base import TemplateMetadata
         from ..templates.sources.registry import template_registry
         from ..templates.intent_extractor import TemplateIntentExtractor
-        from ..server import WORKFLOW_TEMPLATES
+        from ..templates.recommender import WORKFLOW_TEMPLATES
         
         template_id = arguments["template_id"]
         
@@ -405,7 +404,6 @@ class AdvancedTemplateTools(BaseTool):
         """
         from ..templates.sources.registry import template_registry
         from ..templates.adapter import template_adapter
-        from ..templates.provenance import provenance_tracker
         
         template_id = arguments["template_id"]
         replacements = arguments.get("replacements", {})
@@ -448,7 +446,7 @@ class AdvancedTemplateTools(BaseTool):
         result += f"```json\n{json.dumps(adapted_workflow, indent=2)}\n```\n"
         
         # Track adaptation
-        provenance_tracker.record_adaptation(template_id, ", ".join(adaptation_log))
+        self.deps.provenance_tracker.record_adaptation(template_id, ", ".join(adaptation_log))
         
         return [TextContent(type="text", text=result)]
     
@@ -462,7 +460,6 @@ class AdvancedTemplateTools(BaseTool):
             Provenance tracking information
         """
         from ..templates.sources.registry import template_registry
-        from ..templates.provenance import provenance_tracker
         
         template_id = arguments["template_id"]
         
@@ -473,6 +470,7 @@ class AdvancedTemplateTools(BaseTool):
             return [TextContent(type="text", text=f"Template {template_id} not found")]
         
         # Get or create provenance record
+        provenance_tracker = self.deps.provenance_tracker
         record = provenance_tracker.get_record(template_id)
         
         if not record:
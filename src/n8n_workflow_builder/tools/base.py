@@ -2,10 +2,14 @@
 """
 Base classes and error handling for MCP tools
 """
-from typing import Any, TYPE_CHECKING, Optional
+from typing import Any, Callable, TYPE_CHECKING, Optional
 from dataclasses import dataclass, field
 import json
 
+from mcp.types import TextContent
+
+from ..tracing import ANALYZER, get_tracer
+
 if TYPE_CHECKING:
     from ..dependencies import Dependencies
 
@@ -94,6 +98,10 @@ class ToolResult:
         if self.metadata:
             result["metadata"] = self.metadata
         return result
+    
+    def to_json(self) -> str:
+        """Convert to compact JSON string (for format="json" tool output)"""
+        return json.dumps(self.to_dict(), separators=(",", ":"), default=str)
 
 
 class BaseTool:
@@ -123,6 +131,64 @@ class BaseTool:
         """
         raise NotImplementedError(f"Tool handler must implement handle() method")
     
+    async def _run_analyzer(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a synchronous, CPU-bound analyzer without blocking the event loop
+        
+        Uses the analyzer executor when one is configured and calls ``func``
+        inline otherwise. Pass plain data (workflow/execution dicts) so the
+        call also works with a process pool. The run is traced as an
+        ``analyzer`` span named after ``func``.
+        
+        Args:
+            func: Analyzer callable (static method, function or bound method)
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            The analyzer's return value
+        """
+        executor = self.deps.analyzer_executor
+        name = getattr(func, "__qualname__", repr(func))
+        with get_tracer().span(name, ANALYZER):
+            if executor is None:
+                return func(*args, **kwargs)
+            return await executor.run(func, *args, **kwargs)
+    
+    def _wants_json(self, arguments: dict) -> bool:
+        """Whether the caller asked for machine-readable output (format="json")"""
+        return arguments.get("format") == "json"
+    
+    def _json_result(self, data: Any, **metadata) -> ToolResult:
+        """Return structured data for format="json", skipping markdown rendering
+        
+        The registry serializes the result as compact JSON.
+        
+        Args:
+            data: JSON-serializable result (usually the analyzer's dict)
+            **metadata: Additional metadata (e.g. counts, cursors)
+            
+        Returns:
+            ToolResult holding ``data`` and ``metadata``
+        """
+        return self._success(data, **metadata)
+    
+    def _notice(self, arguments: dict, text: str) -> Any:
+        """Return a prose notice (e.g. "insufficient execution history")
+        
+        For format="json" the notice becomes the ``message`` of a ToolResult
+        with no data, so JSON callers always get a ToolResult.
+        
+        Args:
+            arguments: Tool call arguments
+            text: Notice shown to markdown callers
+            
+        Returns:
+            ToolResult for format="json", else a single TextContent
+        """
+        if self._wants_json(arguments):
+            return self._success(None, message=text)
+        return [TextContent(type="text", text=text)]
+    
     def _error(self, code: str, message: str, **details) -> ToolErrorResponse:
         """Helper to create ToolErrorResponse
         
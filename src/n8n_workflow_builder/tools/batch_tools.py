@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Batch Tool Handlers
+Runs many independent tool calls concurrently in a single MCP round trip
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+
+from mcp.types import TextContent
+
+from .base import BaseTool, ToolError
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+MAX_BATCH_CALLS = 50
+DEFAULT_BATCH_CONCURRENCY = 8
+MAX_BATCH_CONCURRENCY = 16
+
+
+class BatchTools(BaseTool):
+    """Handler for the batch_call meta-tool"""
+
+    async def handle(self, name: str, arguments: dict) -> list[TextContent]:
+        """Route batch tool calls to appropriate handler methods
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            List of TextContent responses
+        """
+        handlers = {
+            "batch_call": self.batch_call,
+        }
+
+        handler = handlers.get(name)
+        if not handler:
+            raise ToolError("UNKNOWN_TOOL", f"Tool '{name}' not found in batch tools")
+
+        return await handler(arguments)
+
+    async def batch_call(self, arguments: dict) -> list[TextContent]:
+        """Run a list of tool calls concurrently and return all results together
+
+        Every call goes through the server's normal dispatch (argument
+        validation, routing); the dispatcher raises on failure, so failed
+        calls are counted and reported by their error message alone. Workflows referenced by
+        ``workflow_id`` are prefetched once up front, so calls touching the
+        same workflow share a single fetch via the client's workflow cache.
+        """
+        calls = arguments["calls"]
+        concurrency = min(
+            max(1, arguments.get("max_concurrency", DEFAULT_BATCH_CONCURRENCY)), MAX_BATCH_CONCURRENCY
+        )
+
+        dispatch = self.deps.tool_dispatcher
+        if dispatch is None:
+            raise ToolError("NOT_CONFIGURED", "batch_call is not available: no tool dispatcher configured")
+        if not calls:
+            raise ToolError("INVALID_ARGUMENTS", "calls must contain at least one tool call")
+        if len(calls) > MAX_BATCH_CALLS:
+            raise ToolError("INVALID_ARGUMENTS", f"At most {MAX_BATCH_CALLS} calls per batch (got {len(calls)})")
+
+        started = time.perf_counter()
+        prefetched = await self._prefetch_workflows(calls, concurrency)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(call: Dict[str, Any]) -> Dict[str, Any]:
+            tool = call.get("tool")
+            call_arguments = call.get("arguments") or {}
+            async with semaphore:
+                call_started = time.perf_counter()
+                if tool == "batch_call":
+                    status, text = "error", "Nested batch_call is not allowed"
+                else:
+                    try:
+                        contents = await dispatch(tool, call_arguments)
+                        status = "ok"
+                        text = "\n\n".join(content.text for content in contents if content.type == "text")
+                    except ToolError as e:
+                        status, text = "error", e.message
+                    except Exception as e:
+                        status, text = "error", str(e) or type(e).__name__
+                return {
+                    "tool": tool,
+                    "status": status,
+                    "text": text,
+                    "duration_ms": (time.perf_counter() - call_started) * 1000,
+                }
+
+        results = await asyncio.gather(*(run(call) for call in calls))
+        elapsed = time.perf_counter() - started
+
+        failed = sum(1 for r in results if r["status"] == "error")
+        result = f"# 📦 Batch Results\n\n"
+        result += f"**Calls:** {len(results)} ({len(results) - failed} ok, {failed} failed)\n"
+        result += f"**Concurrency:** {concurrency}\n"
+        if prefetched:
+            result += f"**Prefetched Workflows:** {prefetched}\n"
+        result += f"**Total Time:** {elapsed:.2f}s\n\n"
+
+        for index, item in enumerate(results, 1):
+            icon = "✅" if item["status"] == "ok" else "❌"
+            result += f"---\n\n## {icon} [{index}] `{item['tool']}` ({item['duration_ms']:.0f}ms)\n\n"
+            result += f"{item['text']}\n\n"
+
+        return [TextContent(type="text", text=result)]
+
+    async def _prefetch_workflows(self, calls: List[Dict[str, Any]], concurrency: int) -> int:
+        """Warm the workflow cache for every workflow_id referenced by the batch"""
+        client = self.deps.client
+        workflow_ids = [
+            str(call["arguments"]["workflow_id"])
+            for call in calls
+            if isinstance(call.get("arguments"), dict) and call["arguments"].get("workflow_id")
+        ]
+        if not workflow_ids or not hasattr(client, "get_workflows_bulk"):
+            return 0
+
+        fetched = 0
+        async for _, workflow, _ in client.get_workflows_bulk(workflow_ids, concurrency=concurrency):
+            # Failures are reported by the individual calls that need the workflow
+            if workflow is not None:
+                fetched += 1
+        return fetched
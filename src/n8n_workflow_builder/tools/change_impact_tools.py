@@ -9,6 +9,7 @@ import json
 from mcp.types import TextContent
 
 from .base import BaseTool, ToolError
+from .pagination import PageRequest, paginate
 
 if TYPE_CHECKING:
     from ..dependencies import Dependencies
@@ -171,26 +172,38 @@ class ChangeImpactTools(BaseTool):
         return [TextContent(type="text", text=result)]
     
     async def discover_nodes(self, arguments: dict) -> list[TextContent]:
-        """Analyze workflows to discover node types"""
+        """Analyze workflows to discover node types
+        
+        The node type list is paginated. Follow-up pages (with ``cursor``) list
+        the stored discovery results without analyzing the workflows again.
+        """
         import logging
         logger = logging.getLogger(__name__)
         
         # Access node discovery from deps
         node_discovery = self.deps.node_discovery
+        request = PageRequest.from_arguments("discover_nodes", arguments, default_page_size=100)
         
-        # Analyze all workflows to discover node types
-        workflows = await self.deps.client.list_workflows()
+        if arguments.get("cursor"):
+            header = f"# 📋 Discovered Node Types\n\n"
+            result = paginate(request, sorted(node_discovery.discovered_nodes), self._render_node_type, header)
+            return [TextContent(type="text", text=result)]
+        
+        # Stream workflow IDs across every page of the listing
+        workflow_ids = [
+            workflow['id'] async for workflow in self.deps.client.iter_workflows()
+            if workflow.get('id')
+        ]
         
         # Get full workflow details for analysis
-        full_workflows = []
-        for workflow in workflows:
-            workflow_id = workflow.get('id')
-            if workflow_id:
-                try:
-                    full_workflow = await self.deps.client.get_workflow(workflow_id)
-                    full_workflows.append(full_workflow)
-                except Exception as e:
-                    logger.warning(f"Could not load workflow {workflow_id}: {e}")
+        fetched = {}
+        async for workflow_id, full_workflow, error in self.deps.client.get_workflows_bulk(workflow_ids):
+            if error:
+                logger.warning(f"Could not load workflow {workflow_id}: {error}")
+            else:
+                fetched[workflow_id] = full_workflow
+        # Bulk results arrive in completion order; analyze in listing order
+        full_workflows = [fetched[wf_id] for wf_id in dict.fromkeys(workflow_ids) if wf_id in fetched]
         
         # Analyze workflows and discover nodes
         summary = node_discovery.analyze_workflows(full_workflows)
@@ -205,17 +218,29 @@ class ChangeImpactTools(BaseTool):
             result += f"- **{node_type}**: {count} uses\n"
         
         result += f"\n## 📋 All Discovered Node Types\n\n"
-        for i, node_type in enumerate(sorted(summary['node_types']), 1):
-            result += f"{i}. `{node_type}`\n"
         
-        result += f"\n💡 **Next Steps:**\n"
-        result += f"- Use `get_node_schema(node_type)` to see parameters for a specific node\n"
-        result += f"- Use `search_nodes(keyword)` to find nodes by keyword\n"
-        result += f"- Use `recommend_nodes_for_task(task)` to get recommendations\n"
-        result += f"\n✅ Knowledge saved to: `{node_discovery.db_path}`\n"
+        footer = f"\n💡 **Next Steps:**\n"
+        footer += f"- Use `get_node_schema(node_type)` to see parameters for a specific node\n"
+        footer += f"- Use `search_nodes(keyword)` to find nodes by keyword\n"
+        footer += f"- Use `recommend_nodes_for_task(task)` to get recommendations\n"
+        footer += f"\n✅ Knowledge saved to: `{node_discovery.db_path}`\n"
+        
+        metadata = {
+            "analyzed_workflows": len(full_workflows),
+            "total_node_types": summary['total_node_types'],
+            "total_usage": summary['total_usage'],
+            "most_used": summary['most_used'][:10],
+        }
+        result = paginate(
+            request, sorted(summary['node_types']), self._render_node_type, result, footer, metadata=metadata
+        )
         
         return [TextContent(type="text", text=result)]
     
+    @staticmethod
+    def _render_node_type(node_type: str) -> str:
+        return f"- `{node_type}`\n"
+    
     async def get_node_schema(self, arguments: dict) -> list[TextContent]:
         """Get schema information for a discovered node type"""
         node_type = arguments["node_type"]
@@ -225,11 +250,14 @@ class ChangeImpactTools(BaseTool):
         schema = node_discovery.get_node_schema(node_type)
         
         if not schema:
-            return [TextContent(
-                type="text",
-                text=f"❌ Node type `{node_type}` not found in discovered nodes.\n\n"
-                     f"💡 Run `discover_nodes` first to analyze workflows and learn about nodes."
-            )]
+            return self._notice(
+                arguments,
+                f"❌ Node type `{node_type}` not found in discovered nodes.\n\n"
+                f"💡 Run `discover_nodes` first to analyze workflows and learn about nodes."
+            )
+        
+        if self._wants_json(arguments):
+            return self._json_result(schema, node_type=node_type)
         
         result = f"# 🔍 Node Schema: {schema.get('name', node_type)}\n\n"
         result += f"**Type:** `{node_type}`\n"
@@ -49,16 +49,28 @@ class DriftTools(BaseTool):
         
         # Fetch workflow and executions
         workflow = await self.deps.client.get_workflow(workflow_id)
-        executions = await self.deps.client.get_executions(workflow_id, limit=100)
-        
-        if not executions or len(executions) < 2:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ Insufficient execution history for drift detection (need at least 2 executions)"
-            )]
         
-        # Analyze drift
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        # Background scheduler keeps recent analyses of active workflows warm;
+        # without it there is no cache and every call analyzes now
+        drift_cache = self.deps.drift_cache
+        cached = None
+        if drift_cache is not None and not arguments.get("refresh", False):
+            cached = drift_cache.get(workflow_id, lookback_days)
+        
+        if cached is not None:
+            drift_analysis, cache_age = cached
+        else:
+            cache_age = None
+            executions = await self.deps.client.get_executions(workflow_id, limit=100)
+            
+            if not executions or len(executions) < 2:
+                return self._notice(
+                    arguments,
+                    f"ℹ️ Insufficient execution history for drift detection (need at least 2 executions)"
+                )
+            
+            # Analyze drift
+            drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         # Log action
         self.deps.state_manager.log_action("detect_workflow_drift", {
@@ -67,8 +79,16 @@ class DriftTools(BaseTool):
             "severity": drift_analysis.get("severity", "none")
         })
         
+        if self._wants_json(arguments):
+            return self._json_result(
+                drift_analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'),
+                cache_age_seconds=round(cache_age, 1) if cache_age is not None else None
+            )
+        
         # Format result
         result = f"# Drift Detection: {workflow['name']}\n\n"
+        if cache_age is not None:
+            result += f"_Background analysis from {cache_age / 60:.0f} min ago - pass `refresh: true` to re-analyze now._\n\n"
         
         if not drift_analysis.get("drift_detected"):
             result += "✅ **No significant drift detected**\n\n"
@@ -120,18 +140,20 @@ class DriftTools(BaseTool):
         executions = await self.deps.client.get_executions(workflow_id, limit=100)
         
         # Get drift analysis
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         if not drift_analysis.get("drift_detected"):
-            return [TextContent(
-                type="text",
-                text="ℹ️ No drift detected - pattern analysis not applicable"
-            )]
+            return self._notice(arguments, "ℹ️ No drift detected - pattern analysis not applicable")
         
         # Find specific pattern
         patterns = drift_analysis.get("patterns", [])
         pattern = next((p for p in patterns if p["type"] == pattern_type), None)
         
+        if self._wants_json(arguments):
+            return self._json_result(
+                pattern, workflow_id=workflow_id, available_patterns=[p['type'] for p in patterns]
+            )
+        
         if not pattern:
             return [TextContent(
                 type="text",
@@ -169,19 +191,20 @@ class DriftTools(BaseTool):
         executions = await self.deps.client.get_executions(workflow_id, limit=100)
         
         # Get drift analysis
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         if not drift_analysis.get("drift_detected"):
-            return [TextContent(
-                type="text",
-                text="ℹ️ No drift detected - root cause analysis not applicable"
-            )]
+            return self._notice(arguments, "ℹ️ No drift detected - root cause analysis not applicable")
         
         # Analyze root cause
-        root_cause = DriftRootCauseAnalyzer.analyze_root_cause(
+        root_cause = await self._run_analyzer(
+            DriftRootCauseAnalyzer.analyze_root_cause,
             drift_analysis, executions, workflow
         )
         
+        if self._wants_json(arguments):
+            return self._json_result(root_cause, workflow_id=workflow_id, workflow_name=workflow.get('name'))
+        
         # Format result
         result = f"# Root Cause Analysis: {workflow['name']}\n\n"
         result += f"**Root Cause**: `{root_cause.get('root_cause', 'unknown')}`\n"
@@ -207,15 +230,13 @@ class DriftTools(BaseTool):
         executions = await self.deps.client.get_executions(workflow_id, limit=100)
         
         # Get drift analysis and root cause
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         if not drift_analysis.get("drift_detected"):
-            return [TextContent(
-                type="text",
-                text="ℹ️ No drift detected - no fixes needed"
-            )]
+            return self._notice(arguments, "ℹ️ No drift detected - no fixes needed")
         
-        root_cause = DriftRootCauseAnalyzer.analyze_root_cause(
+        root_cause = await self._run_analyzer(
+            DriftRootCauseAnalyzer.analyze_root_cause,
             drift_analysis, executions, workflow
         )
         
@@ -223,6 +244,9 @@ class DriftTools(BaseTool):
         patterns = drift_analysis.get("patterns", [])
         suggestions = DriftFixSuggester.suggest_fixes(root_cause, workflow, patterns)
         
+        if self._wants_json(arguments):
+            return self._json_result(suggestions, workflow_id=workflow_id, workflow_name=workflow.get('name'))
+        
         # Format result
         result = f"# Fix Suggestions: {workflow['name']}\n\n"
         result += f"**Root Cause**: {suggestions.get('root_cause')}\n"
@@ -258,6 +282,9 @@ class DriftTools(BaseTool):
         # Generate diff
         diff = WorkflowDiffEngine.compare_workflows(workflow_1, workflow_2)
         
+        if self._wants_json(arguments):
+            return self._json_result(diff, workflow_id_1=workflow_id_1, workflow_id_2=workflow_id_2)
+        
         # Format comparison
         comparison = ChangeFormatter.format_comparison(workflow_1, workflow_2, diff)
         
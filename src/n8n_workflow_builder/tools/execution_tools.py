@@ -3,17 +3,22 @@
 Execution & Monitoring Tool Handlers
 Handles workflow execution tracking, error analysis, and execution monitoring
 """
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 import json
 
 from mcp.types import TextContent
 
 from .base import BaseTool, ToolError
+from .pagination import PageRequest, paginate_upstream
 from ..execution.error_analyzer import ExecutionMonitor, ErrorSimplifier, ErrorContextExtractor, FeedbackGenerator
 
 if TYPE_CHECKING:
     from ..dependencies import Dependencies
 
+# Execution details only preview node output, so large payloads are truncated while streaming
+PREVIEW_ITEMS_PER_OUTPUT = 3
+PREVIEW_MAX_BYTES = 2 * 1024 * 1024
+
 
 class ExecutionTools(BaseTool):
     """Handler for execution monitoring and error analysis tools"""
@@ -43,29 +48,64 @@ class ExecutionTools(BaseTool):
         return await handler(arguments)
     
     async def get_executions(self, arguments: dict) -> list[TextContent]:
-        """Get recent executions for a workflow"""
-        workflow_id = arguments.get("workflow_id")
-        limit = arguments.get("limit", 10)
+        """Get recent executions one page at a time, newest first
         
-        executions = await self.deps.client.get_executions(workflow_id, limit)
+        ``limit`` is kept as the default page size; pass ``cursor`` from the
+        output to continue further back in the history.
+        """
+        workflow_id = arguments.get("workflow_id")
+        request = PageRequest.from_arguments(
+            "get_executions", arguments, query_keys=("workflow_id",),
+            default_page_size=int(arguments.get("limit", 10)),
+        )
         
-        result = f"# Recent Executions ({len(executions)})\n\n"
-        for exec in executions:
+        def render(exec: Dict) -> str:
             status = "✅" if exec.get('finished') else "⏳"
-            result += f"{status} **Execution {exec['id']}**\n"
-            result += f"   Workflow: {exec.get('workflowData', {}).get('name', 'N/A')}\n"
-            result += f"   Started: {exec.get('startedAt', 'N/A')}\n"
+            text = f"{status} **Execution {exec['id']}**\n"
+            text += f"   Workflow: {exec.get('workflowData', {}).get('name', 'N/A')}\n"
+            text += f"   Started: {exec.get('startedAt', 'N/A')}\n"
             if exec.get('stoppedAt'):
-                result += f"   Duration: {exec.get('stoppedAt', 'N/A')}\n"
-            result += "\n"
+                text += f"   Duration: {exec.get('stoppedAt', 'N/A')}\n"
+            return text + "\n"
         
+        def fetch_pages(cursor):
+            return self.deps.client.iter_execution_pages(
+                workflow_id, page_size=request.page_size, cursor=cursor
+            )
+        
+        def to_data(exec: Dict) -> Dict:
+            return {
+                "id": exec.get("id"),
+                "workflowId": exec.get("workflowId"),
+                "status": exec.get("status"),
+                "finished": exec.get("finished"),
+                "mode": exec.get("mode"),
+                "startedAt": exec.get("startedAt"),
+                "stoppedAt": exec.get("stoppedAt"),
+            }
+        
+        result = await paginate_upstream(
+            request, fetch_pages, render, "# Recent Executions\n\n", to_data=to_data
+        )
         return [TextContent(type="text", text=result)]
     
     async def get_execution_details(self, arguments: dict) -> list[TextContent]:
         """Get detailed information about a specific execution"""
         execution_id = arguments["execution_id"]
         
-        execution = await self.deps.client.get_execution(execution_id)
+        execution = await self.deps.client.stream_execution(
+            execution_id,
+            max_items=PREVIEW_ITEMS_PER_OUTPUT,
+            max_bytes=PREVIEW_MAX_BYTES
+        )
+        dropped_items = {
+            (t["node"], t["run"], t["connection"], t["output"]): t["dropped"]
+            for t in execution.get('truncatedRunData', [])
+        }
+        
+        if self._wants_json(arguments):
+            # Node outputs are previews; truncatedRunData lists what was cut
+            return self._json_result(execution, execution_id=execution_id)
         
         result = f"# Execution Details: {execution_id}\n\n"
         result += f"**Workflow:** {execution.get('workflowData', {}).get('name', 'N/A')}\n"
@@ -90,9 +130,10 @@ class ExecutionTools(BaseTool):
                 for idx, run in enumerate(node_runs):
                     result += f"**Run {idx + 1}:**\n"
                     if 'data' in run:
-                        main_data = run['data'].get('main', [[]])[0]
-                        if main_data:
-                            result += f"- Output items: {len(main_data)}\n"
+                        main_data = (run['data'].get('main') or [[]])[0] or []
+                        total_items = len(main_data) + dropped_items.get((node_name, idx, "main", 0), 0)
+                        if total_items:
+                            result += f"- Output items: {total_items}\n"
                             # Show first item as sample
                             if main_data and len(main_data) > 0:
                                 first_item = main_data[0]
@@ -125,10 +166,7 @@ class ExecutionTools(BaseTool):
             # Get most recent execution for this workflow
             executions = await self.deps.client.get_executions(workflow_id, limit=1)
             if not executions or len(executions) == 0:
-                return [TextContent(
-                    type="text",
-                    text=f"ℹ️ No executions found for workflow: {workflow['name']}"
-                )]
+                return self._notice(arguments, f"ℹ️ No executions found for workflow: {workflow['name']}")
             execution = executions[0]
             execution_id = execution["id"]
         
@@ -142,6 +180,9 @@ class ExecutionTools(BaseTool):
             "has_errors": analysis["has_errors"]
         })
         
+        if self._wants_json(arguments):
+            return self._json_result(analysis, workflow_id=workflow_id, execution_id=execution_id)
+        
         # Format result
         result = f"# Execution Monitor: {analysis['workflow_name']}\n\n"
         result += f"**Execution ID**: `{execution_id}`\n"
@@ -191,16 +232,10 @@ class ExecutionTools(BaseTool):
         analysis = ExecutionMonitor.analyze_execution(execution, workflow)
         
         if not analysis["has_errors"]:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ Execution {execution_id} completed successfully - no errors to analyze"
-            )]
+            return self._notice(arguments, f"ℹ️ Execution {execution_id} completed successfully - no errors to analyze")
         
         if not analysis["error_nodes"] or len(analysis["error_nodes"]) == 0:
-            return [TextContent(
-                type="text",
-                text=f"⚠️ Execution failed but no specific error node could be identified"
-            )]
+            return self._notice(arguments, f"⚠️ Execution failed but no specific error node could be identified")
         
         # Get first error node (most common case)
         error_node_info = analysis["error_nodes"][0]
@@ -221,9 +256,6 @@ class ExecutionTools(BaseTool):
             error_context, simplified_error
         )
         
-        # Format for LLM
-        result = FeedbackGenerator.format_feedback_for_llm(feedback)
-        
         # Log action
         self.deps.state_manager.log_action("get_execution_error_context", {
             "execution_id": execution_id,
@@ -232,6 +264,14 @@ class ExecutionTools(BaseTool):
             "error_type": simplified_error["error_type"]
         })
         
+        if self._wants_json(arguments):
+            return self._json_result(
+                feedback, execution_id=execution_id, workflow_id=workflow_id, error_node=error_node_name
+            )
+        
+        # Format for LLM
+        result = FeedbackGenerator.format_feedback_for_llm(feedback)
+        
         return [TextContent(type="text", text=result)]
     
     async def analyze_execution_errors(self, arguments: dict) -> list[TextContent]:
@@ -246,10 +286,7 @@ class ExecutionTools(BaseTool):
         executions = await self.deps.client.get_executions(workflow_id, limit=limit)
         
         if not executions or len(executions) == 0:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ No executions found for workflow: {workflow['name']}"
-            )]
+            return self._notice(arguments, f"ℹ️ No executions found for workflow: {workflow['name']}")
         
         # Analyze all executions
         error_patterns = {}
@@ -282,6 +319,33 @@ class ExecutionTools(BaseTool):
             else:
                 success_count += 1
         
+        # Sort by count
+        sorted_patterns = sorted(
+            error_patterns.values(),
+            key=lambda x: x["count"],
+            reverse=True
+        )
+        
+        # Log action
+        self.deps.state_manager.log_action("analyze_execution_errors", {
+            "workflow_id": workflow_id,
+            "executions_analyzed": len(executions),
+            "failed_count": failed_count,
+            "error_patterns": len(error_patterns)
+        })
+        
+        if self._wants_json(arguments):
+            return self._json_result(
+                {
+                    "executions_analyzed": len(executions),
+                    "successful": success_count,
+                    "failed": failed_count,
+                    "success_rate": round(success_count / len(executions), 3),
+                    "error_patterns": sorted_patterns,
+                },
+                workflow_id=workflow_id, workflow_name=workflow.get('name'),
+            )
+        
         # Format result
         result = f"# Execution Error Analysis: {workflow['name']}\n\n"
         result += f"**Total Executions Analyzed**: {len(executions)}\n"
@@ -293,13 +357,6 @@ class ExecutionTools(BaseTool):
             result += "## 🔥 Error Patterns\n\n"
             result += "Most common errors across executions:\n\n"
             
-            # Sort by count
-            sorted_patterns = sorted(
-                error_patterns.values(),
-                key=lambda x: x["count"],
-                reverse=True
-            )
-            
             for pattern in sorted_patterns:
                 result += f"### {pattern['node_name']}\n\n"
                 result += f"**Error Type**: `{pattern['error_type']}`\n"
@@ -316,12 +373,4 @@ class ExecutionTools(BaseTool):
         else:
             result += "✅ No error patterns detected - all executions succeeded!\n"
         
-        # Log action
-        self.deps.state_manager.log_action("analyze_execution_errors", {
-            "workflow_id": workflow_id,
-            "executions_analyzed": len(executions),
-            "failed_count": failed_count,
-            "error_patterns": len(error_patterns)
-        })
-        
         return [TextContent(type="text", text=result)]
@@ -9,6 +9,8 @@ import logging
 from mcp.types import TextContent
 
 from .base import BaseTool, ToolError
+from ..analyzer_executor import AnalyzerTimeoutError
+from ..deadlines import DeadlineExceeded, expired, record_partial, record_skipped
 from ..builders.workflow_builder import NODE_KNOWLEDGE
 from ..explainability import WorkflowExplainer, WorkflowPurposeAnalyzer, ExplainabilityFormatter
 from ..drift.detector import DriftDetector
@@ -90,6 +92,9 @@ class ExplainabilityTools(BaseTool):
         if isinstance(workflow, list):
             workflow = workflow[0] if workflow else {}
         
+        record_partial("workflow", {"id": workflow_id, "name": workflow.get("name"),
+                                    "node_count": len(workflow.get("nodes", []))})
+        
         all_workflows = await self.deps.client.list_workflows()
         
         # Optional: Fetch semantic analysis and execution history
@@ -97,19 +102,29 @@ class ExplainabilityTools(BaseTool):
         drift_analysis = None
         execution_history = None
         
-        if include_analysis:
-            # Import here to avoid circular dependencies
-            from ..validators.semantic_analyzer import SemanticWorkflowAnalyzer
-            
+        # The optional analyses are the first thing dropped when the deadline is near
+        if include_analysis and expired():
+            record_skipped("semantic_analysis")
+            record_skipped("drift_analysis")
+        elif include_analysis:
             try:
-                semantic_analysis = SemanticWorkflowAnalyzer.analyze_workflow_semantics(workflow)
+                semantic_analysis = await self._run_analyzer(
+                    self.deps.semantic_analyzer.analyze_workflow_semantics, workflow
+                )
+                record_partial("semantic_analysis", semantic_analysis)
+            except (AnalyzerTimeoutError, DeadlineExceeded):
+                # The deadline has passed: let the registry return the partial result as incomplete
+                raise
             except Exception as e:
                 logger.warning(f"Could not get semantic analysis: {e}")
             
             try:
                 execution_history = await self.deps.client.get_executions(workflow_id, limit=100)
                 if execution_history:
-                    drift_analysis = DriftDetector.analyze_execution_history(execution_history)
+                    drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, execution_history)
+                    record_partial("drift_analysis", drift_analysis)
+            except (AnalyzerTimeoutError, DeadlineExceeded):
+                raise
             except Exception as e:
                 logger.warning(f"Could not get execution history: {e}")
         
@@ -123,7 +138,8 @@ class ExplainabilityTools(BaseTool):
             logger.debug(f"Could not get intent metadata: {e}")
         
         # Generate explanation
-        explanation = WorkflowExplainer.explain_workflow(
+        explanation = await self._run_analyzer(
+            WorkflowExplainer.explain_workflow,
             workflow,
             all_workflows=all_workflows,
             semantic_analysis=semantic_analysis,
@@ -147,6 +163,9 @@ class ExplainabilityTools(BaseTool):
         # Analyze purpose
         purpose_analysis = WorkflowPurposeAnalyzer.analyze_purpose(workflow)
         
+        if self._wants_json(arguments):
+            return self._json_result(purpose_analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
+        
         # Format result
         result = f"# Workflow Purpose: {workflow['name']}\n\n"
         result += f"**Primary Purpose**: {purpose_analysis.get('primary_purpose')}\n\n"
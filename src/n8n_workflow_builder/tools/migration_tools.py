@@ -44,7 +44,8 @@ class MigrationTools(BaseTool):
         dry_run = arguments.get("dry_run", False)
         target_version = arguments.get("target_version")
         
-        workflow = await self.deps.client.get_workflow(workflow_id)
+        # A real migration writes back on top of this copy, so it must be fresh
+        workflow = await self.deps.client.get_workflow(workflow_id, use_cache=dry_run)
         
         # Access workflow updater and migration reporter from deps
         workflow_updater = self.deps.workflow_updater
@@ -62,7 +63,9 @@ class MigrationTools(BaseTool):
         
         # If not dry run, update in n8n
         if not dry_run and migration_log:
-            updated_workflow = await self.deps.client.update_workflow(workflow_id, updated_workflow)
+            updated_workflow = await self.deps.client.update_workflow(
+                workflow_id, updated_workflow, base_workflow=workflow
+            )
         
         # Generate report
         report = migration_reporter.generate_migration_report(
@@ -92,18 +95,18 @@ class MigrationTools(BaseTool):
         
         # If no IDs provided, get all workflows
         if not workflow_ids:
-            workflows = await self.deps.client.get_workflows()
-            workflow_ids = [w["id"] for w in workflows]
+            workflow_ids = [w["id"] async for w in self.deps.client.iter_workflows()]
         
         # Fetch workflows
-        workflows = []
-        for wf_id in workflow_ids:
-            try:
-                wf = await self.deps.client.get_workflow(wf_id)
-                workflows.append(wf)
-            except Exception as e:
+        fetched = {}
+        async for wf_id, wf, error in self.deps.client.get_workflows_bulk(workflow_ids):
+            if error:
                 import logging
-                logging.getLogger(__name__).error(f"Failed to fetch workflow {wf_id}: {e}")
+                logging.getLogger(__name__).error(f"Failed to fetch workflow {wf_id}: {error}")
+            else:
+                fetched[wf_id] = wf
+        # Bulk results arrive in completion order; report in request order
+        workflows = [fetched[wf_id] for wf_id in dict.fromkeys(workflow_ids) if wf_id in fetched]
         
         # Check compatibility
         workflow_updater = self.deps.workflow_updater
@@ -12,7 +12,9 @@ This handler consolidates various specialized tools including:
 import json
 from typing import Any
 from mcp.types import TextContent, Tool
+from ..deadlines import record_partial
 from .base import BaseTool
+from .pagination import PageRequest, paginate, paginate_query
 
 
 class MiscellaneousTools(BaseTool):
@@ -299,7 +301,7 @@ class MiscellaneousTools(BaseTool):
         workflow = await n8n_client.get_workflow(workflow_id)
         executions = await n8n_client.get_executions(workflow_id, limit=100)
         
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         if not drift_analysis.get("drift_detected"):
             return [TextContent(
@@ -307,7 +309,8 @@ class MiscellaneousTools(BaseTool):
                 text="ℹ️ No drift detected - root cause analysis not applicable"
             )]
         
-        root_cause = DriftRootCauseAnalyzer.analyze_root_cause(
+        root_cause = await self._run_analyzer(
+            DriftRootCauseAnalyzer.analyze_root_cause,
             drift_analysis, executions, workflow
         )
         
@@ -334,7 +337,7 @@ class MiscellaneousTools(BaseTool):
         workflow = await n8n_client.get_workflow(workflow_id)
         executions = await n8n_client.get_executions(workflow_id, limit=100)
         
-        drift_analysis = DriftDetector.analyze_execution_history(executions)
+        drift_analysis = await self._run_analyzer(DriftDetector.analyze_execution_history, executions)
         
         if not drift_analysis.get("drift_detected"):
             return [TextContent(
@@ -342,7 +345,8 @@ class MiscellaneousTools(BaseTool):
                 text="ℹ️ No drift detected - no fixes needed"
             )]
         
-        root_cause = DriftRootCauseAnalyzer.analyze_root_cause(
+        root_cause = await self._run_analyzer(
+            DriftRootCauseAnalyzer.analyze_root_cause,
             drift_analysis, executions, workflow
         )
         
@@ -378,18 +382,29 @@ class MiscellaneousTools(BaseTool):
         lookback_days = arguments.get("lookback_days", 30)
         
         workflow = await n8n_client.get_workflow(workflow_id)
+        record_partial("workflow", {"id": workflow_id, "name": workflow.get('name')})
         executions = await n8n_client.get_executions(workflow_id, limit=100)
+        record_partial("executions_fetched", len(executions or []))
         
         if not executions or len(executions) < 2:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ Insufficient execution history for schema drift detection (need at least 2 executions)"
-            )]
+            return self._notice(
+                arguments,
+                f"ℹ️ Insufficient execution history for schema drift detection (need at least 2 executions)"
+            )
         
-        drift_analysis = SchemaDriftAnalyzer.analyze_schema_drift(executions)
+        drift_analysis = await self._run_analyzer(SchemaDriftAnalyzer.analyze_schema_drift, executions)
+        
+        if self._wants_json(arguments):
+            return self._json_result(drift_analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
         
         result = f"# Schema Drift Detection: {workflow['name']}\n\n"
         
+        if drift_analysis.get("incomplete"):
+            analyzed = (drift_analysis["baseline_period"]["executions_analyzed"]
+                        + drift_analysis["current_period"]["executions_analyzed"])
+            total = drift_analysis["baseline_period"]["executions"] + drift_analysis["current_period"]["executions"]
+            result += f"⏱️ **Incomplete:** deadline reached after analyzing {analyzed} of {total} executions.\n\n"
+        
         if not drift_analysis.get("drift_detected"):
             result += "✅ **No schema drift detected**\n\n"
             result += "API response schemas appear stable.\n"
@@ -433,12 +448,15 @@ class MiscellaneousTools(BaseTool):
         executions = await n8n_client.get_executions(workflow_id, limit=100)
         
         if not executions or len(executions) < 2:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ Insufficient execution history for rate limit drift detection (need at least 2 executions)"
-            )]
+            return self._notice(
+                arguments,
+                f"ℹ️ Insufficient execution history for rate limit drift detection (need at least 2 executions)"
+            )
         
-        drift_analysis = RateLimitDriftAnalyzer.analyze_rate_limit_drift(executions, workflow)
+        drift_analysis = await self._run_analyzer(RateLimitDriftAnalyzer.analyze_rate_limit_drift, executions, workflow)
+        
+        if self._wants_json(arguments):
+            return self._json_result(drift_analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
         
         result = f"# Rate Limit Drift Detection: {workflow['name']}\n\n"
         
@@ -490,12 +508,15 @@ class MiscellaneousTools(BaseTool):
         executions = await n8n_client.get_executions(workflow_id, limit=100)
         
         if not executions or len(executions) < 2:
-            return [TextContent(
-                type="text",
-                text=f"ℹ️ Insufficient execution history for quality drift detection (need at least 2 executions)"
-            )]
+            return self._notice(
+                arguments,
+                f"ℹ️ Insufficient execution history for quality drift detection (need at least 2 executions)"
+            )
         
-        drift_analysis = DataQualityDriftAnalyzer.analyze_quality_drift(executions)
+        drift_analysis = await self._run_analyzer(DataQualityDriftAnalyzer.analyze_quality_drift, executions)
+        
+        if self._wants_json(arguments):
+            return self._json_result(drift_analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
         
         result = f"# Data Quality Drift Detection: {workflow['name']}\n\n"
         
@@ -554,7 +575,10 @@ class MiscellaneousTools(BaseTool):
         if isinstance(workflow, list):
             workflow = workflow[0] if workflow else {}
         
-        data_flow = DataFlowTracer.trace_data_flow(workflow)
+        data_flow = await self._run_analyzer(DataFlowTracer.trace_data_flow, workflow)
+        
+        if self._wants_json(arguments):
+            return self._json_result(data_flow, workflow_id=workflow_id, workflow_name=workflow.get('name'))
         
         result = f"# Data Flow: {workflow['name']}\n\n"
         result += f"**Summary**: {data_flow.get('summary')}\n\n"
@@ -600,7 +624,10 @@ class MiscellaneousTools(BaseTool):
         workflow = await n8n_client.get_workflow(workflow_id)
         all_workflows = await n8n_client.get_workflows()
         
-        dependencies = DependencyMapper.map_dependencies(workflow, all_workflows)
+        dependencies = await self._run_analyzer(DependencyMapper.map_dependencies, workflow, all_workflows)
+        
+        if self._wants_json(arguments):
+            return self._json_result(dependencies, workflow_id=workflow_id, workflow_name=workflow.get('name'))
         
         result = f"# Dependencies: {workflow['name']}\n\n"
         result += f"**Summary**: {dependencies.get('summary')}\n\n"
@@ -654,6 +681,9 @@ class MiscellaneousTools(BaseTool):
         # Run simulation
         simulation = await simulator.simulate(workflow_id, new_workflow)
         
+        if self._wants_json(arguments):
+            return self._json_result(simulation, workflow_id=workflow_id)
+        
         # Format as Terraform-style output
         result = simulator.format_terraform_style(simulation)
         
@@ -724,28 +754,26 @@ class MiscellaneousTools(BaseTool):
     async def _get_change_history(self, arguments: dict, approval_workflow) -> list[TextContent]:
         workflow_id = arguments["workflow_id"]
         
-        history = approval_workflow.get_workflow_history(workflow_id)
+        request = PageRequest.from_arguments(
+            "get_change_history", arguments, query_keys=("workflow_id",), default_page_size=10
+        )
+        status_counts = approval_workflow.get_status_counts(workflow_id)
+        total = sum(status_counts.values())
         
-        if not history:
+        if not total and not request.as_json:
             return [TextContent(type="text", text=f"No change history found for workflow {workflow_id}")]
         
-        result = f"# Change History\n\n"
-        result += f"**Total Requests**: {len(history)}\n\n"
+        header = f"# Change History\n\n"
+        header += f"**Total Requests**: {total}\n\n"
         
-        status_groups = {}
-        for req in history:
-            status = req["status"]
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(req)
+        header += "**Status Summary**:\n"
+        for status, count in status_counts.items():
+            header += f"  - {status}: {count}\n"
+        header += "\n"
         
-        result += "**Status Summary**:\n"
-        for status, requests in status_groups.items():
-            result += f"  - {status}: {len(requests)}\n"
-        result += "\n"
+        header += "## Recent Changes\n\n"
         
-        result += "## Recent Changes\n\n"
-        for req in sorted(history, key=lambda x: x["created_at"], reverse=True)[:10]:
+        def render(req: dict) -> str:
             status_icon = {
                 "pending": "⏳",
                 "approved": "✅",
@@ -754,20 +782,30 @@ class MiscellaneousTools(BaseTool):
                 "failed": "⚠️"
             }.get(req["status"], "❓")
             
-            result += f"### {status_icon} Request {req['id']}\n"
-            result += f"- **Status**: {req['status']}\n"
-            result += f"- **Requester**: {req['requester']}\n"
-            result += f"- **Reason**: {req['reason']}\n"
-            result += f"- **Created**: {req['created_at']}\n"
+            text = f"### {status_icon} Request {req['id']}\n"
+            text += f"- **Status**: {req['status']}\n"
+            text += f"- **Requester**: {req['requester']}\n"
+            text += f"- **Reason**: {req['reason']}\n"
+            text += f"- **Created**: {req['created_at']}\n"
             
             if req.get("reviewer"):
-                result += f"- **Reviewer**: {req['reviewer']}\n"
+                text += f"- **Reviewer**: {req['reviewer']}\n"
             if req.get("reviewed_at"):
-                result += f"- **Reviewed**: {req['reviewed_at']}\n"
+                text += f"- **Reviewed**: {req['reviewed_at']}\n"
             if req.get("review_comments"):
-                result += f"- **Comments**: {req['review_comments']}\n"
+                text += f"- **Comments**: {req['review_comments']}\n"
             
-            result += "\n"
+            return text + "\n"
+        
+        # Newest first, read from the workflow index one page at a time
+        result = paginate_query(
+            request,
+            lambda offset, limit: approval_workflow.get_workflow_history(
+                workflow_id, limit=limit, offset=offset, newest_first=True
+            ),
+            render, header,
+            metadata={"workflow_id": workflow_id, "total": total, "status_counts": status_counts}
+        )
         
         return [TextContent(type="text", text=result)]
 
@@ -862,8 +900,9 @@ class MiscellaneousTools(BaseTool):
         query = arguments["query"]
         
         matches = node_discovery.search_nodes(query)
+        request = PageRequest.from_arguments("search_nodes", arguments, query_keys=("query",))
         
-        if not matches:
+        if not matches and not request.as_json:
             return [TextContent(
                 type="text",
                 text=f"❌ No nodes found matching '{query}'.\n\n"
@@ -873,7 +912,7 @@ class MiscellaneousTools(BaseTool):
                      f"- Use `recommend_nodes_for_task` for task-based recommendations"
             )]
         
-        result = f"# 🔎 Search Results for '{query}' ({len(matches)} matches)\n\n"
+        header = f"# 🔎 Search Results for '{query}' ({len(matches)} matches)\n\n"
         
         category_icons = {
             'trigger': '⚡',
@@ -886,18 +925,22 @@ class MiscellaneousTools(BaseTool):
             'other': '📦'
         }
         
-        for match in matches:
+        def render(match: dict) -> str:
             category = match.get('category', 'other')
             icon = category_icons.get(category, '📦')
-            result += f"## {icon} {match['name'] or match['type']}\n"
-            result += f"- **Type:** `{match['type']}`\n"
-            result += f"- **Category:** {category}\n"
-            result += f"- **Usage Count:** {match['usage_count']} times\n"
-            result += f"- **Parameters:** {match['parameters']} discovered\n"
-            result += f"- **Version:** {match['typeVersion']}\n"
-            result += "\n"
-        
-        result += f"💡 **Tip:** Use `get_node_schema('{matches[0]['type']}')` to see detailed parameters.\n"
+            text = f"## {icon} {match['name'] or match['type']}\n"
+            text += f"- **Type:** `{match['type']}`\n"
+            text += f"- **Category:** {category}\n"
+            text += f"- **Usage Count:** {match['usage_count']} times\n"
+            text += f"- **Parameters:** {match['parameters']} discovered\n"
+            text += f"- **Version:** {match['typeVersion']}\n"
+            return text + "\n"
+        
+        footer = f"💡 **Tip:** Use `get_node_schema('{matches[0]['type']}')` to see detailed parameters.\n" if matches else ""
+        result = paginate(
+            request, matches, render, header, footer,
+            metadata={"query": query, "total_matches": len(matches)}
+        )
         
         return [TextContent(type="text", text=result)]
 
@@ -909,16 +952,23 @@ class MiscellaneousTools(BaseTool):
         
         if node_recommender is None:
             if not node_discovery.discovered_nodes:
-                return [TextContent(
-                    type="text",
-                    text=f"❌ No nodes discovered yet.\n\n"
-                         f"💡 Run `discover_nodes` first to analyze workflows and build recommendations."
-                )]
+                return self._notice(
+                    arguments,
+                    f"❌ No nodes discovered yet.\n\n"
+                    f"💡 Run `discover_nodes` first to analyze workflows and build recommendations."
+                )
             node_recommender = NodeRecommender(node_discovery)
         
         # Call async recommend_for_task
         recommendations = await node_recommender.recommend_for_task(task_description, top_k)
         
+        if self._wants_json(arguments):
+            return self._json_result(
+                [{"node_type": node_type, "score": score, "reason": reason}
+                 for node_type, score, reason in recommendations],
+                task=task_description,
+            )
+        
         if not recommendations:
             return [TextContent(
                 type="text",
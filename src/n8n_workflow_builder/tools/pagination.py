@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Tool Result Pagination
+Shared cursor, page size and byte/token budget contract for list-producing tools
+"""
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .base import ToolError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+DEFAULT_MAX_BYTES = 24_000       # roughly 6k tokens of markdown
+MIN_MAX_BYTES = 1_000
+BYTES_PER_TOKEN = 4              # rough budget conversion for max_tokens
+
+
+def pagination_properties(default_page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Dict]:
+    """JSON schema properties shared by every paginated tool"""
+    return {
+        "cursor": {
+            "type": "string",
+            "description": "Opaque cursor from a previous page's output to fetch the next page"
+        },
+        "page_size": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": MAX_PAGE_SIZE,
+            "description": f"Maximum items per page (default: {default_page_size})"
+        },
+        "max_bytes": {
+            "type": "integer",
+            "minimum": MIN_MAX_BYTES,
+            "description": f"Size budget for the page's text in bytes (default: {DEFAULT_MAX_BYTES})"
+        },
+        "max_tokens": {
+            "type": "integer",
+            "minimum": MIN_MAX_BYTES // BYTES_PER_TOKEN,
+            "description": "Size budget in approximate tokens (alternative to max_bytes)"
+        },
+    }
+
+
+def _fingerprint(tool: str, query: Dict[str, Any]) -> str:
+    payload = json.dumps([tool, query], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Where a page starts and how much it may hold
+
+    ``offset`` and ``state`` come from the cursor; handlers store whatever
+    they need to resume in ``state`` (e.g. n8n's own upstream cursor).
+    A cursor is only valid for the tool and query arguments it was issued for.
+    With ``as_json`` the page is a serialized ToolResult instead of markdown.
+    """
+    tool: str
+    query: Dict[str, Any]
+    page_size: int
+    max_bytes: int
+    offset: int = 0
+    state: Dict[str, Any] = field(default_factory=dict)
+    as_json: bool = False
+
+    @classmethod
+    def from_arguments(
+        cls,
+        tool: str,
+        arguments: dict,
+        query_keys: Iterable[str] = (),
+        default_page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> 'PageRequest':
+        """Parse the pagination arguments of a tool call
+
+        Args:
+            tool: Tool name the cursor is bound to
+            arguments: Tool call arguments
+            query_keys: Arguments that define the result set; a cursor issued
+                for different values is rejected
+            default_page_size: Page size when none is given
+
+        Raises:
+            ToolError: If the cursor is malformed or belongs to another query
+        """
+        query = {key: arguments.get(key) for key in query_keys}
+        page_size = max(1, min(int(arguments.get("page_size") or default_page_size), MAX_PAGE_SIZE))
+        if arguments.get("max_bytes"):
+            max_bytes = int(arguments["max_bytes"])
+        elif arguments.get("max_tokens"):
+            max_bytes = int(arguments["max_tokens"]) * BYTES_PER_TOKEN
+        else:
+            max_bytes = DEFAULT_MAX_BYTES
+        max_bytes = max(max_bytes, MIN_MAX_BYTES)
+
+        offset, state = 0, {}
+        cursor = arguments.get("cursor")
+        if cursor:
+            try:
+                padded = cursor + "=" * (-len(cursor) % 4)
+                decoded = json.loads(base64.urlsafe_b64decode(padded.encode()))
+                offset = int(decoded["o"])
+                state = dict(decoded.get("s") or {})
+                fingerprint = decoded["f"]
+            except (binascii.Error, ValueError, KeyError, TypeError) as e:
+                raise ToolError("INVALID_CURSOR", f"Malformed cursor: {e}")
+            if fingerprint != _fingerprint(tool, query):
+                raise ToolError(
+                    "INVALID_CURSOR",
+                    f"Cursor was issued for a different {tool} query; start again without a cursor"
+                )
+
+        return cls(
+            tool=tool, query=query, page_size=page_size, max_bytes=max_bytes,
+            offset=offset, state=state, as_json=arguments.get("format") == "json",
+        )
+
+    def cursor_for(self, offset: int, **state) -> str:
+        """Encode an opaque cursor pointing at ``offset`` with resume ``state``"""
+        payload = {"f": _fingerprint(self.tool, self.query), "o": offset, "s": state}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+        return encoded.decode().rstrip("=")
+
+
+class PageBuilder:
+    """Accumulates rendered items until the page size or byte budget is reached
+
+    The first item is always accepted so every page makes progress. In JSON
+    mode items are added already serialized and the page becomes a ToolResult
+    whose metadata carries the range and ``next_cursor``.
+
+    Example:
+        page = PageBuilder(request, header)
+        for item in items:
+            if not page.add(render(item)):
+                break
+        text = page.finish(next_cursor)
+    """
+
+    def __init__(self, request: PageRequest, header: str = ""):
+        self.request = request
+        self.header = header
+        self.items: List[str] = []
+        self.size = 0 if request.as_json else len(header.encode())
+        self.truncated = False
+
+    @property
+    def full(self) -> bool:
+        return self.truncated or len(self.items) >= self.request.page_size
+
+    def add(self, text: str) -> bool:
+        """Add one rendered item; returns False (item not added) once the page is full"""
+        if self.full:
+            return False
+        size = len(text.encode())
+        if self.items and self.size + size > self.request.max_bytes:
+            self.truncated = True
+            return False
+        self.items.append(text)
+        self.size += size
+        return True
+
+    def finish(self, next_cursor: Optional[str], footer: str = "", metadata: Optional[Dict] = None) -> str:
+        """Render the page with a range line and, if there is more, the continuation cursor
+
+        Args:
+            next_cursor: Cursor for the next page, or None on the last page
+            footer: Markdown appended after the items
+            metadata: Extra fields for the JSON result (ignored for markdown)
+        """
+        if self.request.as_json:
+            page_metadata = {
+                **(metadata or {}),
+                "offset": self.request.offset,
+                "count": len(self.items),
+                "next_cursor": next_cursor,
+            }
+            # Items are pre-serialized, so only the envelope is encoded here
+            return '{"data":[' + ",".join(self.items) + '],"metadata":' + _dumps(page_metadata) + "}"
+
+        start = self.request.offset + 1
+        end = self.request.offset + len(self.items)
+        result = self.header
+        if self.items:
+            result += f"_Showing items {start}–{end}"
+            result += " (more available)_\n\n" if next_cursor else "_\n\n"
+        else:
+            result += "_No results._\n"
+        result += "".join(self.items)
+        if next_cursor:
+            reason = "size budget" if self.truncated else "page size"
+            result += (
+                f"\n➡️ **More results** (page limited by {reason}). "
+                f"Call `{self.request.tool}` again with `cursor: \"{next_cursor}\"` for the next page.\n"
+            )
+        result += footer
+        return result
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _item_renderer(
+    request: PageRequest, render: Callable[[Any], str], to_data: Optional[Callable[[Any], Any]]
+) -> Callable[[Any], str]:
+    if not request.as_json:
+        return render
+    if to_data is None:
+        return _dumps
+    return lambda item: _dumps(to_data(item))
+
+
+def paginate(
+    request: PageRequest,
+    items: List[Any],
+    render: Callable[[Any], str],
+    header: str = "",
+    footer: str = "",
+    to_data: Optional[Callable[[Any], Any]] = None,
+    metadata: Optional[Dict] = None,
+) -> str:
+    """Page through an in-memory list, starting at the request's offset
+
+    Args:
+        request: Parsed page request
+        items: Full, stably ordered result list
+        render: Callable turning one item into its markdown text
+        to_data: Callable turning one item into its JSON form (default: the item itself)
+        metadata: Extra fields for the JSON result
+    """
+    render = _item_renderer(request, render, to_data)
+    page = PageBuilder(request, header)
+    position = request.offset
+    while position < len(items) and not page.full and page.add(render(items[position])):
+        position += 1
+    next_cursor = request.cursor_for(position) if position < len(items) else None
+    return page.finish(next_cursor, footer, metadata)
+
+
+def paginate_query(
+    request: PageRequest,
+    fetch: Callable[[int, int], List[Any]],
+    render: Callable[[Any], str],
+    header: str = "",
+    footer: str = "",
+    to_data: Optional[Callable[[Any], Any]] = None,
+    metadata: Optional[Dict] = None,
+) -> str:
+    """Page through a store that can read a window of its results (e.g. SQL LIMIT/OFFSET)
+
+    Reads one item more than the page can hold to learn whether another page
+    follows, so only the requested window is ever loaded.
+
+    Args:
+        request: Parsed page request
+        fetch: Called with ``(offset, limit)``; returns up to ``limit`` items of
+            a stably ordered result set starting at ``offset``
+        render: Callable turning one item into its markdown text
+        to_data: Callable turning one item into its JSON form (default: the item itself)
+        metadata: Extra fields for the JSON result
+    """
+    render = _item_renderer(request, render, to_data)
+    page = PageBuilder(request, header)
+    items = fetch(request.offset, request.page_size + 1)
+    shown = 0
+    while shown < len(items) and not page.full and page.add(render(items[shown])):
+        shown += 1
+    next_cursor = request.cursor_for(request.offset + shown) if shown < len(items) else None
+    return page.finish(next_cursor, footer, metadata)
+
+
+async def paginate_upstream(
+    request: PageRequest,
+    fetch_pages: Callable[[Optional[str]], AsyncIterator[Tuple[List[Any], Optional[str]]]],
+    render: Callable[[Any], str],
+    header: str = "",
+    footer: str = "",
+    to_data: Optional[Callable[[Any], Any]] = None,
+    metadata: Optional[Dict] = None,
+) -> str:
+    """Page through an n8n cursor-paginated listing without re-reading earlier pages
+
+    The continuation cursor stores n8n's cursor for the upstream page holding
+    the next item plus how many of its items were already shown, so the next
+    call resumes with a single request instead of listing from the start.
+
+    Args:
+        request: Parsed page request
+        fetch_pages: Called with an n8n cursor (None for the first page); yields
+            ``(items, next_upstream_cursor)`` tuples, e.g. N8nClient.iter_workflow_pages
+        render: Callable turning one item into its markdown text
+        to_data: Callable turning one item into its JSON form (default: the item itself)
+        metadata: Extra fields for the JSON result
+    """
+    render = _item_renderer(request, render, to_data)
+    page = PageBuilder(request, header)
+    upstream = request.state.get("upstream")
+    skip = int(request.state.get("skip", 0))
+    next_cursor = None
+
+    async for items, upstream_next in fetch_pages(upstream):
+        while skip < len(items) and not page.full and page.add(render(items[skip])):
+            skip += 1
+        shown = request.offset + len(page.items)
+        if skip < len(items):
+            next_cursor = request.cursor_for(shown, upstream=upstream, skip=skip)
+            break
+        if page.full and upstream_next:
+            # Page ended exactly on an upstream page boundary
+            next_cursor = request.cursor_for(shown, upstream=upstream_next, skip=0)
+            break
+        upstream, skip = upstream_next, 0
+
+    return page.finish(next_cursor, footer, metadata)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Tool Registry
+Maps tool names to their handler classes, importing each handler module on first use
+"""
+import asyncio
+import importlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from mcp.types import TextContent, Tool
+
+from ..analyzer_executor import AnalyzerTimeoutError, current_tool
+from ..deadlines import (
+    DeadlineConfig, DeadlineExceeded, PartialResult, collect_partial, current_deadline, deadline_scope,
+)
+from .base import BaseTool, ToolError, ToolResult
+from .catalog import ToolCatalog, get_tool_catalog
+
+if TYPE_CHECKING:
+    from ..dependencies import Dependencies
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+
+@dataclass(frozen=True)
+class HandlerSpec:
+    """A tool handler class and the tool names it serves"""
+    module: str          # module path relative to this package, e.g. ".workflow_tools"
+    class_name: str
+    tools: frozenset
+
+
+def _spec(module: str, class_name: str, *tools: str) -> HandlerSpec:
+    return HandlerSpec(module, class_name, frozenset(tools))
+
+
+# Order matters: when a tool name is listed under several handlers,
+# the first one wins (e.g. compare_workflows is served by DriftTools).
+HANDLER_SPECS = (
+    _spec(
+        ".workflow_tools", "WorkflowTools",
+        "suggest_workflow_nodes", "generate_workflow_template", "analyze_workflow",
+        "list_workflows", "create_workflow", "update_workflow", "delete_workflow",
+        "get_workflow", "get_workflow_details", "activate_workflow", "deactivate_workflow",
+        "get_workflow_executions", "execute_workflow", "validate_workflow_structure",
+        "get_workflow_statistics", "clone_workflow",
+    ),
+    _spec(
+        ".security_tools", "SecurityTools",
+        "audit_workflow_security", "get_security_summary", "check_compliance",
+        "get_critical_findings", "rbac_get_status", "rbac_add_user",
+        "rbac_get_user_info", "rbac_check_permission", "rbac_create_approval_request",
+        "rbac_approve_request", "rbac_reject_request", "rbac_get_pending_approvals",
+        "rbac_create_tenant", "rbac_get_audit_log",
+    ),
+    _spec(
+        ".template_tools", "TemplateTools",
+        "recommend_templates", "get_template_library", "search_templates",
+        "get_templates_by_category", "get_templates_by_difficulty", "get_template_details",
+        "analyze_intent_coverage", "suggest_node_intent", "add_node_intent",
+        "get_workflow_intents", "update_node_intent",
+    ),
+    _spec(
+        ".execution_tools", "ExecutionTools",
+        "get_executions", "get_execution_details", "watch_workflow_execution",
+        "get_execution_error_context", "analyze_execution_errors",
+    ),
+    _spec(
+        ".drift_tools", "DriftTools",
+        "detect_workflow_drift", "analyze_drift_pattern", "get_drift_root_cause",
+        "get_drift_fix_suggestions", "compare_workflows",
+    ),
+    _spec(
+        ".explainability_tools", "ExplainabilityTools",
+        "explain_node", "explain_workflow", "get_workflow_purpose",
+        "explain_template_match",
+    ),
+    _spec(
+        ".session_tools", "SessionTools",
+        "get_session_state", "set_active_workflow", "get_active_workflow",
+        "get_recent_workflows", "get_session_history", "clear_session_state",
+        "get_client_metrics", "get_tool_metrics", "get_scheduler_status",
+    ),
+    _spec(
+        ".migration_tools", "MigrationTools",
+        "migrate_workflow", "get_migration_preview", "batch_check_compatibility",
+    ),
+    _spec(
+        ".change_impact_tools", "ChangeImpactTools",
+        "compare_workflows", "analyze_change_impact", "discover_nodes", "get_node_schema",
+    ),
+    _spec(
+        ".documentation_tools", "DocumentationTools",
+        "get_node_documentation", "search_n8n_docs", "discover_github_templates", "import_github_repo",
+    ),
+    _spec(
+        ".advanced_template_tools", "AdvancedTemplateTools",
+        "sync_templates", "get_template_stats", "get_popular_templates", "get_recent_templates",
+        "get_template_by_id", "clear_template_cache", "find_templates_by_intent",
+        "extract_template_intent", "adapt_template", "get_template_provenance",
+        "get_template_requirements", "check_workflow_compatibility",
+    ),
+    _spec(
+        ".miscellaneous_tools", "MiscellaneousTools",
+        "get_drift_root_cause", "get_drift_fix_suggestions", "detect_schema_drift",
+        "detect_rate_limit_drift", "detect_quality_drift", "trace_data_flow",
+        "map_dependencies", "simulate_workflow_changes", "create_change_request",
+        "review_change_request", "get_change_history", "get_available_migrations",
+        "generate_workflow_template", "debug_workflow_error", "search_nodes",
+        "recommend_nodes_for_task",
+    ),
+    _spec(
+        ".validation_tools", "ValidationTools",
+        "validate_workflow", "validate_workflow_json", "analyze_workflow_semantics",
+    ),
+    _spec(
+        ".batch_tools", "BatchTools",
+        "batch_call",
+    ),
+)
+
+
+class ToolRegistry:
+    """Routes tool calls to handler instances that are built on first use
+
+    Handler modules (and the analyzers they import) are only imported when
+    one of their tools is called, so server startup stays cheap no matter
+    how many tools are registered. The advertised schemas come from the
+    frozen ToolCatalog, and routing is a single dict lookup per call.
+
+    Every call runs under its tool's deadline (see deadlines.py). Analyzers
+    and n8n requests see the deadline and stop early; a call still running
+    after the grace period is cancelled and answered with whatever partial
+    results it recorded, flagged as incomplete.
+    """
+
+    def __init__(
+        self,
+        deps: 'Dependencies',
+        specs: tuple = HANDLER_SPECS,
+        catalog: Optional[ToolCatalog] = None,
+        deadlines: Optional[DeadlineConfig] = None,
+    ):
+        self.deps = deps
+        self.specs = specs
+        self._catalog = catalog
+        self.deadlines = deadlines or DeadlineConfig.from_env()
+        self._routes: Dict[str, HandlerSpec] = {}
+        for spec in specs:
+            for tool_name in spec.tools:
+                self._routes.setdefault(tool_name, spec)
+        self._handlers: Dict[HandlerSpec, 'BaseTool'] = {}
+        # handler class name -> seconds spent importing and constructing it
+        self.load_times: Dict[str, float] = {}
+
+    @property
+    def catalog(self) -> ToolCatalog:
+        """Frozen tool catalog, built and validated on first access"""
+        if self._catalog is None:
+            self._catalog = get_tool_catalog()
+            unroutable = self.unroutable_tools()
+            if unroutable:
+                logger.warning(f"Tools listed without a handler: {', '.join(unroutable)}")
+        return self._catalog
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._routes
+
+    def tool_names(self) -> List[str]:
+        """All routable tool names"""
+        return list(self._routes)
+
+    def list_tools(self) -> list[Tool]:
+        """Advertised tool definitions (shared, pre-validated objects)"""
+        return list(self.catalog.tools)
+
+    def unroutable_tools(self) -> List[str]:
+        """Advertised tools that no handler serves"""
+        return sorted(name for name in self.catalog.names() if name not in self._routes)
+
+    def handler_for(self, name: str) -> Optional['BaseTool']:
+        """Get (building if necessary) the handler serving a tool
+
+        Returns:
+            Handler instance, or None if no handler serves this tool
+        """
+        spec = self._routes.get(name)
+        if spec is None:
+            return None
+        handler = self._handlers.get(spec)
+        if handler is None:
+            started = time.perf_counter()
+            module = importlib.import_module(spec.module, __package__)
+            handler = getattr(module, spec.class_name)(self.deps)
+            self._handlers[spec] = handler
+            self.load_times[spec.class_name] = time.perf_counter() - started
+            logger.debug(f"Loaded {spec.class_name} in {self.load_times[spec.class_name] * 1000:.1f}ms")
+        return handler
+
+    async def dispatch(self, name: str, arguments: dict) -> list[TextContent]:
+        """Route a tool call to its handler
+
+        With ``format: "json"`` handlers return a ToolResult, which is
+        serialized here; tools with their own JSON format (e.g.
+        audit_workflow_security) and paginated tools return their JSON
+        text unchanged. Tools whose schema does not offer JSON output are
+        refused rather than having their markdown wrapped.
+
+        Raises:
+            ToolError: UNSUPPORTED_FORMAT for ``format: "json"`` on a markdown-only tool
+        """
+        handler = self.handler_for(name)
+        if handler is None:
+            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        as_json = bool(arguments) and arguments.get("format") == "json"
+        if as_json and not self.catalog.supports_json(name):
+            raise ToolError(
+                "UNSUPPORTED_FORMAT",
+                f"{name} has no structured output; call it without format=\"json\" for markdown",
+            )
+        # Calls nested in another (batch_call) get less grace, so they are
+        # cut off and report their partial results before the outer call is
+        grace = self.deadlines.grace / 2 if current_deadline() is not None else self.deadlines.grace
+        started = time.monotonic()
+        token = current_tool.set(name)
+        try:
+            with deadline_scope(self.deadlines.timeout_for(name)) as deadline, collect_partial() as partial:
+                hard_timeout = None if deadline is None else deadline - started + grace
+                try:
+                    async with asyncio.timeout(hard_timeout):
+                        contents = await handler.handle(name, arguments)
+                except (TimeoutError, DeadlineExceeded, AnalyzerTimeoutError) as e:
+                    budget = (deadline or time.monotonic()) - started
+                    logger.warning(f"Tool {name} stopped after {time.monotonic() - started:.1f}s: {e or 'deadline exceeded'}")
+                    return _incomplete(name, budget, partial, as_json)
+        finally:
+            current_tool.reset(token)
+        if isinstance(contents, ToolResult):
+            return [TextContent(type="text", text=contents.to_json())]
+        return contents
+
+    def loaded_handlers(self) -> List[str]:
+        """Class names of handlers built so far"""
+        return [spec.class_name for spec in self._handlers]
+
+
+# Longest JSON rendering of one partial result section in markdown output
+PARTIAL_SECTION_MAX_CHARS = 4_000
+
+
+def _incomplete(name: str, budget: float, partial: PartialResult, as_json: bool) -> list[TextContent]:
+    """Answer a call stopped at its deadline with the partial results it recorded"""
+    if as_json:
+        result = ToolResult(
+            data=partial.sections,
+            metadata={"incomplete": True, "timeout_seconds": round(budget, 3), "skipped": partial.skipped},
+        )
+        return [TextContent(type="text", text=result.to_json())]
+
+    text = f"⏱️ **Incomplete result:** `{name}` did not finish within {budget:.1f}s and was stopped.\n\n"
+    if partial.sections:
+        text += "## Partial Results\n\n"
+        for section, value in partial.sections.items():
+            rendered = json.dumps(value, indent=2, default=str)
+            if len(rendered) > PARTIAL_SECTION_MAX_CHARS:
+                rendered = rendered[:PARTIAL_SECTION_MAX_CHARS] + "\n... (truncated)"
+            text += f"### {section}\n\n```json\n{rendered}\n```\n\n"
+    else:
+        text += "_No partial results were recorded before the deadline._\n\n"
+    if partial.skipped:
+        text += f"**Skipped:** {', '.join(partial.skipped)}\n\n"
+    text += "💡 Narrow the request (e.g. fewer executions) or raise this tool's deadline via `N8N_TOOL_TIMEOUTS`.\n"
+    return [TextContent(type="text", text=text)]
@@ -61,7 +61,8 @@ class SecurityTools(BaseTool):
         report_format = arguments.get("format", "markdown")
         
         workflow_data = await self.deps.client.get_workflow(workflow_id)
-        report, score = self.deps.security_auditor.audit_and_report(
+        report, score = await self._run_analyzer(
+            self.deps.security_auditor.audit_and_report,
             workflow_data,
             format=report_format
         )
@@ -73,7 +74,9 @@ class SecurityTools(BaseTool):
         workflow_id = arguments["workflow_id"]
         
         workflow_data = await self.deps.client.get_workflow(workflow_id)
-        summary = self.deps.security_auditor.get_summary(workflow_data)
+        summary = await self._run_analyzer(self.deps.security_auditor.get_summary, workflow_data)
+        if self._wants_json(arguments):
+            return self._json_result(summary, workflow_id=workflow_id)
         
         result = f"# 🔐 Security Summary\n\n"
         result += f"**Workflow:** {summary['workflow_name']}\n"
@@ -98,10 +101,16 @@ class SecurityTools(BaseTool):
         standard = arguments.get("standard", "basic")
         
         workflow_data = await self.deps.client.get_workflow(workflow_id)
-        is_compliant, violations = self.deps.security_auditor.validate_compliance(
+        is_compliant, violations = await self._run_analyzer(
+            self.deps.security_auditor.validate_compliance,
             workflow_data,
             standard=standard
         )
+        if self._wants_json(arguments):
+            return self._json_result(
+                {"standard": standard, "compliant": is_compliant, "violations": violations},
+                workflow_id=workflow_id
+            )
         
         result = f"# ✅ Compliance Check\n\n"
         result += f"**Standard:** {standard.upper()}\n"
@@ -121,7 +130,12 @@ class SecurityTools(BaseTool):
         workflow_id = arguments["workflow_id"]
         
         workflow_data = await self.deps.client.get_workflow(workflow_id)
-        findings = self.deps.security_auditor.get_critical_findings(workflow_data)
+        findings = await self._run_analyzer(self.deps.security_auditor.get_critical_findings, workflow_data)
+        if self._wants_json(arguments):
+            return self._json_result(
+                {category: [f.to_dict() for f in items] for category, items in findings.items()},
+                workflow_id=workflow_id
+            )
         
         total = (len(findings['secrets']) + len(findings['authentication']) +
                 len(findings['exposure']))
@@ -185,7 +199,10 @@ class SecurityTools(BaseTool):
         user_info = self.deps.rbac_manager.get_user_info(username)
         
         if not user_info:
-            return [TextContent(type="text", text=f"❌ User '{username}' not found")]
+            return self._notice(arguments, f"❌ User '{username}' not found")
+        
+        if self._wants_json(arguments):
+            return self._json_result(user_info)
         
         result = f"# User Information: {username}\n\n"
         result += f"**Role:** {user_info['role_name']} ({user_info['role']})\n"
@@ -277,6 +294,9 @@ class SecurityTools(BaseTool):
         username = arguments.get("username")
         pending = self.deps.rbac_manager.get_pending_approvals(username)
         
+        if self._wants_json(arguments):
+            return self._json_result(pending, count=len(pending), username=username)
+        
         if not pending:
             result = "✅ No pending approval requests"
             if username:
@@ -322,6 +342,9 @@ class SecurityTools(BaseTool):
         
         logs = self.deps.rbac_manager.get_audit_log(limit, username, action)
         
+        if self._wants_json(arguments):
+            return self._json_result(logs, count=len(logs))
+        
         if not logs:
             result = "📋 No audit log entries found"
             if username:
@@ -8,6 +8,7 @@ from typing import Any, TYPE_CHECKING
 from mcp.types import TextContent
 
 from .base import BaseTool, ToolError
+from ..tracing import TOOL, get_tracer
 
 if TYPE_CHECKING:
     from ..dependencies import Dependencies
@@ -33,6 +34,9 @@ class SessionTools(BaseTool):
             "get_recent_workflows": self.get_recent_workflows,
             "get_session_history": self.get_session_history,
             "clear_session_state": self.clear_session_state,
+            "get_client_metrics": self.get_client_metrics,
+            "get_tool_metrics": self.get_tool_metrics,
+            "get_scheduler_status": self.get_scheduler_status,
         }
         
         handler = handlers.get(name)
@@ -44,6 +48,18 @@ class SessionTools(BaseTool):
     async def get_session_state(self, arguments: dict) -> list[TextContent]:
         """Get summary of current session state"""
         result = self.deps.state_manager.get_state_summary()
+        
+        # Show how many n8n round trips the workflow cache saved this session
+        get_cache_stats = getattr(self.deps.client, "get_cache_stats", None)
+        cache_stats = get_cache_stats() if callable(get_cache_stats) else None
+        if isinstance(cache_stats, dict):
+            result += "\n## Workflow Cache:\n\n"
+            result += f"- Cached workflows: {cache_stats['size']}/{cache_stats['max_entries']}\n"
+            result += f"- Hits (saved round trips): {cache_stats['hits']}\n"
+            result += f"- Misses: {cache_stats['misses']}\n"
+            result += f"- Hit rate: {cache_stats['hit_rate']:.0%}\n"
+            result += f"- Coalesced concurrent requests: {cache_stats.get('coalesced_requests', 0)}\n"
+        
         return [TextContent(type="text", text=result)]
     
     async def set_active_workflow(self, arguments: dict) -> list[TextContent]:
@@ -67,6 +83,9 @@ class SessionTools(BaseTool):
         """Get the currently active workflow"""
         current = self.deps.state_manager.get_current_workflow()
         
+        if self._wants_json(arguments):
+            return self._json_result(current)
+        
         if not current:
             return [TextContent(
                 type="text",
@@ -83,6 +102,9 @@ class SessionTools(BaseTool):
         """Get recently accessed workflows"""
         recent = self.deps.state_manager.get_recent_workflows()
         
+        if self._wants_json(arguments):
+            return self._json_result(recent, count=len(recent))
+        
         if not recent:
             return [TextContent(
                 type="text",
@@ -101,6 +123,9 @@ class SessionTools(BaseTool):
         limit = arguments.get("limit", 10)
         history = self.deps.state_manager.get_session_history(limit)
         
+        if self._wants_json(arguments):
+            return self._json_result(history, count=len(history))
+        
         if not history:
             return [TextContent(
                 type="text",
@@ -126,3 +151,166 @@ class SessionTools(BaseTool):
         result += "All session data (active workflow, recent workflows, history) has been reset."
         
         return [TextContent(type="text", text=result)]
+
+    async def get_client_metrics(self, arguments: dict) -> list[TextContent]:
+        """Report per-endpoint n8n API metrics collected by the client"""
+        client = self.deps.client
+        metrics = client.get_request_metrics()
+
+        if self._wants_json(arguments):
+            data = {
+                "requests": metrics,
+                "resilience": client.get_resilience_stats(),
+                "workflow_cache": client.get_cache_stats(),
+            }
+            if self.deps.is_loaded("analyzer_executor") and self.deps.analyzer_executor is not None:
+                data["analyzer_executor"] = self.deps.analyzer_executor.get_stats()
+            if arguments.get("reset", False):
+                client.metrics.reset()
+            return self._json_result(data)
+
+        result = "# 📊 n8n API Request Metrics\n\n"
+        result += f"**Since:** {metrics['since']}\n"
+        result += f"**Total Requests:** {metrics['total_requests']}\n\n"
+
+        if metrics["endpoints"]:
+            result += "| Endpoint | Requests | Errors | p50 ms | p95 ms | p99 ms | Max ms | Received | Status codes |\n"
+            result += "|---|---|---|---|---|---|---|---|---|\n"
+            for endpoint, stats in metrics["endpoints"].items():
+                latency = stats["latency"]
+                codes = ", ".join(f"{code}×{count}" for code, count in stats["status_codes"].items())
+                result += (
+                    f"| `{endpoint}` | {stats['requests']} | {stats['errors']} | "
+                    f"{latency['p50_ms']} | {latency['p95_ms']} | {latency['p99_ms']} | {latency['max_ms']} | "
+                    f"{stats['bytes_received'] / 1024:.1f} KB | {codes} |\n"
+                )
+        else:
+            result += "_No requests to n8n recorded yet._\n"
+
+        resilience = client.get_resilience_stats()
+        result += "\n## Resilience:\n\n"
+        result += f"- Attempts: {resilience['requests']}\n"
+        result += f"- Throttled: {resilience['throttled']}\n"
+        result += f"- Retried: {resilience['retried']}\n"
+        result += f"- Short-circuited: {resilience['short_circuited']}\n"
+        for endpoint, state in resilience["circuits"].items():
+            result += f"- Circuit `{endpoint}`: {state}\n"
+
+        cache_stats = client.get_cache_stats()
+        result += "\n## Workflow Cache:\n\n"
+        result += f"- Hits (saved round trips): {cache_stats['hits']}\n"
+        result += f"- Hit rate: {cache_stats['hit_rate']:.0%}\n"
+        result += f"- Coalesced concurrent requests: {cache_stats.get('coalesced_requests', 0)}\n"
+
+        # Only report the analyzer pool if a tool has already started it
+        if self.deps.is_loaded("analyzer_executor") and self.deps.analyzer_executor is not None:
+            executor_stats = self.deps.analyzer_executor.get_stats()
+            result += "\n## Analyzer Executor:\n\n"
+            result += f"- Mode: {executor_stats['mode']} ({executor_stats['max_workers']} workers, "
+            result += f"max {executor_stats['max_concurrent']} concurrent)\n"
+            result += f"- Completed: {executor_stats['completed']}\n"
+            result += f"- Failed: {executor_stats['failed']}\n"
+            result += f"- Timed out: {executor_stats['timed_out']}\n"
+            result += f"- Queued behind the concurrency cap: {executor_stats['queued']} "
+            result += f"(longest wait {executor_stats['max_wait_seconds']}s)\n"
+
+        if arguments.get("reset", False):
+            client.metrics.reset()
+            result += "\n🔄 Counters reset.\n"
+
+        return [TextContent(type="text", text=result)]
+
+    async def get_tool_metrics(self, arguments: dict) -> list[TextContent]:
+        """Report per-tool call counts, errors and latency from tracing spans"""
+        tracer = get_tracer()
+
+        if arguments.get("format") == "prometheus":
+            return [TextContent(type="text", text=tracer.prometheus_text())]
+
+        snapshot = tracer.snapshot()
+        if self._wants_json(arguments):
+            if arguments.get("reset", False):
+                tracer.reset()
+            return self._json_result(snapshot)
+        result = "# ⏱️ Tool Metrics\n\n"
+        result += f"**Since:** {snapshot['since']}\n"
+        if tracer.trace_file:
+            result += f"**Trace File:** `{tracer.trace_file}`\n"
+        result += "\n"
+
+        sections = [
+            (TOOL, "Tool Calls"),
+            ("analyzer", "Analyzer Runs"),
+            ("stage", "Analysis Stages"),
+            ("client", "n8n API Requests"),
+            ("job", "Background Jobs"),
+        ]
+        for kind, title in sections:
+            rows = [(key.split(":", 1)[1], stats) for key, stats in snapshot["spans"].items()
+                    if key.split(":", 1)[0] == kind]
+            if not rows:
+                continue
+            result += f"## {title}\n\n"
+            result += "| Name | Calls | Errors | Avg ms | p50 ms | p95 ms | p99 ms | Max ms |\n"
+            result += "|---|---|---|---|---|---|---|---|\n"
+            for name, stats in rows:
+                latency = stats["latency"]
+                result += (
+                    f"| `{name}` | {stats['calls']} | {stats['errors']} | {latency['avg_ms']} | "
+                    f"{latency['p50_ms']} | {latency['p95_ms']} | {latency['p99_ms']} | {latency['max_ms']} |\n"
+                )
+            result += "\n"
+
+        if not snapshot["spans"]:
+            result += "_No spans recorded yet._\n"
+
+        if arguments.get("reset", False):
+            tracer.reset()
+            result += "\n🔄 Counters reset.\n"
+
+        return [TextContent(type="text", text=result)]
+
+    async def get_scheduler_status(self, arguments: dict) -> list[TextContent]:
+        """Report background cache refresh jobs and optionally start one now"""
+        scheduler = self.deps.scheduler
+        if scheduler is None:
+            raise ToolError("NOT_CONFIGURED", "No background scheduler is configured")
+
+        run_now = arguments.get("run_now")
+        if run_now:
+            if run_now not in scheduler.jobs:
+                raise ToolError("UNKNOWN_JOB", f"No background job named '{run_now}'")
+            scheduler.trigger(run_now)
+
+        status = scheduler.status()
+        if self._wants_json(arguments):
+            return self._json_result(status, triggered=run_now)
+
+        result = "# 🗓️ Background Scheduler\n\n"
+        if not status["enabled"]:
+            result += "**Status:** disabled (N8N_SCHEDULER=off) - caches refresh only on tool calls or `run_now`\n\n"
+        else:
+            result += f"**Status:** {'running' if status['started'] else 'not started'}\n"
+            result += f"**Concurrency:** {status['max_concurrent']} job(s) at a time, jitter ±{status['jitter']:.0%}\n\n"
+        if run_now:
+            result += f"▶️ Started `{run_now}` in the background.\n\n"
+
+        result += "| Job | Interval | Runs | Failures | Last Run | Duration | Next Run |\n"
+        result += "|---|---|---|---|---|---|---|\n"
+        for name, job in status["jobs"].items():
+            interval = f"{job['interval_seconds']:g}s" if job["enabled"] else "disabled"
+            duration = f"{job['last_duration_ms']:.0f}ms" if job["last_duration_ms"] is not None else "-"
+            last_run = "running" if job["running"] else (job["last_finished"] or "never")
+            result += (
+                f"| `{name}` | {interval} | {job['runs']} | {job['failures']} | "
+                f"{last_run} | {duration} | {job['next_run'] or '-'} |\n"
+            )
+
+        for name, job in status["jobs"].items():
+            if job["last_error"]:
+                result += f"\n⚠️ **{name}** last failed: {job['last_error']}\n"
+            elif isinstance(job["last_result"], dict):
+                summary = ", ".join(f"{key}: {value}" for key, value in job["last_result"].items())
+                result += f"\n✅ **{name}** last result: {summary}\n"
+
+        return [TextContent(type="text", text=result)]
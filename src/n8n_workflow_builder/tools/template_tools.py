@@ -316,8 +316,8 @@ class TemplateTools(BaseTool):
         node_name = arguments["node_name"]
         reason = arguments["reason"]
         
-        # Fetch workflow
-        workflow = await self.deps.client.get_workflow(workflow_id)
+        # Fetch workflow (fresh: it is written back as the update's base)
+        workflow = await self.deps.client.get_workflow(workflow_id, use_cache=False)
         
         # Find node
         node = None
@@ -353,7 +353,7 @@ class TemplateTools(BaseTool):
         self.deps.intent_manager.add_intent_to_node(node, intent)
         
         # Save workflow
-        await self.deps.client.update_workflow(workflow_id, workflow)
+        await self.deps.client.update_workflow(workflow_id, workflow, base_workflow=workflow)
         
         # Log action
         self.deps.state_manager.log_action("add_node_intent", {
@@ -414,8 +414,8 @@ class TemplateTools(BaseTool):
         workflow_id = arguments["workflow_id"]
         node_name = arguments["node_name"]
         
-        # Fetch workflow
-        workflow = await self.deps.client.get_workflow(workflow_id)
+        # Fetch workflow (fresh: it is written back as the update's base)
+        workflow = await self.deps.client.get_workflow(workflow_id, use_cache=False)
         
         # Find node
         node = None
@@ -453,7 +453,7 @@ class TemplateTools(BaseTool):
         self.deps.intent_manager.update_node_intent(node, updates)
         
         # Save workflow
-        await self.deps.client.update_workflow(workflow_id, workflow)
+        await self.deps.client.update_workflow(workflow_id, workflow, base_workflow=workflow)
         
         # Log action
         self.deps.state_manager.log_action("update_node_intent", {
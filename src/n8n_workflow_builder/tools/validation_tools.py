@@ -138,6 +138,23 @@ class ValidationTools(BaseTool):
         if not workflow.get("settings", {}).get("executionOrder"):
             info.append("Execution order not explicitly set - using default 'v1' order")
         
+        if self._wants_json(arguments):
+            return self._json_result(
+                {
+                    "valid": not errors,
+                    "errors": errors,
+                    "warnings": warnings,
+                    "info": info,
+                    "stats": {
+                        "nodes": len(nodes),
+                        "disabled_nodes": len([n for n in nodes if n.get('disabled')]),
+                        "disconnected_nodes": sorted(disconnected),
+                    },
+                },
+                workflow_id=workflow_id,
+                workflow_name=workflow.get('name'),
+            )
+        
         # Format result
         result = f"# Validation Report: {workflow.get('name', 'Unnamed Workflow')}\\n\\n"
         
@@ -196,6 +213,8 @@ class ValidationTools(BaseTool):
         # 1. Required Fields
         if not isinstance(workflow, dict):
             errors.append("Workflow must be a dictionary/object")
+            if self._wants_json(arguments):
+                return self._json_result({"valid": False, "errors": errors, "warnings": warnings})
             return [TextContent(type="text", text=f"❌ **Invalid Workflow**\\n\\n{errors[0]}")]
         
         if "nodes" not in workflow:
@@ -233,6 +252,9 @@ class ValidationTools(BaseTool):
         if "name" not in workflow:
             warnings.append("Workflow has no 'name' field")
         
+        if self._wants_json(arguments):
+            return self._json_result({"valid": not errors, "errors": errors, "warnings": warnings})
+        
         # Format result
         if errors:
             result = "# ❌ Validation Failed\\n\\n"
@@ -280,7 +302,10 @@ class ValidationTools(BaseTool):
             raise ToolError("API_ERROR", f"Failed to fetch workflow: {str(e)}")
 
         # Run semantic analysis
-        analysis = self.deps.semantic_analyzer.analyze_workflow_semantics(workflow)
+        analysis = await self._run_analyzer(self.deps.semantic_analyzer.analyze_workflow_semantics, workflow)
+
+        if self._wants_json(arguments):
+            return self._json_result(analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
 
         # Format report
         result = f"# 🔬 Semantic Analysis: {workflow.get('name', 'Unnamed Workflow')}\n\n"
@@ -8,6 +8,7 @@ from typing import Any, Dict, List
 from mcp.types import TextContent
 
 from .base import BaseTool, ToolError, WorkflowNotFoundError, ValidationError
+from .pagination import PageRequest, paginate_upstream
 from ..builders.workflow_builder import NODE_KNOWLEDGE
 from ..templates.recommender import WORKFLOW_TEMPLATES
 
@@ -106,6 +107,9 @@ class WorkflowTools(BaseTool):
             "complexity": analysis['complexity']
         })
         
+        if self._wants_json(args):
+            return self._json_result(analysis, workflow_id=workflow_id, workflow_name=workflow.get('name'))
+        
         result = f"# Workflow Analysis: {workflow.get('name', workflow_id)}\n\n"
         result += f"**Complexity:** {analysis['complexity']}\n"
         result += f"**Total Nodes:** {analysis['total_nodes']}\n\n"
@@ -127,22 +131,38 @@ class WorkflowTools(BaseTool):
         return [TextContent(type="text", text=result)]
     
     async def list_workflows(self, args: dict) -> list[TextContent]:
-        """List all workflows"""
+        """List workflows one page at a time (cursor, page_size, max_bytes)"""
         active_only = args.get("active_only", False)
+        request = PageRequest.from_arguments("list_workflows", args, query_keys=("active_only",))
         
+        def render(wf: Dict) -> str:
+            status = "🟢" if wf.get("active") else "⚪"
+            text = f"{status} **{wf['name']}**\n"
+            text += f"   ID: `{wf['id']}`\n"
+            text += f"   Nodes: {len(wf.get('nodes', []))}\n"
+            text += f"   Updated: {wf.get('updatedAt', 'N/A')}\n\n"
+            return text
+        
+        def fetch_pages(cursor):
+            return self.deps.client.iter_workflow_pages(
+                active_only, page_size=request.page_size, cursor=cursor
+            )
+        
+        def to_data(wf: Dict) -> Dict:
+            return {
+                "id": wf.get("id"),
+                "name": wf.get("name"),
+                "active": wf.get("active", False),
+                "nodes": len(wf.get("nodes", [])),
+                "updatedAt": wf.get("updatedAt"),
+            }
+        
+        header = f"# Workflows{' (active only)' if active_only else ''}\n\n"
         try:
-            workflows = await self.deps.client.get_workflows(active_only)
+            result = await paginate_upstream(request, fetch_pages, render, header, to_data=to_data)
         except Exception as e:
             raise ToolError("API_ERROR", f"Failed to list workflows: {str(e)}")
         
-        result = f"# Workflows ({len(workflows)} total)\n\n"
-        for wf in workflows:
-            status = "🟢" if wf.get("active") else "⚪"
-            result += f"{status} **{wf['name']}**\n"
-            result += f"   ID: `{wf['id']}`\n"
-            result += f"   Nodes: {len(wf.get('nodes', []))}\n"
-            result += f"   Updated: {wf.get('updatedAt', 'N/A')}\n\n"
-        
         return [TextContent(type="text", text=result)]
     
     async def get_workflow_details(self, args: dict) -> list[TextContent]:
@@ -167,6 +187,9 @@ class WorkflowTools(BaseTool):
             "workflow_name": workflow['name']
         })
         
+        if self._wants_json(args):
+            return self._json_result(workflow)
+        
         result = f"# Workflow: {workflow['name']}\n\n"
         result += f"**ID:** {workflow['id']}\n"
         result += f"**Active:** {'Yes' if workflow.get('active') else 'No'}\n"
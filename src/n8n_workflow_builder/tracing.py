@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tracing Module
+Lightweight spans for tool calls, n8n API requests and analyzer stages, with a JSON-lines trace file and Prometheus-text metrics
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .metrics import LatencyHistogram
+
+logger = logging.getLogger("n8n-workflow-builder")
+
+# Span kinds
+TOOL = "tool"          # one call_tool dispatch
+CLIENT = "client"      # one n8n API request
+ANALYZER = "analyzer"  # one analyzer run (see BaseTool._run_analyzer)
+STAGE = "stage"        # a major analysis stage (validation, semantic, data flow, FTS)
+JOB = "job"            # one background scheduler job run (see scheduler.py)
+
+# Span that is active in the current task/thread, parent of new spans
+_current_span: ContextVar[Optional['Span']] = ContextVar("current_span", default=None)
+
+TRACE_FLUSH_SPANS = 64        # buffered spans before the trace file is written
+TRACE_FLUSH_SECONDS = 1.0     # ... or time since the last write
+
+
+def _new_id() -> str:
+    return os.urandom(8).hex()
+
+
+class Span:
+    """One timed operation; finished spans are handed to their Tracer"""
+
+    __slots__ = (
+        "tracer", "name", "kind", "trace_id", "span_id", "parent_id",
+        "started_at", "_started", "duration_ms", "status", "error", "attributes",
+    )
+
+    def __init__(self, tracer: 'Tracer', name: str, kind: str, parent: Optional['Span'], attributes: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent else None
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.attributes = attributes
+
+    def set(self, **attributes) -> None:
+        """Attach attributes (e.g. result sizes) to the span"""
+        self.attributes.update(attributes)
+
+    def end(self, error: Union[BaseException, str, None] = None) -> None:
+        """Finish the span, marking it failed if an error is given"""
+        if self.duration_ms is not None:
+            return
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        if error is not None:
+            self.status = "error"
+            self.error = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+        self.tracer._finish(self)
+
+    def to_dict(self) -> Dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": datetime.fromtimestamp(self.started_at).isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class SpanStats:
+    """Call/error counters and a latency histogram for one (kind, name)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> Dict:
+        return {"calls": self.calls, "errors": self.errors, "latency": self.latency.to_dict()}
+
+
+class Tracer:
+    """Records spans into in-process metrics and, optionally, a trace file
+
+    Args:
+        trace_file: JSON-lines file that finished spans are appended to
+            (None keeps spans in metrics only)
+    """
+
+    def __init__(self, trace_file: Union[str, Path, None] = None):
+        self.trace_file = Path(trace_file).expanduser() if trace_file else None
+        self.stats: Dict[Tuple[str, str], SpanStats] = {}
+        self.started_at = datetime.now().isoformat()
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        # Spans also finish in analyzer worker threads
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'Tracer':
+        """Build a tracer writing to N8N_TRACE_LOG, if set"""
+        return cls(trace_file=os.getenv("N8N_TRACE_LOG") or None)
+
+    def start_span(self, name: str, kind: str = STAGE, **attributes) -> Span:
+        """Start a span under the current one without making it current
+
+        Use for operations that finish in a callback; call ``span.end()``.
+        """
+        return Span(self, name, kind, _current_span.get(), attributes)
+
+    @contextlib.contextmanager
+    def span(self, name: str, kind: str = STAGE, **attributes):
+        """Time a block as a span; nested spans become its children"""
+        span = self.start_span(name, kind, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            key = (span.kind, span.name)
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = SpanStats()
+            stats.calls += 1
+            if span.status == "error":
+                stats.errors += 1
+            stats.latency.record(span.duration_ms)
+
+            if self.trace_file is not None:
+                self._buffer.append(json.dumps(span.to_dict(), separators=(",", ":"), default=str))
+                if (len(self._buffer) >= TRACE_FLUSH_SPANS
+                        or time.monotonic() - self._last_flush >= TRACE_FLUSH_SECONDS):
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.trace_file, "a") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write trace file {self.trace_file}: {e}")
+
+    def flush(self) -> None:
+        """Write buffered spans to the trace file"""
+        with self._lock:
+            if self.trace_file is not None:
+                self._flush_locked()
+
+    def snapshot(self, kind: Optional[str] = None) -> Dict:
+        """Span stats per ``kind:name``, most called first"""
+        with self._lock:
+            items = [(key, stats.to_dict()) for key, stats in self.stats.items()
+                     if kind is None or key[0] == kind]
+        items.sort(key=lambda item: item[1]["calls"], reverse=True)
+        return {
+            "since": self.started_at,
+            "timestamp": datetime.now().isoformat(),
+            "spans": {f"{k}:{n}": stats for (k, n), stats in items},
+        }
+
+    def prometheus_text(self) -> str:
+        """Render all span metrics in the Prometheus text exposition format
+
+        Tool calls are exported as ``n8n_tool_*{tool=...}``; client requests,
+        analyzer runs, stages and background jobs as ``n8n_span_*{kind=...,name=...}``.
+        """
+        with self._lock:
+            items = sorted(self.stats.items())
+            snapshot = [(kind, name, stats.calls, stats.errors, stats.latency.buckets,
+                         list(stats.latency.counts), stats.latency.total_ms, stats.latency.count)
+                        for (kind, name), stats in items]
+
+        families = {
+            "tool": ("n8n_tool", "Tool calls"),
+            "span": ("n8n_span", "Client requests, analyzer runs, analysis stages and background jobs"),
+        }
+        lines = []
+        for family, (prefix, description) in families.items():
+            rows = [row for row in snapshot if (row[0] == TOOL) == (family == "tool")]
+            if not rows:
+                continue
+            lines.append(f"# HELP {prefix}_calls_total {description}, total")
+            lines.append(f"# TYPE {prefix}_calls_total counter")
+            for kind, name, calls, *_ in rows:
+                lines.append(f"{prefix}_calls_total{{{_labels(kind, name)}}} {calls}")
+            lines.append(f"# HELP {prefix}_errors_total {description} that failed")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for kind, name, _, errors, *_ in rows:
+                lines.append(f"{prefix}_errors_total{{{_labels(kind, name)}}} {errors}")
+            lines.append(f"# HELP {prefix}_duration_ms {description}, latency in milliseconds")
+            lines.append(f"# TYPE {prefix}_duration_ms histogram")
+            for kind, name, _, _, buckets, counts, total_ms, count in rows:
+                labels = _labels(kind, name)
+                cumulative = 0
+                for bound, bucket_count in zip(buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f'{prefix}_duration_ms_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_duration_ms_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f"{prefix}_duration_ms_sum{{{labels}}} {total_ms:.3f}")
+                lines.append(f"{prefix}_duration_ms_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.started_at = datetime.now().isoformat()
+
+    def close(self) -> None:
+        self.flush()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(kind: str, name: str) -> str:
+    if kind == TOOL:
+        return f'tool="{_escape(name)}"'
+    return f'kind="{kind}",name="{_escape(name)}"'
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer, configured from the environment on first use"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer.from_env()
+    return _tracer
+
+
+def traced(name: str, kind: str = STAGE) -> Callable:
+    """Decorator that records every call of a function as a span
+
+    Example:
+        @traced("validation")
+        def validate(self, workflow): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            with get_tracer().span(name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
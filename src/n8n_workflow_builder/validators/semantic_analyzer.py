@@ -7,11 +7,14 @@ import json
 import re
 from typing import Dict, List, Set
 
+from ..tracing import traced
+
 
 class SemanticWorkflowAnalyzer:
     """Advanced semantic analysis for workflow logic and patterns"""
 
     @staticmethod
+    @traced("semantic_analysis")
     def analyze_workflow_semantics(workflow: Dict) -> Dict:
         """Comprehensive semantic analysis of workflow
 
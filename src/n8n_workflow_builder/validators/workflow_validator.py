@@ -6,6 +6,8 @@ Validates workflow structure and schema
 import json
 from typing import Dict, List
 
+from ..tracing import traced
+
 
 class WorkflowValidator:
     """Validates workflows before deployment"""
@@ -220,6 +222,7 @@ class WorkflowValidator:
         return {'errors': errors, 'warnings': warnings}
 
     @classmethod
+    @traced("validation")
     def validate_workflow_full(cls, workflow: Dict) -> Dict:
         """Run all validations and combine results
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Workflow Cache Module
+Session-scoped TTL + LRU cache for full workflow objects fetched from n8n
+"""
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .env import env_float, env_int
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 300.0
+
+
+class WorkflowCache:
+    """TTL + LRU cache of workflows keyed by workflow ID and ``updatedAt``
+
+    Entries remember the ``updatedAt`` they were fetched with so that any
+    newer version seen elsewhere (e.g. in a workflow listing) evicts them.
+    Callers always receive deep copies, so handlers can mutate what they
+    get without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # workflow_id -> (stored_at, updated_at, workflow)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> 'WorkflowCache':
+        """Build from N8N_WORKFLOW_CACHE_SIZE / N8N_WORKFLOW_CACHE_TTL (0 disables)
+
+        Invalid values are logged and replaced by the defaults.
+        """
+        return cls(
+            max_entries=env_int("N8N_WORKFLOW_CACHE_SIZE", DEFAULT_MAX_ENTRIES),
+            ttl_seconds=env_float("N8N_WORKFLOW_CACHE_TTL", DEFAULT_TTL_SECONDS),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, workflow_id: str) -> Optional[Dict]:
+        """Get a copy of a cached workflow, or None on miss/expiry"""
+        entry = self._entries.get(str(workflow_id))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, _, workflow = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[str(workflow_id)]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(str(workflow_id))
+        self.hits += 1
+        return copy.deepcopy(workflow)
+
+    def put(self, workflow: Dict) -> None:
+        """Store (or refresh) a full workflow object"""
+        if not self.enabled or not isinstance(workflow, dict) or not workflow.get("id"):
+            return
+
+        workflow_id = str(workflow["id"])
+        self._entries[workflow_id] = (time.monotonic(), workflow.get("updatedAt"), copy.deepcopy(workflow))
+        self._entries.move_to_end(workflow_id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def observe(self, workflow_id: str, updated_at: Optional[str]) -> None:
+        """Drop the cached entry if n8n reports a different ``updatedAt``"""
+        entry = self._entries.get(str(workflow_id))
+        if entry is not None and updated_at and entry[1] != updated_at:
+            self.invalidate(workflow_id)
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Remove a workflow from the cache"""
+        if self._entries.pop(str(workflow_id), None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
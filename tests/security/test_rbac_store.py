@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed RBAC store (WAL, indexed audit log, retention)
+"""
+import json
+
+import pytest
+
+from n8n_workflow_builder.security.rbac import DEFAULT_AUDIT_RETENTION, RBACManager
+
+
+@pytest.fixture
+def rbac():
+    """Factory for managers that are closed when the test ends"""
+    opened = []
+
+    def open_manager(tmp_path, **kwargs) -> RBACManager:
+        opened.append(RBACManager(state_file=tmp_path / "rbac.json", db_path=tmp_path / "rbac.db", **kwargs))
+        return opened[-1]
+
+    yield open_manager
+    for manager in opened:
+        manager.close()
+
+
+def test_defaults_are_seeded_in_wal_mode(tmp_path, rbac):
+    manager = rbac(tmp_path)
+
+    assert manager.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert manager.check_permission("default", "user.manage")
+    assert not manager.check_permission("nobody", "workflow.read")
+    assert "Default Tenant" in manager.generate_rbac_report()
+
+
+def test_state_survives_reopen(tmp_path, rbac):
+    manager = rbac(tmp_path)
+    manager.create_tenant("acme", "Acme")
+    manager.add_user("dev", "developer", "acme")
+    manager.register_workflow("wf-1", "acme")
+    manager.close()
+
+    reopened = rbac(tmp_path)
+
+    assert reopened.add_user("dev", "viewer")["error"] == "User already exists"
+    assert reopened.check_tenant_access("dev", "wf-1")
+    assert not reopened.check_tenant_access("dev", "wf-2")
+    assert reopened.check_tenant_access("default", "wf-2")
+    assert "  - Workflows: 1" in reopened.generate_rbac_report()
+
+
+def test_audit_log_filters_and_order(tmp_path, rbac):
+    manager = rbac(tmp_path)
+    for name in ("a", "b", "c"):
+        manager.add_user(name, "viewer")
+    manager.create_tenant("acme", "Acme")
+
+    created = manager.get_audit_log(limit=2, action="user_created")
+    assert [entry["details"]["username"] for entry in created] == ["b", "c"]
+    assert [entry["action"] for entry in manager.get_audit_log(username="system")][-1] == "tenant_created"
+    plan = manager.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM audit_log WHERE action = ? ORDER BY id DESC", ("x",)
+    ).fetchall()
+    assert "idx_audit_action" in str([tuple(row) for row in plan])
+
+
+def test_audit_retention_is_configurable(tmp_path, rbac, monkeypatch):
+    monkeypatch.setenv("N8N_RBAC_AUDIT_RETENTION", "3")
+    manager = rbac(tmp_path)
+    for i in range(10):
+        manager.add_user(f"user-{i}", "viewer")
+
+    logs = manager.get_audit_log(limit=100)
+    assert [entry["details"]["username"] for entry in logs] == ["user-7", "user-8", "user-9"]
+    assert manager.conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 3
+
+
+@pytest.mark.parametrize("value", ["5OO", "0", "-1"])
+def test_invalid_audit_retention_falls_back_to_default(tmp_path, rbac, monkeypatch, value):
+    monkeypatch.setenv("N8N_RBAC_AUDIT_RETENTION", value)
+
+    assert rbac(tmp_path).audit_retention == DEFAULT_AUDIT_RETENTION
+
+
+def test_approval_lifecycle(tmp_path, rbac):
+    manager = rbac(tmp_path)
+    manager.add_user("dev", "developer")
+    approval_id = manager.create_approval_request("dev", "workflow.delete", {"workflow_id": "wf-1"})
+
+    assert [a["id"] for a in manager.get_pending_approvals("dev")] == [approval_id]
+    assert manager.approve_request(approval_id, "dev")["error"] == "Insufficient permissions to approve"
+
+    result = manager.approve_request(approval_id, "default")
+    assert result["approval"]["status"] == "approved"
+    assert result["approval"]["details"] == {"workflow_id": "wf-1"}
+    assert manager.reject_request(approval_id, "default")["error"] == "Approval already approved"
+    assert manager.get_pending_approvals() == []
+
+
+def test_legacy_json_state_is_imported_once(tmp_path, rbac):
+    legacy = RBACManager(state_file=tmp_path / "none.json", db_path=":memory:")._default_rbac_state()
+    legacy["users"]["ops"] = {"username": "ops", "role": "operator", "tenant_id": "default", "created_at": "2024-01-01"}
+    legacy["tenants"]["default"]["workflows"] = ["wf-1"]
+    legacy["audit_log"] = [{"timestamp": "2024-01-01", "username": "system", "action": "user_created", "details": {}}]
+    (tmp_path / "rbac.json").write_text(json.dumps(legacy))
+
+    manager = rbac(tmp_path)
+
+    assert manager.get_user_info("ops")["role_name"] == "Operator"
+    assert manager.check_tenant_access("ops", "wf-1")
+    assert len(manager.get_audit_log()) == 1
+    manager.close()
+    (tmp_path / "rbac.json").unlink()
+    assert rbac(tmp_path).get_user_info("ops") is not None
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the row-level ProvenanceTracker store (queued mutations, batched upserts)
+"""
+import json
+import time
+
+import pytest
+
+from n8n_workflow_builder.templates.provenance import ProvenanceTracker
+
+
+@pytest.fixture
+def tracker():
+    """Factory for trackers whose writer threads are stopped when the test ends"""
+    opened = []
+
+    def open_tracker(path, **kwargs) -> ProvenanceTracker:
+        # A long interval keeps the writer thread out of the way; tests flush explicitly
+        opened.append(ProvenanceTracker(storage_path=str(path), flush_interval=60, **kwargs))
+        return opened[-1]
+
+    yield open_tracker
+    for provenance in opened:
+        provenance.close()
+
+
+def stored_rows(provenance: ProvenanceTracker) -> int:
+    return provenance.conn.execute("SELECT COUNT(*) FROM provenance").fetchone()[0]
+
+
+def test_mutations_are_batched_until_flush(tmp_path, tracker):
+    provenance = tracker(tmp_path / "provenance.db")
+    provenance.track_template("t1", "Slack alert", "n8n_official")
+    for _ in range(5):
+        provenance.record_usage("t1")
+
+    assert stored_rows(provenance) == 0
+    assert len(provenance._pending) == 6
+
+    provenance.flush()
+    assert stored_rows(provenance) == 1
+    assert not provenance._pending
+    provenance.close()
+
+
+def test_flush_batch_wakes_writer(tmp_path, tracker):
+    provenance = tracker(tmp_path / "provenance.db", flush_batch=3)
+    for i in range(3):
+        provenance.track_template(f"t{i}", f"Template {i}", "github")
+
+    deadline = time.monotonic() + 2
+    while stored_rows(provenance) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert stored_rows(provenance) == 3
+    provenance.close()
+
+
+def test_records_round_trip(tmp_path, tracker):
+    provenance = tracker(tmp_path / "provenance.db")
+    provenance.track_template("t1", "Slack alert", "n8n_official", author="jane")
+    provenance.record_adaptation("t1", "renamed nodes")
+    provenance.record_execution("t1", success=True)
+    provenance.add_rating("t1", 4.0)
+    provenance.close()
+
+    record = tracker(tmp_path / "provenance.db").get_record("t1")
+
+    assert record.author == "jane"
+    assert record.adaptations[0]["description"] == "renamed nodes"
+    assert record.successful_executions == 1
+    assert record.rating == 4.0
+    assert record.has_tests is False
+
+
+def test_trackers_sharing_a_store_add_up_instead_of_overwriting(tmp_path, tracker):
+    first = tracker(tmp_path / "provenance.db")
+    first.track_template("t1", "Slack alert", "n8n_official")
+    first.flush()
+    second = tracker(tmp_path / "provenance.db")
+
+    for _ in range(3):
+        first.record_usage("t1")
+    first.record_adaptation("t1", "renamed nodes")
+    second.record_usage("t1")
+    second.record_adaptation("t1", "added error handling")
+    first.flush()
+    second.flush()
+
+    assert second.get_record("t1").usage_count == 4
+    assert first.get_record("t1").usage_count == 4
+    first.close()
+    second.close()
+    record = tracker(tmp_path / "provenance.db").get_record("t1")
+    assert record.usage_count == 4
+    assert [a["description"] for a in record.adaptations] == ["renamed nodes", "added error handling"]
+
+
+def test_top_templates_served_from_index(tmp_path, tracker):
+    provenance = tracker(tmp_path / "provenance.db")
+    for i in range(5):
+        provenance.track_template(f"t{i}", f"Template {i}", "github")
+        for _ in range(i):
+            provenance.record_usage(f"t{i}")
+    provenance.add_rating("t1", 5.0)
+
+    assert [r.template_id for r in provenance.get_top_templates(2, sort_by="usage")] == ["t4", "t3"]
+    assert provenance.get_top_templates(1)[0].template_id == "t1"
+    plan = provenance.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT template_id FROM provenance ORDER BY overall_trust DESC, rowid LIMIT 1"
+    ).fetchall()
+    assert "idx_provenance_overall_trust" in str([tuple(row) for row in plan])
+    # Matches the in-memory ordering
+    memory = ProvenanceTracker()
+    memory.records = provenance.records
+    assert memory.get_top_templates(5, "rating") == provenance.get_top_templates(5, "rating")
+
+
+def test_top_templates_read_does_not_flush(tmp_path, tracker):
+    provenance = tracker(tmp_path / "provenance.db")
+    for i in range(3):
+        provenance.track_template(f"t{i}", f"Template {i}", "github")
+    provenance.flush()
+    for _ in range(5):
+        provenance.record_usage("t0")
+    provenance.record_usage("t1")
+
+    top = provenance.get_top_templates(2, sort_by="usage")
+
+    assert [(r.template_id, r.usage_count) for r in top] == [("t0", 5), ("t1", 1)]
+    assert len(provenance._pending) == 6
+    assert provenance.conn.execute("SELECT MAX(usage_count) FROM provenance").fetchone()[0] == 0
+    provenance.close()
+
+
+def test_top_templates_include_rows_not_loaded_in_memory(tmp_path, tracker):
+    first = tracker(tmp_path / "provenance.db")
+    first.track_template("t1", "Slack alert", "n8n_official")
+    first.flush()
+    second = tracker(tmp_path / "provenance.db")
+    second.track_template("t2", "Jira sync", "github")
+    second.record_usage("t2")
+    second.flush()
+
+    top = first.get_top_templates(5, sort_by="usage")
+
+    assert [(r.template_id, r.usage_count) for r in top] == [("t2", 1), ("t1", 0)]
+    first.close()
+    second.close()
+
+
+def test_legacy_json_is_imported(tmp_path, tracker):
+    legacy = ProvenanceTracker()
+    legacy.track_template("t1", "Slack alert", "n8n_official")
+    legacy.record_usage("t1")
+    data = {"t1": legacy._serialize_record(legacy.records["t1"])}
+    (tmp_path / "provenance.json").write_text(json.dumps(data, default=str))
+
+    provenance = tracker(tmp_path / "provenance.json")
+
+    assert provenance.get_record("t1").usage_count == 1
+    assert (tmp_path / "provenance.db").exists()
+    provenance.close()
+    (tmp_path / "provenance.json").unlink()
+    assert tracker(tmp_path / "provenance.json").get_record("t1").usage_count == 1
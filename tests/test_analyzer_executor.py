@@ -0,0 +1,105 @@
+"""
+Unit tests for running CPU-bound analyzers off the event loop.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from n8n_workflow_builder.analyzer_executor import (
+    AnalyzerExecutor,
+    AnalyzerExecutorConfig,
+    AnalyzerTimeoutError,
+    current_tool,
+)
+from n8n_workflow_builder.dependencies import Dependencies
+from n8n_workflow_builder.drift.detector import DriftDetector
+from n8n_workflow_builder.tools.base import BaseTool
+
+
+def executor(**config) -> AnalyzerExecutor:
+    return AnalyzerExecutor(AnalyzerExecutorConfig(**config))
+
+
+def blocking_analysis(seconds: float) -> str:
+    time.sleep(seconds)
+    return threading.current_thread().name
+
+
+async def test_runs_in_worker_thread_without_blocking_the_loop():
+    pool = executor(mode="thread")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    thread_name = await pool.run(blocking_analysis, 0.2)
+    task.cancel()
+    pool.shutdown()
+
+    assert thread_name.startswith("n8n-analyzer")
+    assert ticks >= 5
+    assert pool.get_stats()["completed"] == 1
+
+
+async def test_concurrency_cap_queues_extra_work():
+    pool = executor(mode="thread", max_workers=4, max_concurrent=1)
+    started = time.monotonic()
+    await asyncio.gather(*(pool.run(blocking_analysis, 0.05) for _ in range(3)))
+    pool.shutdown()
+
+    assert time.monotonic() - started >= 0.15
+    assert pool.get_stats()["queued"] >= 1
+
+
+async def test_deadline_raises_timeout():
+    pool = executor(mode="thread")
+    with pytest.raises(AnalyzerTimeoutError):
+        await pool.run(blocking_analysis, 0.5, timeout=0.05)
+    pool.shutdown()
+    assert pool.get_stats()["timed_out"] == 1
+
+
+async def test_per_tool_deadline_from_current_tool():
+    pool = executor(mode="thread", default_timeout=60, tool_timeouts={"audit_workflow_security": 0.05})
+    token = current_tool.set("audit_workflow_security")
+    try:
+        with pytest.raises(AnalyzerTimeoutError):
+            await pool.run(blocking_analysis, 0.5)
+    finally:
+        current_tool.reset(token)
+        pool.shutdown()
+
+
+async def test_process_mode_runs_static_analyzers():
+    pool = executor(mode="process", max_workers=1)
+    executions = [{"id": str(i), "status": "success", "startedAt": "2024-01-01T00:00:00Z"} for i in range(3)]
+    result = await pool.run(DriftDetector.analyze_execution_history, executions)
+    pool.shutdown()
+    assert result == DriftDetector.analyze_execution_history(executions)
+
+
+async def test_process_mode_falls_back_to_threads_for_unpicklable_callables():
+    pool = executor(mode="process", max_workers=1)
+    assert await pool.run(lambda: threading.current_thread().name) != "MainThread"
+    pool.shutdown()
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("N8N_ANALYZER_EXECUTOR", "process")
+    monkeypatch.setenv("N8N_ANALYZER_WORKERS", "2")
+    monkeypatch.setenv("N8N_ANALYZER_TIMEOUTS", "explain_workflow=120, trace_data_flow=5")
+    config = AnalyzerExecutorConfig.from_env()
+    assert config.mode == "process"
+    assert config.max_workers == 2 and config.max_concurrent == 2
+    assert config.tool_timeouts == {"explain_workflow": 120.0, "trace_data_flow": 5.0}
+
+
+async def test_base_tool_runs_inline_without_executor():
+    tool = BaseTool(Dependencies(client=None, state_manager=None, workflow_builder=None, workflow_validator=None))
+    assert await tool._run_analyzer(threading.current_thread) is threading.current_thread()
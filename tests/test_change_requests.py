@@ -0,0 +1,54 @@
+"""
+Unit tests for the persistent change request store and paginated history.
+"""
+from n8n_workflow_builder.changes import ApprovalWorkflow
+
+
+def store(tmp_path) -> ApprovalWorkflow:
+    return ApprovalWorkflow(db_path=tmp_path / "changes.db")
+
+
+def test_requests_survive_restart(tmp_path):
+    approvals = store(tmp_path)
+    request = approvals.create_request("wf-1", "Orders", {"nodes": ["HTTP"]}, "fix url", "dev")
+    approvals.approve_request(request.id, "lead", "looks good")
+    approvals.mark_applied(request.id)
+    approvals.close()
+
+    history = store(tmp_path).get_workflow_history("wf-1")
+
+    assert [r["id"] for r in history] == [request.id]
+    assert history[0]["status"] == "applied"
+    assert history[0]["changes"] == {"nodes": ["HTTP"]}
+    assert history[0]["review_comments"] == "looks good"
+
+
+def test_review_only_applies_to_pending_requests(tmp_path):
+    approvals = store(tmp_path)
+    request = approvals.create_request("wf-1", "Orders", {}, "cleanup", "dev")
+
+    assert approvals.reject_request(request.id, "lead", "no")["request"]["status"] == "rejected"
+    assert approvals.approve_request(request.id, "lead")["error"] == "Request is already rejected"
+    assert approvals.approve_request("missing", "lead")["error"] == "Request not found"
+    assert approvals.mark_failed(request.id, "timeout")["request"]["review_comments"] == "no\nApplication error: timeout"
+
+
+def test_pending_and_history_queries_use_indexes(tmp_path):
+    approvals = store(tmp_path)
+    for i in range(6):
+        request = approvals.create_request(f"wf-{i % 2}", "Orders", {}, f"change {i}", "dev")
+        if i % 3 == 0:
+            approvals.approve_request(request.id, "lead")
+
+    assert [r["reason"] for r in approvals.get_workflow_history("wf-0", limit=2, offset=1)] == ["change 2", "change 4"]
+    assert [r["reason"] for r in approvals.get_workflow_history("wf-0", limit=1, newest_first=True)] == ["change 4"]
+    assert len(approvals.get_pending_requests()) == 4
+    assert approvals.get_status_counts("wf-0") == {"approved": 1, "pending": 2}
+
+    for where, index in (("workflow_id = 'wf-0'", "idx_change_requests_workflow"),
+                         ("status = 'pending'", "idx_change_requests_status")):
+        plan = approvals.conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM change_requests WHERE {where} ORDER BY created_at"
+        ).fetchall()
+        assert index in str([tuple(row) for row in plan])
+
@@ -0,0 +1,423 @@
+"""
+Unit tests for N8nClient against a mocked n8n API.
+"""
+import httpx
+import pytest
+
+from n8n_workflow_builder.client import N8nClient
+
+
+def make_client(handler) -> N8nClient:
+    """Create an N8nClient whose HTTP traffic is served by ``handler``."""
+    client = N8nClient("http://n8n.test", "test-key")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def paged(items: list, page_size: int):
+    """Serve ``items`` through n8n-style cursor pagination."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        start = int(request.url.params.get("cursor", 0))
+        end = start + page_size
+        next_cursor = str(end) if end < len(items) else None
+        return httpx.Response(200, json={"data": items[start:end], "nextCursor": next_cursor})
+
+    return handler, requests
+
+
+class TestPagination:
+    """Cursor-following iterators."""
+
+    async def test_get_workflows_follows_cursor(self):
+        workflows = [{"id": str(i), "name": f"wf-{i}"} for i in range(7)]
+        handler, requests = paged(workflows, page_size=3)
+        client = make_client(handler)
+
+        result = await client.get_workflows()
+
+        assert [wf["id"] for wf in result] == [str(i) for i in range(7)]
+        assert len(requests) == 3
+
+    async def test_iter_workflows_stops_early(self):
+        workflows = [{"id": str(i)} for i in range(10)]
+        handler, requests = paged(workflows, page_size=2)
+        client = make_client(handler)
+
+        result = [wf async for wf in client.iter_workflows(page_size=2, limit=3)]
+
+        assert [wf["id"] for wf in result] == ["0", "1", "2"]
+        assert len(requests) == 2
+
+    async def test_iter_executions_time_window(self):
+        executions = [
+            {"id": "3", "startedAt": "2024-01-03T00:00:00.000Z"},
+            {"id": "2", "startedAt": "2024-01-02T00:00:00.000Z"},
+            {"id": "1", "startedAt": "2024-01-01T00:00:00.000Z"},
+        ]
+        handler, requests = paged(executions, page_size=1)
+        client = make_client(handler)
+
+        result = [
+            ex async for ex in client.iter_executions(
+                status="error",
+                started_after="2024-01-02T00:00:00Z",
+                started_before="2024-01-02T12:00:00Z",
+            )
+        ]
+
+        assert [ex["id"] for ex in result] == ["2"]
+        assert requests[0].url.params["status"] == "error"
+        # Iteration stops at the first execution older than the window
+        assert len(requests) == 3
+
+
+class TestBulkFetch:
+    """Concurrent get_workflows_bulk."""
+
+    async def test_bulk_fetch_caps_concurrency_and_captures_errors(self):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            workflow_id = request.url.path.rsplit("/", 1)[-1]
+            if workflow_id == "missing":
+                return httpx.Response(404, json={"message": "not found"})
+            return httpx.Response(200, json={"id": workflow_id})
+
+        client = make_client(handler)
+        ids = [str(i) for i in range(10)] + ["missing"]
+
+        results = [r async for r in client.get_workflows_bulk(ids, concurrency=3)]
+
+        assert peak <= 3
+        fetched = {wf_id for wf_id, wf, error in results if wf}
+        failed = {wf_id for wf_id, wf, error in results if error}
+        assert fetched == {str(i) for i in range(10)}
+        assert failed == {"missing"}
+
+    async def test_bulk_fetch_yields_in_completion_order(self):
+        import asyncio
+
+        delays = {"a": 0.03, "b": 0.0, "c": 0.015}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            workflow_id = request.url.path.rsplit("/", 1)[-1]
+            await asyncio.sleep(delays[workflow_id])
+            return httpx.Response(200, json={"id": workflow_id})
+
+        client = make_client(handler)
+
+        results = [wf_id async for wf_id, _, _ in client.get_workflows_bulk(["a", "b", "c", "a"])]
+
+        assert results == ["b", "c", "a"]
+
+    async def test_bulk_fetch_holds_few_finished_workflows_behind_a_slow_one(self):
+        import asyncio
+
+        started = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            workflow_id = request.url.path.rsplit("/", 1)[-1]
+            started.append(workflow_id)
+            await asyncio.sleep(1.0 if workflow_id == "slow" else 0)
+            return httpx.Response(200, json={"id": workflow_id})
+
+        client = make_client(handler)
+        ids = ["slow"] + [str(i) for i in range(100)]
+
+        bulk = client.get_workflows_bulk(ids, concurrency=4)
+        first = await bulk.__anext__()
+        await asyncio.sleep(0.05)
+        await bulk.aclose()
+
+        assert first[0] != "slow"
+        # Only a bounded number of fetches ran ahead of the consumer
+        assert len(started) < 20
+
+class TestSharedPool:
+    """Shared HTTP connection pool."""
+
+    async def test_clients_share_transport_and_survive_close(self):
+        from n8n_workflow_builder.http_pool import HTTPPoolConfig, SharedHTTPPool
+
+        pool = SharedHTTPPool(HTTPPoolConfig(per_host_limits={"api.github.com": 2}))
+        first = N8nClient("http://n8n.test", "key-1", http_pool=pool)
+        second = N8nClient("http://n8n.test", "key-2", http_pool=pool)
+
+        assert first.client.headers["X-N8N-API-KEY"] == "key-1"
+        assert second.client.headers["X-N8N-API-KEY"] == "key-2"
+
+        transport = pool.transport
+        await first.close()
+        # Closing one client leaves the pool usable for the others
+        assert pool.transport is transport
+
+        await pool.aclose()
+        assert pool._transport is None
+
+    def test_config_from_env(self, monkeypatch):
+        from n8n_workflow_builder.http_pool import HTTPPoolConfig
+
+        monkeypatch.setenv("N8N_HTTP_MAX_CONNECTIONS", "12")
+        monkeypatch.setenv("N8N_HTTP_HOST_LIMITS", "api.github.com=4, bad, api.n8n.io=2")
+
+        config = HTTPPoolConfig.from_env()
+
+        assert config.max_connections == 12
+        assert config.per_host_limits == {"api.github.com": 4, "api.n8n.io": 2}
+
+
+class TestWorkflowCache:
+    """Session workflow cache with write-through invalidation."""
+
+    @staticmethod
+    def workflow_api():
+        calls = []
+        store = {"wf-1": {"id": "wf-1", "name": "A", "nodes": [], "connections": {}, "updatedAt": "v1"}}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.method == "PUT":
+                import json
+                body = json.loads(request.content)
+                store["wf-1"] = {**store["wf-1"], **body, "updatedAt": "v2"}
+            if request.url.path == "/api/v1/workflows":
+                return httpx.Response(200, json={"data": [store["wf-1"]], "nextCursor": None})
+            return httpx.Response(200, json=store["wf-1"])
+
+        return handler, calls, store
+
+    def test_invalid_env_falls_back_to_defaults(self, monkeypatch):
+        from n8n_workflow_builder.workflow_cache import DEFAULT_TTL_SECONDS, WorkflowCache
+
+        monkeypatch.setenv("N8N_WORKFLOW_CACHE_TTL", "5m")
+        monkeypatch.setenv("N8N_WORKFLOW_CACHE_SIZE", "64")
+
+        cache = WorkflowCache.from_env()
+
+        assert cache.ttl_seconds == DEFAULT_TTL_SECONDS
+        assert cache.max_entries == 64
+
+    async def test_repeat_get_hits_cache_and_returns_copies(self):
+        handler, calls, _ = self.workflow_api()
+        client = make_client(handler)
+
+        first = await client.get_workflow("wf-1")
+        first["name"] = "mutated by a handler"
+        second = await client.get_workflow("wf-1")
+
+        assert second["name"] == "A"
+        assert len(calls) == 1
+        assert client.get_cache_stats()["hits"] == 1
+
+    async def test_update_writes_through(self):
+        handler, calls, _ = self.workflow_api()
+        client = make_client(handler)
+
+        await client.get_workflow("wf-1")
+        await client.update_workflow("wf-1", {"name": "B"})
+        calls.clear()
+
+        workflow = await client.get_workflow("wf-1")
+
+        assert workflow["name"] == "B"
+        assert calls == []
+
+    async def test_listing_with_newer_version_invalidates(self):
+        handler, calls, store = self.workflow_api()
+        client = make_client(handler)
+
+        await client.get_workflow("wf-1")
+        store["wf-1"] = {**store["wf-1"], "name": "Edited in UI", "updatedAt": "v3"}
+        await client.get_workflows()
+        workflow = await client.get_workflow("wf-1")
+
+        assert workflow["name"] == "Edited in UI"
+        assert client.get_cache_stats()["invalidations"] == 1
+
+
+class TestSingleFlight:
+    """Coalescing of identical concurrent GETs."""
+
+    async def test_identical_concurrent_gets_share_one_request(self):
+        import asyncio
+
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"id": "wf-1", "nodes": []})
+
+        client = make_client(handler)
+
+        results = await asyncio.gather(*[client.get_workflow("wf-1", use_cache=False) for _ in range(5)])
+
+        assert len(calls) == 1
+        assert client.coalesced_requests == 4
+        # Every caller gets its own decoded copy
+        results[0]["nodes"].append("x")
+        assert results[1]["nodes"] == []
+
+    async def test_different_params_are_not_coalesced(self):
+        import asyncio
+
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": [], "nextCursor": None})
+
+        client = make_client(handler)
+
+        await asyncio.gather(client.get_executions("wf-1"), client.get_executions("wf-2"))
+
+        assert len(calls) == 2
+
+
+class TestExecuteWorkflow:
+    """Cached execution endpoint probing."""
+
+    async def test_unsupported_endpoints_are_probed_once(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": "wf-1", "name": "A", "active": True, "nodes": []})
+            if request.url.path.endswith("/execute"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"executionId": "ex-1"})
+
+        client = make_client(handler)
+
+        await client.execute_workflow("wf-1")
+        await client.execute_workflow("wf-1")
+
+        assert calls == [
+            ("GET", "/api/v1/workflows/wf-1"),
+            ("POST", "/api/v1/workflows/wf-1/execute"),
+            # The 404 is only cached once the workflow is known to exist
+            ("GET", "/api/v1/workflows/wf-1"),
+            ("POST", "/api/v1/workflows/wf-1/test"),
+            ("POST", "/api/v1/workflows/wf-1/test"),
+        ]
+        assert client.execution_capabilities == {"execute": False, "test": True}
+
+    async def test_deleted_workflow_does_not_mark_endpoint_unsupported(self):
+        deleted = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if deleted:
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json={"id": "wf-1", "name": "A", "active": True, "nodes": []})
+
+        client = make_client(handler)
+        await client.get_workflow("wf-1")
+        deleted = True
+
+        with pytest.raises(Exception, match="Workflow wf-1 not found"):
+            await client.execute_workflow("wf-1")
+
+        assert client.execution_capabilities == {}
+        assert client.workflow_cache.get("wf-1") is None
+
+
+class TestUpdateWorkflow:
+    """Updates merge into a fresh or caller-supplied base version."""
+
+    async def test_cached_copy_is_not_used_as_base(self):
+        handler, calls, store = TestWorkflowCache.workflow_api()
+        client = make_client(handler)
+
+        await client.get_workflow("wf-1")
+        store["wf-1"] = {**store["wf-1"], "nodes": [{"name": "Added in UI"}], "updatedAt": "v3"}
+        updated = await client.update_workflow("wf-1", {"name": "B"})
+
+        assert [method for method, _ in calls] == ["GET", "GET", "PUT"]
+        assert updated["nodes"] == [{"name": "Added in UI"}]
+
+    async def test_supplied_base_skips_the_get(self):
+        import json
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            return httpx.Response(200, json={"id": "wf-1", **json.loads(request.content)})
+
+        client = make_client(handler)
+        base = {"id": "wf-1", "name": "A", "nodes": [], "connections": {}}
+
+        updated = await client.update_workflow("wf-1", {"nodes": [{"name": "New"}]}, base_workflow=base)
+
+        assert calls == ["PUT"]
+        assert updated["nodes"] == [{"name": "New"}]
+        # Caller's base is left untouched
+        assert base["nodes"] == []
+
+
+    async def test_node_intent_edit_is_one_get_and_one_put(self):
+        from unittest.mock import MagicMock
+
+        from n8n_workflow_builder.dependencies import Dependencies
+        from n8n_workflow_builder.intent import IntentManager
+        from n8n_workflow_builder.tools.template_tools import TemplateTools
+
+        handler, calls, store = TestWorkflowCache.workflow_api()
+        store["wf-1"]["nodes"] = [{"name": "HTTP", "type": "n8n-nodes-base.httpRequest", "parameters": {}}]
+        client = make_client(handler)
+        deps = Dependencies(
+            client=client, state_manager=MagicMock(), workflow_builder=None, workflow_validator=None,
+            intent_manager=IntentManager(),
+        )
+
+        await TemplateTools(deps).handle(
+            "add_node_intent", {"workflow_id": "wf-1", "node_name": "HTTP", "reason": "Fetch orders"}
+        )
+
+        assert [method for method, _ in calls] == ["GET", "PUT"]
+        assert "Fetch orders" in str(store["wf-1"]["nodes"][0])
+
+
+class TestExecutionStreaming:
+    """Incremental decoding of large executions."""
+
+    @staticmethod
+    def execution_handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["includeData"] == "true"
+        run_data = {
+            f"Node {n}": [{"data": {"main": [[{"json": {"i": i}} for i in range(100)]]}}]
+            for n in range(3)
+        }
+        return httpx.Response(200, json={"id": "ex-1", "data": {"resultData": {"runData": run_data}}})
+
+    async def test_stream_execution_truncates_outputs(self):
+        client = make_client(self.execution_handler)
+
+        execution = await client.stream_execution("ex-1", max_items=5)
+
+        run_data = execution["data"]["resultData"]["runData"]
+        assert all(len(runs[0]["data"]["main"][0]) == 5 for runs in run_data.values())
+        assert {t["dropped"] for t in execution["truncatedRunData"]} == {95}
+
+    async def test_iter_execution_node_outputs(self):
+        client = make_client(self.execution_handler)
+
+        outputs = [
+            (node, len(runs[0]["data"]["main"][0]))
+            async for node, runs in client.iter_execution_node_outputs("ex-1", nodes=["Node 1", "Node 2"])
+        ]
+
+        assert outputs == [("Node 1", 100), ("Node 2", 100)]
@@ -0,0 +1,160 @@
+"""
+Unit tests for tool call deadlines, cancellation and partial results.
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from mcp.types import Tool
+
+from n8n_workflow_builder.analyzer_executor import AnalyzerTimeoutError
+from n8n_workflow_builder.deadlines import (
+    DeadlineConfig,
+    DeadlineExceeded,
+    deadline_scope,
+    expired,
+    record_partial,
+    remaining,
+)
+from n8n_workflow_builder.dependencies import Dependencies
+from n8n_workflow_builder.drift.analyzers.schema import SchemaDriftAnalyzer
+from n8n_workflow_builder.explainability import WorkflowExplainer
+from n8n_workflow_builder.resilience import ResilienceConfig, ResilientTransport
+from n8n_workflow_builder.tools.catalog import OUTPUT_FORMAT_PROPERTY, build_catalog
+from n8n_workflow_builder.tools.registry import ToolRegistry, _spec
+
+
+class SlowTools:
+    """Handler that records progress, then never finishes on its own"""
+
+    async def handle(self, name, arguments):
+        record_partial("workflow", {"id": "wf-1"})
+        await asyncio.sleep(10)
+
+
+def slow_registry(timeout: float) -> ToolRegistry:
+    spec = _spec(".workflow_tools", "SlowTools", "slow_tool")
+    catalog = build_catalog([
+        Tool(name="slow_tool", inputSchema={"type": "object", "properties": {"format": OUTPUT_FORMAT_PROPERTY}}),
+    ])
+    registry = ToolRegistry(
+        MagicMock(), specs=(spec,), catalog=catalog,
+        deadlines=DeadlineConfig(default_timeout=timeout, grace=0.01),
+    )
+    registry._handlers[spec] = SlowTools()
+    return registry
+
+
+def test_nested_scopes_only_shorten_the_deadline():
+    with deadline_scope(10):
+        with deadline_scope(60):
+            assert remaining() <= 10
+        with deadline_scope(0):
+            assert expired()
+        assert not expired()
+    assert remaining() is None
+
+
+def test_tool_timeouts_from_env(monkeypatch):
+    monkeypatch.setenv("N8N_TOOL_TIMEOUT", "0")
+    monkeypatch.setenv("N8N_TOOL_TIMEOUTS", "explain_workflow=5,broken")
+
+    config = DeadlineConfig.from_env()
+
+    assert config.timeout_for("explain_workflow") == 5
+    assert config.timeout_for("list_workflows") is None
+
+
+async def test_timed_out_call_returns_partial_results():
+    result = await slow_registry(0.02).dispatch("slow_tool", {})
+
+    text = result[0].text
+    assert "Incomplete result" in text
+    assert '"id": "wf-1"' in text
+
+
+async def test_timed_out_call_json_is_flagged_incomplete():
+    result = await slow_registry(0.02).dispatch("slow_tool", {"format": "json"})
+
+    payload = json.loads(result[0].text)
+    assert payload["data"] == {"workflow": {"id": "wf-1"}}
+    assert payload["metadata"]["incomplete"] is True
+
+
+@pytest.mark.parametrize("error", [DeadlineExceeded("semantic analysis"), AnalyzerTimeoutError("semantics", 5)])
+async def test_explain_workflow_semantic_timeout_is_flagged_incomplete(error):
+    client = MagicMock()
+    client.get_workflow = AsyncMock(return_value={"id": "wf-1", "name": "Test", "nodes": [], "connections": {}})
+    client.list_workflows = AsyncMock(return_value=[])
+    semantic_analyzer = MagicMock()
+    semantic_analyzer.analyze_workflow_semantics.side_effect = error
+    deps = Dependencies(
+        client=client, state_manager=MagicMock(), workflow_builder=None, workflow_validator=None,
+        semantic_analyzer=semantic_analyzer,
+    )
+
+    result = await ToolRegistry(deps).dispatch("explain_workflow", {"workflow_id": "wf-1", "format": "json"})
+
+    payload = json.loads(result[0].text)
+    assert payload["metadata"]["incomplete"] is True
+    assert payload["data"]["workflow"]["id"] == "wf-1"
+    client.get_executions.assert_not_called()
+
+
+def test_schema_drift_stops_at_deadline():
+    executions = [
+        {"data": {"resultData": {"runData": {"HTTP": [{"json": {"id": i}}]}}}}
+        for i in range(10)
+    ]
+
+    with deadline_scope(0):
+        analysis = SchemaDriftAnalyzer.analyze_schema_drift(executions)
+
+    assert analysis["incomplete"] is True
+    assert analysis["baseline_period"]["executions_analyzed"] == 0
+
+
+def test_explainer_skips_remaining_sections_at_deadline():
+    workflow = {"id": "wf-1", "name": "Test", "nodes": [], "connections": {}}
+
+    with deadline_scope(0):
+        explanation = WorkflowExplainer.explain_workflow(workflow)
+
+    assert explanation["incomplete"] is True
+    assert explanation["skipped_sections"] == ["purpose", "data_flow", "dependencies", "risks"]
+    assert WorkflowExplainer.explain_workflow(workflow)["incomplete"] is False
+
+
+async def test_requests_past_the_deadline_are_not_sent():
+    calls = []
+    transport = ResilientTransport(
+        httpx.MockTransport(lambda request: calls.append(request) or httpx.Response(200)),
+        ResilienceConfig(rate_limit_rps=0),
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceeded):
+                await client.get("http://n8n.test/api/v1/workflows")
+
+    assert calls == []
+
+
+async def test_no_retry_is_scheduled_past_the_deadline():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "5"})
+
+    transport = ResilientTransport(
+        httpx.MockTransport(handler), ResilienceConfig(rate_limit_rps=0, backoff_max=10)
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        with deadline_scope(1):
+            response = await client.get("http://n8n.test/api/v1/workflows")
+
+    assert response.status_code == 429
+    assert len(calls) == 1
@@ -0,0 +1,84 @@
+"""
+Unit tests for per-endpoint request metrics.
+"""
+import json
+
+import httpx
+
+from n8n_workflow_builder.metrics import LatencyHistogram, MetricsTransport, RequestMetrics
+
+
+def metered_client(handler) -> tuple[httpx.AsyncClient, RequestMetrics]:
+    metrics = RequestMetrics()
+    transport = MetricsTransport(httpx.MockTransport(handler), metrics)
+    return httpx.AsyncClient(transport=transport, base_url="http://n8n.test"), metrics
+
+
+def test_histogram_percentiles_stay_within_observed_range():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(float(ms))
+
+    stats = histogram.to_dict()
+    assert stats["count"] == 100
+    assert stats["min_ms"] == 1.0 and stats["max_ms"] == 100.0
+    assert 25 <= stats["p50_ms"] <= 100
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= 100
+
+
+def test_empty_histogram_has_no_percentiles():
+    assert LatencyHistogram().to_dict()["p95_ms"] is None
+
+
+async def test_records_per_endpoint_counts_statuses_and_bytes():
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json={"id": "1", "nodes": []})
+
+    client, metrics = metered_client(handler)
+    async with client:
+        await client.get("/api/v1/workflows/abc")
+        await client.get("/api/v1/workflows/def")
+        await client.get("/api/v1/workflows/missing")
+        await client.put("/api/v1/workflows/abc", json={"name": "x"})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["total_requests"] == 4
+    get_stats = snapshot["endpoints"]["GET /api/v1/workflows/{id}"]
+    assert get_stats["requests"] == 3
+    assert get_stats["errors"] == 1
+    assert get_stats["status_codes"] == {"200": 2, "404": 1}
+    assert get_stats["bytes_received"] > 0
+    assert get_stats["latency"]["count"] == 3
+    assert snapshot["endpoints"]["PUT /api/v1/workflows/{id}"]["bytes_sent"] == len(b'{"name":"x"}')
+
+
+async def test_records_network_errors_by_exception_name():
+    def handler(request):
+        raise httpx.ConnectError("refused")
+
+    client, metrics = metered_client(handler)
+    async with client:
+        try:
+            await client.get("/api/v1/executions")
+        except httpx.ConnectError:
+            pass
+
+    stats = metrics.snapshot()["endpoints"]["GET /api/v1/executions"]
+    assert stats["errors"] == 1
+    assert stats["status_codes"] == {"ConnectError": 1}
+
+
+async def test_dump_appends_json_lines(tmp_path):
+    client, metrics = metered_client(lambda request: httpx.Response(200, json=[]))
+    async with client:
+        await client.get("/api/v1/workflows")
+
+    path = tmp_path / "metrics.jsonl"
+    metrics.dump(path)
+    metrics.dump(path)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["endpoints"]["GET /api/v1/workflows"]["requests"] == 1
@@ -0,0 +1,75 @@
+"""
+Unit tests for incremental execution payload decoding.
+"""
+import json
+
+import pytest
+
+from n8n_workflow_builder.execution.payload_stream import RunDataPruner
+
+
+def make_execution(items_per_node: int = 10) -> dict:
+    return {
+        "id": "1",
+        "finished": True,
+        "data": {"resultData": {"runData": {
+            'Node "A"': [{"startTime": 1, "data": {"main": [
+                [{"json": {"i": i, "s": 'tricky ,]}\\" string'}} for i in range(items_per_node)],
+                [],
+            ]}}],
+            "B": [
+                {"data": {"main": [[{"json": {"i": i}} for i in range(3)]]}},
+                {"error": {"message": "boom"}},
+            ],
+        }}},
+        "workflowData": {"name": "W", "nodes": [{"data": [1, 2, 3]}]},
+    }
+
+
+def run_pruner(text: str, chunk_size: int, **kwargs) -> tuple[RunDataPruner, dict]:
+    pruner = RunDataPruner(**kwargs)
+    for start in range(0, len(text), chunk_size):
+        pruner.feed_bytes(text[start:start + chunk_size].encode())
+    return pruner, pruner.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_truncates_item_arrays_across_chunk_boundaries(chunk_size):
+    execution = make_execution()
+
+    _, result = run_pruner(json.dumps(execution, indent=1), chunk_size, max_items=2)
+
+    run_data = result["data"]["resultData"]["runData"]
+    assert [item["json"]["i"] for item in run_data['Node "A"'][0]["data"]["main"][0]] == [0, 1]
+    assert run_data["B"][1] == {"error": {"message": "boom"}}
+    assert result["workflowData"] == execution["workflowData"]
+    assert result["truncatedRunData"] == [
+        {"node": 'Node "A"', "run": 0, "connection": "main", "output": 0, "kept": 2, "dropped": 8},
+        {"node": "B", "run": 0, "connection": "main", "output": 0, "kept": 2, "dropped": 1},
+    ]
+
+
+def test_without_budget_round_trips():
+    execution = make_execution()
+
+    _, result = run_pruner(json.dumps(execution), 7)
+
+    assert result == execution
+
+
+def test_byte_budget_bounds_kept_data():
+    execution = make_execution(items_per_node=1000)
+    text = json.dumps(execution)
+
+    pruner, result = run_pruner(text, 4096, max_bytes=2000)
+
+    assert len(json.dumps(result)) < 4000 < len(text)
+    assert sum(t["dropped"] for t in result["truncatedRunData"]) > 900
+
+
+def test_emit_nodes_hands_out_selected_nodes():
+    pruner, result = run_pruner(json.dumps(make_execution()), 16, nodes=["B"], emit_nodes=True)
+
+    assert [name for name, _ in pruner.ready_nodes] == ["B"]
+    assert pruner.ready_nodes[0][1][1] == {"error": {"message": "boom"}}
+    assert result["data"]["resultData"]["runData"] == {'Node "A"': [], "B": []}
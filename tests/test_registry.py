@@ -0,0 +1,170 @@
+"""
+Unit tests for the lazy tool registry and lazily built dependencies.
+"""
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import jsonschema
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest, Tool
+
+from n8n_workflow_builder.dependencies import Dependencies, LazyDependency
+from n8n_workflow_builder.tools.catalog import build_catalog, get_tool_catalog, tool_definitions
+from n8n_workflow_builder.tools.registry import HANDLER_SPECS, ToolRegistry
+
+
+def make_deps(**overrides) -> Dependencies:
+    fields = dict(client=MagicMock(), state_manager=MagicMock(), workflow_builder=MagicMock(), workflow_validator=MagicMock())
+    return Dependencies(**{**fields, **overrides})
+
+
+class TestToolRegistry:
+    def test_first_handler_wins_for_duplicate_names(self):
+        registry = ToolRegistry(make_deps())
+        assert registry._routes["compare_workflows"].class_name == "DriftTools"
+        assert registry._routes["get_drift_root_cause"].class_name == "DriftTools"
+        assert registry._routes["generate_workflow_template"].class_name == "WorkflowTools"
+
+    def test_handlers_are_built_on_first_use(self):
+        registry = ToolRegistry(make_deps())
+        assert registry.loaded_handlers() == []
+
+        handler = registry.handler_for("get_session_state")
+        assert type(handler).__name__ == "SessionTools"
+        assert registry.handler_for("clear_session_state") is handler
+        assert registry.loaded_handlers() == ["SessionTools"]
+
+    async def test_unknown_tool(self):
+        result = await ToolRegistry(make_deps()).dispatch("no_such_tool", {})
+        assert result[0].text == "Unknown tool: no_such_tool"
+
+    def test_every_spec_points_at_a_handler_class(self):
+        for spec in HANDLER_SPECS:
+            registry = ToolRegistry(make_deps(), specs=(spec,))
+            handler = registry.handler_for(next(iter(spec.tools)))
+            assert type(handler).__name__ == spec.class_name
+
+    def test_catalog_tools_are_mostly_routable(self):
+        registry = ToolRegistry(make_deps())
+        names = {tool.name for tool in tool_definitions()}
+        assert len([name for name in names if name in registry]) >= len(names) - 4
+
+
+class TestToolCatalog:
+    def test_built_once_and_frozen(self):
+        catalog = get_tool_catalog()
+        assert get_tool_catalog() is catalog
+        assert isinstance(catalog.tools, tuple)
+        with pytest.raises(TypeError):
+            catalog.validators["new_tool"] = None
+
+    def test_advertised_names_are_unique(self):
+        names = [tool.name for tool in get_tool_catalog().tools]
+        assert len(names) == len(set(names))
+
+    def test_duplicates_keep_first_definition(self):
+        schema = {"type": "object", "properties": {}}
+        catalog = build_catalog([
+            Tool(name="a", description="first", inputSchema=schema),
+            Tool(name="a", description="second", inputSchema=schema),
+        ])
+        assert [tool.description for tool in catalog.tools] == ["first"]
+
+    def test_every_schema_passes_the_metaschema(self):
+        build_catalog(tool_definitions(), check_schemas=True)
+
+    def test_invalid_schema_is_rejected(self):
+        with pytest.raises(jsonschema.SchemaError):
+            build_catalog([Tool(name="bad", description="", inputSchema={"type": "object", "required": "x"})], check_schemas=True)
+        with pytest.raises(jsonschema.SchemaError):
+            build_catalog([Tool(name="bad", description="", inputSchema={"type": "object", "required": ["x"]})])
+
+    def test_validate_arguments(self):
+        catalog = get_tool_catalog()
+        assert catalog.validate_arguments("update_workflow", {}) == "'workflow_id' is a required property"
+        assert catalog.validate_arguments("update_workflow", {"workflow_id": "1", "updates": {}}) is None
+        assert catalog.validate_arguments("not_listed", {"anything": 1}) is None
+
+
+class TestServerRouting:
+    @pytest.fixture
+    def server(self):
+        from n8n_workflow_builder.server import create_n8n_server
+        return create_n8n_server("http://n8n.test", "key")
+
+    async def call(self, server, name, arguments):
+        request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+        return (await server.request_handlers[CallToolRequest](request)).root
+
+    async def test_list_tools_serves_cached_definitions(self, server):
+        handler = server.request_handlers[ListToolsRequest]
+        first = (await handler(ListToolsRequest(method="tools/list"))).root.tools
+        second = (await handler(ListToolsRequest(method="tools/list"))).root.tools
+        assert first[0] is second[0] is get_tool_catalog().tools[0]
+
+    async def test_invalid_arguments_are_an_error_result(self, server):
+        result = await self.call(server, "update_workflow", {})
+        assert result.isError
+        assert result.content[0].text == "Input validation error: 'workflow_id' is a required property"
+        assert server.registry.loaded_handlers() == []
+
+    async def test_unsupported_format_is_an_error_result(self, server):
+        result = await self.call(server, "delete_workflow", {"workflow_id": "wf-1", "format": "json"})
+        assert result.isError
+        assert result.content[0].text.startswith("delete_workflow has no structured output")
+
+    async def test_batch_call_counts_handler_failures_and_unknown_tools(self, server):
+        async def no_prefetch(ids, concurrency=8):
+            for workflow_id in ids:
+                yield workflow_id, None, None
+
+        server.deps.client = MagicMock()
+        server.deps.client.get_workflows_bulk = no_prefetch
+        server.deps.client.get_workflow = AsyncMock(side_effect=RuntimeError("500 Internal Server Error"))
+        calls = [
+            {"tool": "get_workflow_details", "arguments": {"workflow_id": "wf-1"}},
+            {"tool": "no_such_tool"},
+            {"tool": "validate_workflow_json", "arguments": {"workflow": {"name": "x", "nodes": [], "connections": {}}}},
+        ]
+
+        result = await self.call(server, "batch_call", {"calls": calls})
+
+        text = result.content[0].text
+        assert "1 ok, 2 failed" in text
+        assert "Failed to fetch workflow: 500 Internal Server Error" in text
+        assert "Unknown tool: no_such_tool" in text
+        assert "Traceback" not in text
+
+    async def test_valid_call_is_routed(self, server):
+        result = await self.call(server, "validate_workflow_json", {"workflow": {"name": "x", "nodes": [], "connections": {}}})
+        assert not result.isError
+        assert server.registry.loaded_handlers() == ["ValidationTools"]
+
+
+class TestLazyDependencies:
+    def test_built_once_on_first_access(self):
+        factory = MagicMock(return_value="built")
+        deps = make_deps(node_discovery=LazyDependency(factory))
+
+        assert not deps.is_loaded("node_discovery")
+        assert deps.node_discovery == "built"
+        assert deps.node_discovery == "built"
+        factory.assert_called_once()
+        assert deps.is_loaded("node_discovery")
+
+    def test_of_imports_module_lazily(self):
+        sys.modules.pop("n8n_workflow_builder.documentation", None)
+        deps = make_deps(n8n_docs=LazyDependency.of(".documentation", "N8nDocumentation"))
+        assert "n8n_workflow_builder.documentation" not in sys.modules
+
+        assert type(deps.n8n_docs).__name__ == "N8nDocumentation"
+
+    async def test_close_does_not_build_components(self):
+        factory = MagicMock()
+        client = MagicMock()
+        client.close = AsyncMock()
+        deps = make_deps(client=client, rbac_manager=LazyDependency(factory))
+
+        await deps.close()
+        client.close.assert_awaited_once()
+        factory.assert_not_called()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the n8n API resilience middleware.
+"""
+import httpx
+import pytest
+
+from n8n_workflow_builder.resilience import (
+    CircuitOpenError,
+    ResilienceConfig,
+    ResilientTransport,
+    TokenBucket,
+    endpoint_key,
+)
+
+
+def resilient_client(handler, **config) -> tuple[httpx.AsyncClient, ResilientTransport]:
+    defaults = dict(rate_limit_rps=0, backoff_base=0.001, backoff_max=0.01)
+    transport = ResilientTransport(httpx.MockTransport(handler), ResilienceConfig(**{**defaults, **config}))
+    return httpx.AsyncClient(transport=transport), transport
+
+
+def test_endpoint_key_normalizes_ids():
+    assert endpoint_key("get", "/api/v1/workflows/aB3x9") == "GET /api/v1/workflows/{id}"
+    assert endpoint_key("POST", "/api/v1/workflows/aB3x9/activate") == "POST /api/v1/workflows/{id}/activate"
+    assert endpoint_key("GET", "/api/v1/executions") == "GET /api/v1/executions"
+
+
+async def test_retries_429_honoring_retry_after():
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(502),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    client, transport = resilient_client(lambda request: next(responses))
+
+    response = await client.get("http://n8n.test/api/v1/workflows")
+
+    assert response.status_code == 200
+    assert transport.get_stats()["retried"] == 2
+
+
+async def test_retry_after_beyond_backoff_max_is_not_retried_early(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("n8n_workflow_builder.resilience.asyncio.sleep", sleep)
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0.005"}),
+        httpx.Response(429, headers={"Retry-After": "60"}),
+    ])
+    client, transport = resilient_client(lambda request: next(responses))
+
+    response = await client.get("http://n8n.test/api/v1/workflows")
+
+    assert response.status_code == 429
+    assert sleeps[0] >= 0.005
+    assert len(sleeps) == 1
+    assert transport.get_stats()["retried"] == 1
+
+
+async def test_post_is_not_retried_on_502():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502)
+
+    client, transport = resilient_client(handler)
+
+    response = await client.post("http://n8n.test/api/v1/workflows", json={})
+
+    assert response.status_code == 502
+    assert len(calls) == 1
+
+
+async def test_circuit_opens_and_short_circuits():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client, transport = resilient_client(
+        handler, max_retries=0, circuit_failure_threshold=2, circuit_reset_timeout=60
+    )
+
+    await client.get("http://n8n.test/api/v1/workflows/a")
+    await client.get("http://n8n.test/api/v1/workflows/b")
+    with pytest.raises(CircuitOpenError):
+        await client.get("http://n8n.test/api/v1/workflows/c")
+
+    assert len(calls) == 2
+    assert transport.get_stats()["short_circuited"] == 1
+    # Other endpoints are unaffected
+    await client.get("http://n8n.test/api/v1/executions")
+    assert len(calls) == 3
+
+
+async def test_token_bucket_throttles_beyond_burst():
+    bucket = TokenBucket(rate=1000, burst=2)
+
+    waits = [await bucket.acquire() for _ in range(3)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0
@@ -0,0 +1,202 @@
+"""
+Unit tests for the background cache refresh scheduler.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from n8n_workflow_builder.dependencies import Dependencies
+from n8n_workflow_builder.drift.cache import DriftCache
+from n8n_workflow_builder.node_discovery import NodeDiscovery
+from n8n_workflow_builder.scheduler import (
+    BackgroundScheduler, SchedulerConfig, refresh_drift, refresh_node_discovery,
+)
+from n8n_workflow_builder.tools.drift_tools import DriftTools
+
+
+def scheduler(**config) -> BackgroundScheduler:
+    defaults = dict(enabled=True, startup_delay=0, jitter=0, job_timeout=1)
+    return BackgroundScheduler(SchedulerConfig(**{**defaults, **config}))
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+async def test_jobs_run_periodically_and_record_timings():
+    runs = []
+
+    async def job():
+        runs.append(1)
+        return {"refreshed": len(runs)}
+
+    sched = scheduler()
+    sched.add_job("drift", job, interval=0.01)
+    sched.start()
+    try:
+        await wait_for(lambda: len(runs) >= 3)
+    finally:
+        await sched.stop()
+
+    status = sched.status()["jobs"]["drift"]
+    assert status["runs"] >= 3
+    assert status["failures"] == 0
+    assert status["last_duration_ms"] is not None
+    assert status["last_result"]["refreshed"] >= 3
+
+
+async def test_failures_and_timeouts_are_recorded_not_raised():
+    async def broken():
+        raise RuntimeError("n8n unreachable")
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    sched = scheduler(job_timeout=0.01)
+    sched.add_job("template_sync", broken, interval=60)
+    sched.add_job("node_discovery", slow, interval=60)
+
+    assert await sched.run_job("template_sync")
+    assert await sched.run_job("node_discovery")
+
+    jobs = sched.status()["jobs"]
+    assert jobs["template_sync"]["last_error"] == "RuntimeError: n8n unreachable"
+    assert jobs["node_discovery"]["failures"] == 1
+    assert "TimeoutError" in jobs["node_discovery"]["last_error"]
+
+
+async def test_concurrency_limit_serializes_jobs():
+    running, overlap = set(), []
+
+    def make_job(name):
+        async def job():
+            running.add(name)
+            overlap.append(len(running))
+            await asyncio.sleep(0.01)
+            running.discard(name)
+        return job
+
+    sched = scheduler(max_concurrent=1)
+    for name in ("template_sync", "node_discovery", "drift"):
+        sched.add_job(name, make_job(name), interval=60)
+
+    await asyncio.gather(*(sched.run_job(name) for name in sched.jobs))
+
+    assert overlap == [1, 1, 1]
+
+
+async def test_trigger_runs_job_without_started_scheduler():
+    done = asyncio.Event()
+
+    async def job():
+        done.set()
+
+    sched = scheduler(enabled=False)
+    sched.add_job("drift", job)
+    sched.start()
+    sched.trigger("drift")
+
+    await asyncio.wait_for(done.wait(), 1)
+    await sched.stop()
+    assert not sched.started
+
+
+def test_scheduler_is_opt_in(monkeypatch):
+    monkeypatch.delenv("N8N_SCHEDULER", raising=False)
+    assert not SchedulerConfig.from_env().enabled
+
+    monkeypatch.setenv("N8N_SCHEDULER", "on")
+    assert SchedulerConfig.from_env().enabled
+
+
+async def test_node_discovery_refresh_recounts_only_node_types_it_saw(tmp_path):
+    discovery = NodeDiscovery(db_path=str(tmp_path / "nodes.db"))
+    discovery.analyze_workflows([
+        {"nodes": [{"type": "n8n-nodes-base.slack"}, {"type": "n8n-nodes-base.gmail"}]},
+        {"nodes": [{"type": "n8n-nodes-base.slack"}]},
+    ])
+
+    client = MagicMock()
+
+    async def workflows():
+        yield {"id": "wf-1"}
+
+    async def bulk(workflow_ids):
+        for workflow_id in workflow_ids:
+            yield workflow_id, {"id": workflow_id, "nodes": [{"type": "n8n-nodes-base.slack"}]}, None
+
+    client.iter_workflows = MagicMock(side_effect=workflows)
+    client.get_workflows_bulk = MagicMock(side_effect=bulk)
+    deps = Dependencies(
+        client=client, state_manager=MagicMock(), workflow_builder=None, workflow_validator=None,
+        node_discovery=discovery,
+    )
+
+    await refresh_node_discovery(deps)
+    await refresh_node_discovery(deps)
+
+    assert discovery.get_node_info("n8n-nodes-base.slack")["usage_count"] == 1
+    assert discovery.get_node_info("n8n-nodes-base.gmail")["usage_count"] == 1
+    discovery.close()
+
+
+async def test_drift_refresh_warms_detect_workflow_drift():
+    client = MagicMock()
+
+    async def active_workflows(active_only=False):
+        assert active_only
+        yield {"id": "wf-1", "name": "Orders"}
+
+    client.iter_workflows = MagicMock(side_effect=active_workflows)
+    client.get_executions = AsyncMock(return_value=[
+        {"id": str(i), "status": "success", "finished": True,
+         "startedAt": "2024-01-01T00:00:00.000Z", "stoppedAt": "2024-01-01T00:00:01.000Z"}
+        for i in range(10)
+    ])
+    client.get_workflow = AsyncMock(return_value={"id": "wf-1", "name": "Orders", "nodes": []})
+    deps = Dependencies(
+        client=client, state_manager=MagicMock(), workflow_builder=None, workflow_validator=None,
+        drift_cache=DriftCache(),
+    )
+
+    assert await refresh_drift(deps, limit=5) == {"workflows": 1, "insufficient_history": 0}
+    client.get_executions.reset_mock()
+
+    result = await DriftTools(deps).handle("detect_workflow_drift", {"workflow_id": "wf-1"})
+
+    assert "Background analysis" in result[0].text
+    client.get_executions.assert_not_called()
+
+
+async def test_drift_cache_is_keyed_by_lookback_and_absent_without_scheduler(monkeypatch):
+    client = MagicMock()
+
+    async def active_workflows(active_only=False):
+        yield {"id": "wf-1", "name": "Orders"}
+
+    client.iter_workflows = MagicMock(side_effect=active_workflows)
+    client.get_executions = AsyncMock(return_value=[
+        {"id": str(i), "status": "success", "finished": True,
+         "startedAt": "2024-01-01T00:00:00.000Z", "stoppedAt": "2024-01-01T00:00:01.000Z"}
+        for i in range(10)
+    ])
+    client.get_workflow = AsyncMock(return_value={"id": "wf-1", "name": "Orders", "nodes": []})
+    deps = Dependencies(
+        client=client, state_manager=MagicMock(), workflow_builder=None, workflow_validator=None,
+        drift_cache=DriftCache(),
+    )
+    await refresh_drift(deps, limit=5)
+    client.get_executions.reset_mock()
+
+    result = await DriftTools(deps).handle("detect_workflow_drift", {"workflow_id": "wf-1", "lookback_days": 7})
+    assert "Background analysis" not in result[0].text
+    client.get_executions.assert_called_once()
+
+    # With the scheduler off (the default) there is no cache to serve stale results from
+    monkeypatch.delenv("N8N_SCHEDULER", raising=False)
+    from n8n_workflow_builder.server import create_n8n_server
+    server = create_n8n_server("http://n8n.test", "key")
+    assert server.deps.drift_cache is None
+    monkeypatch.setenv("N8N_SCHEDULER", "on")
+    assert isinstance(create_n8n_server("http://n8n.test", "key").deps.drift_cache, DriftCache)
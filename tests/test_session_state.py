@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for per-session state in multi-session (HTTP/SSE) servers
+"""
+import gc
+
+from n8n_workflow_builder.state import SessionStateManagers, StateManager
+
+
+class FakeSession:
+    pass
+
+
+def test_in_memory_state_manager_does_not_write(tmp_path):
+    manager = StateManager(state_file=None)
+    manager.set_current_workflow("wf-1", "Workflow 1")
+
+    assert manager.get_current_workflow()["id"] == "wf-1"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sessions_get_isolated_state():
+    current = {"session": None}
+    default = StateManager(state_file=None)
+    managers = SessionStateManagers(lambda: current["session"], default)
+    session_a, session_b = FakeSession(), FakeSession()
+
+    current["session"] = session_a
+    managers.set_current_workflow("wf-a", "A")
+    current["session"] = session_b
+    managers.set_current_workflow("wf-b", "B")
+
+    current["session"] = session_a
+    assert managers.get_current_workflow()["id"] == "wf-a"
+    current["session"] = session_b
+    assert managers.get_current_workflow()["id"] == "wf-b"
+    assert managers.session_count == 2
+    assert default.get_current_workflow() is None
+
+
+def test_no_session_uses_default_manager():
+    default = StateManager(state_file=None)
+    managers = SessionStateManagers(lambda: None, default)
+
+    managers.set_current_workflow("wf-1", "Workflow 1")
+
+    assert managers.current() is default
+    assert default.get_current_workflow()["id"] == "wf-1"
+    assert managers.session_count == 0
+
+
+def test_session_state_is_dropped_with_session():
+    current = {"session": FakeSession()}
+    managers = SessionStateManagers(lambda: current["session"], StateManager(state_file=None))
+    managers.set_current_workflow("wf-1", "Workflow 1")
+    assert managers.session_count == 1
+
+    current["session"] = None
+    gc.collect()
+
+    assert managers.session_count == 0
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the journaled StateManager (append log, batched flush, compaction)
+"""
+import json
+
+import pytest
+
+from n8n_workflow_builder.state import StateManager
+
+
+@pytest.fixture
+def manager():
+    """Factory for managers whose writer threads are stopped when the test ends"""
+    opened = []
+
+    def open_manager(path, **kwargs) -> StateManager:
+        # A long interval keeps the writer thread out of the way; tests flush explicitly
+        opened.append(StateManager(state_file=path, flush_interval=60, **kwargs))
+        return opened[-1]
+
+    yield open_manager
+    for state in opened:
+        state.close()
+
+
+def test_mutations_do_not_write_synchronously(tmp_path, manager):
+    state = manager(tmp_path / "state.json")
+    state.log_action("list_workflows")
+
+    assert list(tmp_path.iterdir()) == []
+
+    state.flush()
+    assert (tmp_path / "state.json.journal").read_text().count("\n") == 1
+    state.close()
+
+
+def test_journal_is_replayed_on_load(tmp_path, manager):
+    state = manager(tmp_path / "state.json")
+    state.set_current_workflow("wf-1", "Orders")
+    state.set_last_execution("exec-9")
+    for i in range(3):
+        state.log_action("get_workflow", {"n": i})
+    state.flush()
+
+    reloaded = manager(tmp_path / "state.json")
+
+    assert reloaded.get_current_workflow() == {"id": "wf-1", "name": "Orders"}
+    assert reloaded.get_last_execution() == "exec-9"
+    assert [entry["details"]["n"] for entry in reloaded.get_session_history()] == [0, 1, 2]
+
+
+def test_compaction_writes_snapshot_and_truncates_journal(tmp_path, manager):
+    state = manager(tmp_path / "state.json", compact_after=5)
+    for i in range(60):
+        state.log_action("get_workflow", {"n": i})
+    state.flush()
+
+    snapshot = json.loads((tmp_path / "state.json").read_text())
+    assert snapshot["journal_seq"] == 60
+    assert (tmp_path / "state.json.journal").read_text() == ""
+    history = manager(tmp_path / "state.json").get_session_history(limit=50)
+    assert [entry["details"]["n"] for entry in history] == list(range(10, 60))
+
+
+def test_crash_before_journal_truncation_does_not_duplicate(tmp_path, manager):
+    state = manager(tmp_path / "state.json")
+    state.log_action("a")
+    state.log_action("b")
+    state.flush()
+    journal = (tmp_path / "state.json.journal").read_text()
+    state.compact()
+    # Simulate a crash after the snapshot was swapped in but before truncation
+    (tmp_path / "state.json.journal").write_text(journal)
+
+    reloaded = manager(tmp_path / "state.json")
+
+    assert [entry["action"] for entry in reloaded.get_session_history()] == ["a", "b"]
+
+
+def test_torn_last_record_is_ignored(tmp_path, manager):
+    state = manager(tmp_path / "state.json")
+    state.log_action("a")
+    state.flush()
+    with open(tmp_path / "state.json.journal", "a") as f:
+        f.write('{"op":"action","at":"2024-01-01T00:00:00","seq":2,"entry":{"act')
+
+    reloaded = manager(tmp_path / "state.json")
+
+    assert [entry["action"] for entry in reloaded.get_session_history()] == ["a"]
+
+
+def test_appending_after_torn_record_keeps_later_records(tmp_path, manager):
+    state = manager(tmp_path / "state.json")
+    state.log_action("a")
+    state.flush()
+    # Simulate a crash mid-append
+    with open(tmp_path / "state.json.journal", "a") as f:
+        f.write('{"op":"action","at":"2024-01-01T00:00:00","seq":2,"entry":{"act')
+
+    restarted = manager(tmp_path / "state.json")
+    restarted.log_action("b")
+    restarted.log_action("c")
+    restarted.flush()
+
+    reloaded = manager(tmp_path / "state.json")
+
+    assert [entry["action"] for entry in reloaded.get_session_history()] == ["a", "b", "c"]
+    assert all(json.loads(line) for line in (tmp_path / "state.json.journal").read_text().splitlines())
+
+
+def test_legacy_snapshot_and_clear(tmp_path, manager):
+    legacy = StateManager(state_file=None)._default_state()
+    legacy.update(current_workflow_id="wf-1", current_workflow_name="Legacy")
+    (tmp_path / "state.json").write_text(json.dumps(legacy, indent=2))
+
+    state = manager(tmp_path / "state.json")
+    assert state.get_current_workflow()["name"] == "Legacy"
+    state.clear_state()
+    state.close()
+
+    assert manager(tmp_path / "state.json").get_current_workflow() is None
@@ -0,0 +1,136 @@
+"""
+Unit tests for cross-process storage coordination (file locks, SQLite settings, reloads).
+"""
+import asyncio
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from n8n_workflow_builder.node_discovery import NodeDiscovery
+from n8n_workflow_builder.state import StateManager
+from n8n_workflow_builder.storage import async_file_lock, connect_sqlite, file_lock
+
+
+@pytest.fixture
+def state():
+    """Factory for managers whose writer threads are stopped when the test ends"""
+    opened = []
+
+    def open_manager(path, **kwargs) -> StateManager:
+        opened.append(StateManager(state_file=path, flush_interval=60, **kwargs))
+        return opened[-1]
+
+    yield open_manager
+    for manager in opened:
+        manager.close()
+
+
+def workflow(*node_types):
+    return {"nodes": [{"type": node_type, "name": node_type, "parameters": {}} for node_type in node_types]}
+
+
+def test_file_lock_excludes_other_holders(tmp_path):
+    with file_lock(tmp_path / "state.json"):
+        with pytest.raises(BlockingIOError):
+            with file_lock(tmp_path / "state.json", blocking=False):
+                pass
+    with file_lock(tmp_path / "state.json", shared=True), file_lock(tmp_path / "state.json", shared=True, blocking=False):
+        pass
+
+
+async def test_async_file_lock_waits_for_holder(tmp_path):
+    order = []
+
+    async def holder():
+        async with async_file_lock(tmp_path / "cache.db"):
+            order.append("held")
+            await asyncio.sleep(0.05)
+            order.append("released")
+
+    async def waiter():
+        await asyncio.sleep(0.01)
+        async with async_file_lock(tmp_path / "cache.db", poll_interval=0.01):
+            order.append("acquired")
+
+    await asyncio.gather(holder(), waiter())
+
+    assert order == ["held", "released", "acquired"]
+
+
+def test_sqlite_connections_wait_for_writers(tmp_path, monkeypatch):
+    monkeypatch.setenv("N8N_SQLITE_BUSY_TIMEOUT", "1234")
+    conn = connect_sqlite(tmp_path / "shared.db")
+
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_state_managers_sharing_a_file_do_not_lose_records(tmp_path, state):
+    first, second = state(tmp_path / "state.json"), state(tmp_path / "state.json")
+    first.log_action("first-1")
+    second.log_action("second-1")
+    first.flush()
+    second.flush()
+    first.log_action("first-2")
+    first.close()
+    second.flush()
+
+    expected = ["first-1", "second-1", "first-2"]
+    assert [entry["action"] for entry in second.get_session_history()] == expected
+    assert [entry["action"] for entry in state(tmp_path / "state.json").get_session_history()] == expected
+    assert second.stats["reloads"] == 2
+
+
+def test_current_workflow_stays_per_process(tmp_path, state):
+    first, second = state(tmp_path / "state.json"), state(tmp_path / "state.json")
+    first.set_current_workflow("wf-a", "Editor A")
+    first.set_last_execution("ex-a")
+    first.flush()
+    second.set_current_workflow("wf-b", "Editor B")
+    second.flush()
+    first.flush()
+
+    assert first.get_current_workflow() == {"id": "wf-a", "name": "Editor A"}
+    assert first.get_last_execution() == "ex-a"
+    assert second.get_current_workflow() == {"id": "wf-b", "name": "Editor B"}
+    assert second.get_last_execution() is None
+    # Recently used workflows are shared
+    assert [w["id"] for w in first.get_recent_workflows()] == ["wf-b", "wf-a"]
+    assert first.stats["reloads"] == 1
+
+
+def test_concurrent_processes_append_to_one_state(tmp_path, state):
+    script = textwrap.dedent(f"""
+        import sys
+        from n8n_workflow_builder.state import StateManager
+        state = StateManager(state_file={str(tmp_path / "state.json")!r}, flush_interval=0.001, compact_after=7)
+        for i in range(10):
+            state.log_action("run", {{"worker": sys.argv[1], "n": i}})
+            if i % 3 == 0:
+                state.flush()
+        state.close()
+    """)
+    workers = [subprocess.Popen([sys.executable, "-c", script, str(w)]) for w in range(4)]
+    assert [worker.wait(timeout=30) for worker in workers] == [0, 0, 0, 0]
+
+    history = state(tmp_path / "state.json").get_session_history(limit=50)
+
+    assert sorted((e["details"]["worker"], e["details"]["n"]) for e in history) == [
+        (str(w), n) for w in range(4) for n in range(10)
+    ]
+
+
+def test_node_discovery_reuses_and_merges_other_processes_knowledge(tmp_path):
+    first = NodeDiscovery(db_path=str(tmp_path / "nodes.db"))
+    second = NodeDiscovery(db_path=str(tmp_path / "nodes.db"))
+
+    first.analyze_workflows([workflow("n8n-nodes-base.slack")])
+    assert [match["type"] for match in second.search_nodes("slack")] == ["n8n-nodes-base.slack"]
+
+    second.analyze_workflows([workflow("n8n-nodes-base.slack", "n8n-nodes-base.gmail")])
+
+    assert first.get_node_info("n8n-nodes-base.slack")["usage_count"] == 2
+    assert first.get_node_info("n8n-nodes-base.gmail")["category"] == "notification"
+    assert not first.refresh()
@@ -0,0 +1,88 @@
+"""
+Unit tests for tracing spans, the trace file and the Prometheus exporter.
+"""
+import json
+
+import httpx
+import pytest
+
+from n8n_workflow_builder.analyzer_executor import AnalyzerExecutor, AnalyzerExecutorConfig
+from n8n_workflow_builder.metrics import MetricsTransport, RequestMetrics
+from n8n_workflow_builder.tracing import TOOL, Tracer
+
+
+def test_nested_spans_share_trace_and_link_parents(tmp_path):
+    tracer = Tracer(trace_file=tmp_path / "trace.jsonl")
+    with tracer.span("list_workflows", TOOL):
+        with tracer.span("validation"):
+            pass
+    tracer.flush()
+
+    child, parent = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+    assert parent["name"] == "list_workflows" and parent["parent_id"] is None
+    assert child["parent_id"] == parent["span_id"]
+    assert child["trace_id"] == parent["trace_id"]
+
+
+def test_failed_spans_count_as_errors():
+    tracer = Tracer()
+    with pytest.raises(RuntimeError):
+        with tracer.span("get_workflow", TOOL):
+            raise RuntimeError("boom")
+    with tracer.span("get_workflow", TOOL):
+        pass
+
+    stats = tracer.snapshot()["spans"]["tool:get_workflow"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+
+
+def test_prometheus_text_has_counters_and_cumulative_buckets():
+    tracer = Tracer()
+    for _ in range(3):
+        with tracer.span("list_workflows", TOOL):
+            pass
+    with tracer.span("fts_search"):
+        pass
+
+    text = tracer.prometheus_text()
+    assert 'n8n_tool_calls_total{tool="list_workflows"} 3' in text
+    assert 'n8n_tool_errors_total{tool="list_workflows"} 0' in text
+    assert 'n8n_tool_duration_ms_bucket{tool="list_workflows",le="+Inf"} 3' in text
+    assert 'n8n_span_calls_total{kind="stage",name="fts_search"} 1' in text
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+               if line.startswith('n8n_tool_duration_ms_bucket{tool="list_workflows"')]
+    assert buckets == sorted(buckets)
+
+
+async def test_client_requests_are_child_spans():
+    tracer = Tracer()
+    transport = MetricsTransport(
+        httpx.MockTransport(lambda request: httpx.Response(500)), RequestMetrics(), tracer
+    )
+    async with httpx.AsyncClient(transport=transport, base_url="http://n8n.test") as client:
+        with tracer.span("get_workflow", TOOL):
+            await client.get("/api/v1/workflows/42")
+
+    stats = tracer.snapshot("client")["spans"]["client:GET /api/v1/workflows/{id}"]
+    assert stats["calls"] == 1
+    assert stats["errors"] == 1
+
+
+async def test_spans_in_analyzer_threads_keep_their_parent(tmp_path):
+    tracer = Tracer(trace_file=tmp_path / "trace.jsonl")
+    executor = AnalyzerExecutor(AnalyzerExecutorConfig(mode="thread", max_workers=2))
+
+    def analyze():
+        with tracer.span("semantic_analysis"):
+            return "done"
+
+    try:
+        with tracer.span("analyze_workflow_semantics", TOOL):
+            assert await executor.run(analyze) == "done"
+    finally:
+        executor.shutdown()
+    tracer.flush()
+
+    spans = {span["name"]: span for span in map(json.loads, (tmp_path / "trace.jsonl").read_text().splitlines())}
+    assert spans["semantic_analysis"]["parent_id"] == spans["analyze_workflow_semantics"]["span_id"]
@@ -19,6 +19,15 @@ def mock_n8n_client():
     client.activate_workflow = AsyncMock(return_value={"active": True})
     client.deactivate_workflow = AsyncMock(return_value={"active": False})
     client.get_executions = AsyncMock(return_value=[{"id": "exec-1", "finished": True, "workflowData": {"name": "Test"}}])
+
+    async def workflow_pages(*args, **kwargs):
+        yield await client.get_workflows(), None
+
+    async def execution_pages(*args, **kwargs):
+        yield await client.get_executions(), None
+
+    client.iter_workflow_pages = MagicMock(side_effect=workflow_pages)
+    client.iter_execution_pages = MagicMock(side_effect=execution_pages)
     return client
 
 
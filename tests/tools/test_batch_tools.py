@@ -0,0 +1,70 @@
+"""
+Unit tests for the batch_call meta-tool.
+"""
+import asyncio
+
+import pytest
+from mcp.types import TextContent
+
+from n8n_workflow_builder.tools.base import ToolError
+from n8n_workflow_builder.tools.batch_tools import BatchTools
+
+
+class TestBatchTools:
+    """Test suite for BatchTools handler."""
+
+    @pytest.fixture
+    def fetched_ids(self, deps):
+        fetched = []
+
+        async def get_workflows_bulk(ids, concurrency=8):
+            for workflow_id in dict.fromkeys(ids):
+                fetched.append(workflow_id)
+                yield workflow_id, {"id": workflow_id}, None
+
+        deps.client.get_workflows_bulk = get_workflows_bulk
+        return fetched
+
+    async def test_runs_calls_concurrently_within_the_limit(self, deps, fetched_ids):
+        running = 0
+        peak = 0
+
+        async def dispatch(name, arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [TextContent(type="text", text=f"{name}:{arguments['workflow_id']}")]
+
+        deps.tool_dispatcher = dispatch
+        calls = [{"tool": "get_workflow_details", "arguments": {"workflow_id": f"wf-{i % 3}"}} for i in range(9)]
+        result = await BatchTools(deps).handle("batch_call", {"calls": calls, "max_concurrency": 2})
+
+        assert peak == 2
+        text = result[0].text
+        assert "9 ok, 0 failed" in text
+        # Results keep the order of the calls
+        assert text.index("wf-0") < text.index("wf-1") < text.index("wf-2")
+        # Each referenced workflow is prefetched once
+        assert fetched_ids == ["wf-0", "wf-1", "wf-2"]
+
+    async def test_failures_do_not_abort_the_batch(self, deps, fetched_ids):
+        async def dispatch(name, arguments):
+            if name == "broken":
+                raise ValueError("Input validation error: 'workflow_id' is a required property")
+            return [TextContent(type="text", text="fine")]
+
+        deps.tool_dispatcher = dispatch
+        calls = [{"tool": "broken"}, {"tool": "fine"}, {"tool": "batch_call", "arguments": {"calls": []}}]
+        result = await BatchTools(deps).handle("batch_call", {"calls": calls})
+
+        text = result[0].text
+        assert "1 ok, 2 failed" in text
+        assert "'workflow_id' is a required property" in text
+        assert "Nested batch_call is not allowed" in text
+
+    async def test_rejects_oversized_batches(self, deps):
+        deps.tool_dispatcher = lambda name, arguments: None
+        with pytest.raises(ToolError):
+            await BatchTools(deps).handle("batch_call", {"calls": [{"tool": "x"}] * 51})
@@ -0,0 +1,112 @@
+"""
+Unit tests for the machine-readable (format: json) tool output mode.
+"""
+import json
+
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import TextContent, Tool
+
+from n8n_workflow_builder.tools.base import BaseTool, ToolError
+from n8n_workflow_builder.tools.catalog import JSON_OUTPUT_TOOLS, build_catalog, get_tool_catalog
+from n8n_workflow_builder.tools.pagination import PageRequest, paginate
+from n8n_workflow_builder.tools.registry import ToolRegistry, _spec
+
+
+class NativeJsonTools(BaseTool):
+    """Handler with its own JSON format next to a ToolResult-returning tool"""
+
+    async def handle(self, name, arguments):
+        if name == "native_json":
+            return [TextContent(type="text", text='{"data": [1, 2], "score": 90}')]
+        return self._notice(arguments, "Nothing to report")
+
+
+def native_json_registry() -> ToolRegistry:
+    spec = _spec(".workflow_tools", "NativeJsonTools", "native_json", "notice")
+    output_format = {"type": "string", "enum": ["markdown", "json"]}
+    catalog = build_catalog([
+        Tool(name="native_json", inputSchema={"type": "object", "properties": {"format": output_format}}),
+        Tool(name="notice", inputSchema={"type": "object", "properties": {"format": output_format}}),
+    ])
+    registry = ToolRegistry(MagicMock(), specs=(spec,), catalog=catalog)
+    registry._handlers[spec] = NativeJsonTools(registry.deps)
+    return registry
+
+
+class TestOutputFormat:
+    """Test suite for JSON ToolResult output."""
+
+    def test_only_structured_tools_advertise_json(self):
+        catalog = get_tool_catalog()
+
+        assert JSON_OUTPUT_TOOLS <= catalog.names()
+        for name in JSON_OUTPUT_TOOLS | {"audit_workflow_security", "explain_workflow", "get_tool_metrics"}:
+            assert catalog.supports_json(name), name
+        assert not catalog.supports_json("delete_workflow")
+        assert "format" not in next(t for t in catalog.tools if t.name == "delete_workflow").inputSchema["properties"]
+
+    def test_format_without_json_enum_is_not_json_capable(self):
+        catalog = build_catalog([
+            Tool(name="free_format", inputSchema={"type": "object", "properties": {"format": {"type": "string"}}}),
+        ])
+
+        assert not catalog.supports_json("free_format")
+
+    async def test_native_json_is_passed_through_unchanged(self):
+        result = await native_json_registry().dispatch("native_json", {"format": "json"})
+
+        assert json.loads(result[0].text) == {"data": [1, 2], "score": 90}
+
+    async def test_notice_becomes_tool_result_message(self):
+        registry = native_json_registry()
+
+        as_json = json.loads((await registry.dispatch("notice", {"format": "json"}))[0].text)
+        as_markdown = (await registry.dispatch("notice", {}))[0].text
+
+        assert as_json == {"data": None, "metadata": {"message": "Nothing to report"}}
+        assert as_markdown == "Nothing to report"
+
+    def test_json_page_carries_next_cursor(self):
+        request = PageRequest.from_arguments("search_nodes", {"page_size": 2, "format": "json"})
+
+        result = json.loads(paginate(request, [{"n": i} for i in range(5)], str, metadata={"total": 5}))
+
+        assert result["data"] == [{"n": 0}, {"n": 1}]
+        assert result["metadata"]["total"] == 5
+        assert result["metadata"]["count"] == 2
+        follow_up = PageRequest.from_arguments(
+            "search_nodes", {"page_size": 2, "format": "json", "cursor": result["metadata"]["next_cursor"]}
+        )
+        assert follow_up.offset == 2
+
+    async def test_list_workflows_json_is_compact(self, deps):
+        result = await ToolRegistry(deps).dispatch("list_workflows", {"format": "json"})
+
+        text = result[0].text
+        assert "\n" not in text
+        payload = json.loads(text)
+        assert payload["data"] == [
+            {"id": "wf-1", "name": "Workflow 1", "active": True, "nodes": 0, "updatedAt": "2024-01-01"}
+        ]
+        assert payload["metadata"]["next_cursor"] is None
+
+    async def test_markdown_only_handler_refuses_json(self, deps):
+        with pytest.raises(ToolError) as raised:
+            await ToolRegistry(deps).dispatch("delete_workflow", {"workflow_id": "wf-1", "format": "json"})
+
+        assert raised.value.error_type == "UNSUPPORTED_FORMAT"
+        deps.client.delete_workflow.assert_not_called()
+
+    async def test_workflow_details_json_is_the_workflow(self, deps):
+        result = await ToolRegistry(deps).dispatch("get_workflow_details", {"workflow_id": "wf-1", "format": "json"})
+
+        payload = json.loads(result[0].text)
+        assert payload["data"] == {"id": "wf-1", "name": "Test", "active": True, "nodes": [], "connections": {}}
+        deps.state_manager.log_action.assert_called_once()
+
+    async def test_markdown_is_default(self, deps):
+        result = await ToolRegistry(deps).dispatch("list_workflows", {})
+
+        assert result[0].text.startswith("#")
@@ -0,0 +1,108 @@
+"""
+Unit tests for the paginated tool output contract.
+"""
+import json
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from n8n_workflow_builder.changes import ApprovalWorkflow
+from n8n_workflow_builder.tools.base import ToolError
+from n8n_workflow_builder.tools.miscellaneous_tools import MiscellaneousTools
+from n8n_workflow_builder.tools.pagination import PageRequest, paginate
+from n8n_workflow_builder.tools.workflow_tools import WorkflowTools
+
+
+def next_cursor(text: str):
+    match = re.search(r'cursor: "([^"]+)"', text)
+    return match.group(1) if match else None
+
+
+class TestPagination:
+    """Test suite for cursors, page sizes and byte budgets."""
+
+    def test_pages_through_list_with_cursor(self):
+        items = [f"item-{i}" for i in range(7)]
+        seen, arguments = [], {"page_size": 3}
+        while True:
+            request = PageRequest.from_arguments("search_nodes", arguments)
+            text = paginate(request, items, lambda item: f"{item}\n")
+            seen += re.findall(r"^item-\d+$", text, re.MULTILINE)
+            cursor = next_cursor(text)
+            if cursor is None:
+                break
+            arguments = {"page_size": 3, "cursor": cursor}
+
+        assert seen == items
+
+    def test_byte_budget_stops_page_early(self):
+        items = ["x" * 600 for _ in range(10)]
+        request = PageRequest.from_arguments("search_nodes", {"max_bytes": 1500, "page_size": 10})
+
+        text = paginate(request, items, lambda item: item + "\n")
+
+        assert text.count("x" * 600) == 2
+        assert "size budget" in text
+        assert next_cursor(text) is not None
+
+    def test_token_budget_converts_to_bytes(self):
+        request = PageRequest.from_arguments("search_nodes", {"max_tokens": 500})
+        assert request.max_bytes == 2000
+
+    def test_cursor_is_bound_to_its_query(self):
+        request = PageRequest.from_arguments("search_nodes", {"query": "slack"}, query_keys=("query",))
+        cursor = request.cursor_for(10)
+
+        with pytest.raises(ToolError, match="INVALID_CURSOR"):
+            PageRequest.from_arguments("search_nodes", {"query": "google", "cursor": cursor}, query_keys=("query",))
+
+    def test_malformed_cursor_is_rejected(self):
+        with pytest.raises(ToolError, match="INVALID_CURSOR"):
+            PageRequest.from_arguments("search_nodes", {"cursor": "not-a-cursor"})
+
+    async def test_list_workflows_resumes_from_upstream_cursor(self, deps):
+        pages = {
+            None: ([{"id": f"wf-{i}", "name": f"Workflow {i}"} for i in range(3)], "page-2"),
+            "page-2": ([{"id": f"wf-{i}", "name": f"Workflow {i}"} for i in range(3, 5)], None),
+        }
+        requested = []
+
+        async def workflow_pages(active_only=False, page_size=50, tags=None, cursor=None):
+            requested.append(cursor)
+            while True:
+                items, cursor = pages[cursor]
+                yield items, cursor
+                if cursor is None:
+                    return
+
+        deps.client.iter_workflow_pages = MagicMock(side_effect=workflow_pages)
+        tools = WorkflowTools(deps)
+
+        first = (await tools.handle("list_workflows", {"page_size": 2}))[0].text
+        second = (await tools.handle("list_workflows", {"page_size": 2, "cursor": next_cursor(first)}))[0].text
+        third = (await tools.handle("list_workflows", {"page_size": 2, "cursor": next_cursor(second)}))[0].text
+
+        assert re.findall(r"`(wf-\d)`", first + second + third) == [f"wf-{i}" for i in range(5)]
+        assert next_cursor(third) is None
+        # Follow-up pages start at the upstream page holding the next workflow
+        assert requested == [None, None, "page-2"]
+
+    async def test_change_history_pages_newest_first(self, deps):
+        deps.approval_workflow = ApprovalWorkflow(db_path=":memory:")
+        for i in range(5):
+            deps.approval_workflow.create_request("wf-1", "Orders", {}, f"change {i}", "dev")
+        tools = MiscellaneousTools(deps)
+
+        first = (await tools.handle("get_change_history", {"workflow_id": "wf-1", "page_size": 3}))[0].text
+        second = (await tools.handle(
+            "get_change_history", {"workflow_id": "wf-1", "page_size": 3, "cursor": next_cursor(first)}
+        ))[0].text
+
+        assert "**Total Requests**: 5" in first
+        assert re.findall(r"Reason\*\*: (change \d)", first + second) == [f"change {i}" for i in range(4, -1, -1)]
+        assert next_cursor(second) is None
+
+        payload = json.loads((await tools.handle("get_change_history", {"workflow_id": "wf-1", "format": "json"}))[0].text)
+        assert payload["metadata"]["status_counts"] == {"pending": 5}
+        assert len(payload["data"]) == 5
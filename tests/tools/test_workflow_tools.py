@@ -36,7 +36,7 @@ class TestWorkflowTools:
         assert len(result) == 1
         assert result[0].type == "text"
         assert "Workflow 1" in result[0].text
-        mock_n8n_client.get_workflows.assert_called_once()
+        mock_n8n_client.iter_workflow_pages.assert_called_once()
     
     async def test_create_workflow(self, workflow_tools, mock_n8n_client):
         """Test create_workflow."""